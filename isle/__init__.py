@@ -3,9 +3,28 @@ import os
 
 from .objects import *
 from ._api import *
+from ._requests import *
+from ._cache import *
+from ._registry import *
+from ._identity import *
+from ._locale import *
+from ._sync import *
+from ._catalog import *
+from ._dump import *
 
 
-__all__ = _api.__all__ + objects.__all__  # pylint: disable=E0602
+__all__ = (
+    _api.__all__
+    + objects.__all__
+    + _requests.__all__
+    + _cache.__all__
+    + _registry.__all__
+    + _identity.__all__
+    + _locale.__all__
+    + _sync.__all__
+    + _catalog.__all__
+    + _dump.__all__
+)  # pylint: disable=E0602
 
 
 TMDB_API_KEY = os.environ.get("TMDB_API_KEY", None)
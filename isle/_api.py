@@ -1,7 +1,10 @@
+import json
 import os
 from collections import defaultdict
-from urllib.parse import urljoin
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urlencode, urljoin
 
+from . import _requests
 from . import _urls as URL
 from ._config import tmdb_api_key
 from ._requests import GET, GET_pages
@@ -29,6 +32,7 @@ __all__ = [
     "discover_movies",
     "discover_shows",
     "find",
+    "find_many",
     "get_movie_certifications",
     "get_show_certifications",
     "get_movie_genres",
@@ -39,10 +43,11 @@ __all__ = [
     "get_languages",
     "get_primary_translations",
     "get_timezones",
+    "hydrate",
 ]
 
 
-def search_movie(query: str, **kwargs):
+def search_movie(query: str, *, prefetch: int = 0, **kwargs):
     """Search for movies.
 
     The `query` argument is a text query to search (required).
@@ -61,14 +66,20 @@ def search_movie(query: str, **kwargs):
     The optional `region` argument specifies a ISO 3166-1 code
     to filter release dates. Must be uppercase.
 
-    Returns a generator. Each item is a `Movie` object.
+    The optional `prefetch` argument is the number of upcoming
+    pages to request concurrently in the background. (Default: 0)
+
+    Returns a generator with `total_pages` and `total_results`
+    attributes, read from the first page. Each item is a
+    `Movie` object.
     """
     params = {"query": query, "api_key": tmdb_api_key(), **kwargs}
-    for item in GET_pages(URL.SEARCH_MOVIE, params):
-        yield Movie(item["id"], **item)
+    return GET_pages(
+        URL.SEARCH_MOVIE, params, prefetch, _shared(Movie, params)
+    )
 
 
-def search_show(query: str, **kwargs):
+def search_show(query: str, *, prefetch: int = 0, **kwargs):
     """Search for TV shows.
 
     The `query` argument is a text query to search (required).
@@ -80,14 +91,18 @@ def search_show(query: str, **kwargs):
     The optional `first_air_date_year` argument specifies
     the year when the show was first aired.
 
-    Returns a generator. Each item is a `Show` object.
+    The optional `prefetch` argument is the number of upcoming
+    pages to request concurrently in the background. (Default: 0)
+
+    Returns a generator with `total_pages` and `total_results`
+    attributes, read from the first page. Each item is a
+    `Show` object.
     """
     params = {"query": query, "api_key": tmdb_api_key(), **kwargs}
-    for item in GET_pages(URL.SEARCH_SHOW, params):
-        yield Show(item["id"], **item)
+    return GET_pages(URL.SEARCH_SHOW, params, prefetch, _shared(Show, params))
 
 
-def search_person(query: str, **kwargs):
+def search_person(query: str, *, prefetch: int = 0, **kwargs):
     """Search for people.
 
     The `query` argument is a text query to search (required).
@@ -103,72 +118,97 @@ def search_person(query: str, **kwargs):
     The optional `region` argument specifies a ISO 3166-1 code
     to filter release dates. Must be uppercase.
 
-    Returns a generator. Each item is a `Person` object.
+    The optional `prefetch` argument is the number of upcoming
+    pages to request concurrently in the background. (Default: 0)
+
+    Returns a generator with `total_pages` and `total_results`
+    attributes, read from the first page. Each item is a
+    `Person` object.
     """
     params = {"query": query, "api_key": tmdb_api_key(), **kwargs}
-    for item in GET_pages(URL.SEARCH_PERSON, params):
-        yield Person(item["id"], **item)
+    return GET_pages(
+        URL.SEARCH_PERSON, params, prefetch, _shared(Person, params)
+    )
 
 
-def search_company(query: str, **kwargs):
+def search_company(query: str, *, prefetch: int = 0, **kwargs):
     """Search for companies.
 
     The `query` argument is a text query to search (required).
 
-    Returns a generator. Each item is a `Company` object.
+    The optional `prefetch` argument is the number of upcoming
+    pages to request concurrently in the background. (Default: 0)
+
+    Returns a generator with `total_pages` and `total_results`
+    attributes, read from the first page. Each item is a
+    `Company` object.
     """
     params = {"query": query, "api_key": tmdb_api_key(), **kwargs}
-    for item in GET_pages(URL.SEARCH_COMPANY, params):
-        yield Company(item["id"], **item)
+    return GET_pages(
+        URL.SEARCH_COMPANY, params, prefetch, _shared(Company, params)
+    )
 
 
-def search_keyword(query: str, **kwargs):
+def search_keyword(query: str, *, prefetch: int = 0, **kwargs):
     """Search for keywords.
 
     The `query` argument is a text query to search (required).
 
-    Returns a generator. Each item is a `Keyword` object.
+    The optional `prefetch` argument is the number of upcoming
+    pages to request concurrently in the background. (Default: 0)
+
+    Returns a generator with `total_pages` and `total_results`
+    attributes, read from the first page. Each item is a
+    `Keyword` object.
     """
     params = {"query": query, "api_key": tmdb_api_key(), **kwargs}
-    for item in GET_pages(URL.SEARCH_KEYWORD, params):
-        yield Keyword(item["id"], **item)
+    return GET_pages(
+        URL.SEARCH_KEYWORD, params, prefetch, _shared(Keyword, params)
+    )
 
 
-def multi_search(query: str, **kwargs):
+def multi_search(query: str, *, prefetch: int = 0, **kwargs):
     """Search for movies, TV shows and people in a single request.
 
     The `query` argument is a text query to search (required).
 
-    Returns a generator. Each element is either a `Movie`, or a
-    `Show`, or a `Person` object.
+    The optional `prefetch` argument is the number of upcoming
+    pages to request concurrently in the background. (Default: 0)
+
+    Returns a generator with `total_pages` and `total_results`
+    attributes, read from the first page. Each element is either
+    a `Movie`, or a `Show`, or a `Person` object.
     """
     params = {"query": query, "api_key": tmdb_api_key(), **kwargs}
-    for item in GET_pages(URL.MULTI_SEARCH, params):
-        if item["media_type"] == "tv":
-            yield Show(item["id"], **item)
-        elif item["media_type"] == "movie":
-            yield Movie(item["id"], **item)
-        elif item["media_type"] == "person":
-            yield Person(item["id"], **item)
-        else:
-            raise RuntimeError(f"Unknown media type {item['media_type']}")
+    return GET_pages(
+        URL.MULTI_SEARCH,
+        params,
+        prefetch,
+        _media({"tv": Show, "movie": Movie, "person": Person}, params),
+    )
 
 
-def discover_movies(options: dict):
+def discover_movies(options: dict, *, prefetch: int = 0):
     """Discover movies by different types of data like
     average rating, number of votes, genres and certifications.
 
     See available options:
     https://developers.themoviedb.org/3/discover/movie-discover
 
-    Returns a generator. Each item is a `Movie` object.
+    The optional `prefetch` argument is the number of upcoming
+    pages to request concurrently in the background. (Default: 0)
+
+    Returns a generator with `total_pages` and `total_results`
+    attributes, read from the first page. Each item is a
+    `Movie` object.
     """
     params = {"api_key": tmdb_api_key(), **options}
-    for item in GET_pages(URL.DISCOVER_MOVIES, params):
-        yield Movie(item["id"], **item)
+    return GET_pages(
+        URL.DISCOVER_MOVIES, params, prefetch, _shared(Movie, params)
+    )
 
 
-def discover_shows(options: dict):
+def discover_shows(options: dict, *, prefetch: int = 0):
     """Discover TV shows by different types of data like
     average rating, number of votes, genres, the network
     they aired on and air dates.
@@ -176,11 +216,36 @@ def discover_shows(options: dict):
     See available options:
     https://developers.themoviedb.org/3/discover/tv-discover
 
-    Returns a generator. Each item is a `Show` object.
+    The optional `prefetch` argument is the number of upcoming
+    pages to request concurrently in the background. (Default: 0)
+
+    Returns a generator with `total_pages` and `total_results`
+    attributes, read from the first page. Each item is a
+    `Show` object.
     """
     params = {"api_key": tmdb_api_key(), **options}
-    for item in GET_pages(URL.DISCOVER_SHOWS, params):
-        yield Show(item["id"], **item)
+    return GET_pages(
+        URL.DISCOVER_SHOWS, params, prefetch, _shared(Show, params)
+    )
+
+
+def _shared(Obj, params):
+    """Return a function which builds an `Obj` from a result."""
+    language = params.get("language")
+    return lambda item: Obj._shared(item["id"], item, language)
+
+
+def _media(types, params):
+    """Return a function which builds an object of the type in
+    `types` for the `media_type` of a result."""
+    language = params.get("language")
+
+    def _item(item):
+        if item["media_type"] not in types:
+            raise RuntimeError(f"Unknown media type {item['media_type']}")
+        return types[item["media_type"]]._shared(item["id"], item, language)
+
+    return _item
 
 
 def find(external_id: str, *, src: str, **options):
@@ -194,37 +259,126 @@ def find(external_id: str, *, src: str, **options):
     """
     params = {"api_key": tmdb_api_key(), "external_source": src, **options}
     response = GET(URL.FIND.format(external_id=external_id), **params)
+    return _find_results(
+        response, Movie, Show, Person, Season, Episode, params.get("language")
+    )
+
+
+def _find_results(response, Movie, Show, Person, Season, Episode, language):
     acc = {}
     for key, results in response.items():
         if key == "movie_results":
-            acc[key] = [Movie(x["id"], **x) for x in results]
+            acc[key] = [Movie._shared(x["id"], x, language) for x in results]
         elif key == "person_results":
-            acc[key] = [Person(x["id"], **x) for x in results]
+            acc[key] = [Person._shared(x["id"], x, language) for x in results]
         elif key == "tv_results":
-            acc[key] = [Show(x["id"], **x) for x in results]
+            acc[key] = [Show._shared(x["id"], x, language) for x in results]
         elif key == "tv_episode_results":
-            for x in results:
-                n = x["episode_number"]
-                sn = x["season_number"]
-                show_id = x["show_id"]
-                del x["episode_number"]
-                del x["season_number"]
-                del x["show_id"]
-                acc.setdefault(key, []).append(
-                    Episode(n, show_id=show_id, season_number=sn, **x)
-                )
+            # The results hold the `show_id` and `season_number`
+            # arguments, and are left as they are.
+            acc[key] = [Episode(x["episode_number"], **x) for x in results]
         elif key == "tv_season_results":
-            for x in results:
-                n = x["season_number"]
-                show_id = x["show_id"]
-                del x["season_number"]
-                del x["show_id"]
-                acc.setdefault(key, []).append(Season(n, show_id=show_id, **x))
+            acc[key] = [Season(x["season_number"], **x) for x in results]
         else:
             raise ValueError(f"Unkown type: {key}")
     return acc
 
 
+def find_many(
+    external_ids,
+    *,
+    src: str,
+    cache,
+    workers: int = 8,
+    ttl: float = 30 * 24 * 60 * 60,
+    **options,
+):
+    """Search for objects by many external ids.
+
+    The `external_ids` argument is an iterable of external ids
+    from the same source (`src`, see `find`). Repeated ids are
+    looked up once.
+
+    The `cache` argument is where the results of each id are kept
+    for `ttl` seconds: a `SQLiteCache` keeps them across runs, a
+    `MemoryCache` for the process, or any object with the same
+    `get` and `set` methods. Ids without results are kept too, so
+    they are not looked up again. Use a cache of its own, not the
+    cache of `configure_cache`, whose responses would evict the
+    mappings. (Default `ttl`: 30 days)
+
+    The optional `workers` argument is the maximum number of
+    requests made at the same time. (Default: 8)
+
+    Yields `(external_id, results)` tuples as the lookups finish,
+    where `results` is what `find` returns, or the exception
+    raised while looking the id up. A failed lookup does not stop
+    the others, and is not cached. Requests are throttled by the
+    rate limit like all the others.
+    """
+    params = {"api_key": tmdb_api_key(), "external_source": src, **options}
+    language = params.get("language")
+    suffix = urlencode(sorted(options.items()))
+
+    def _find(external_id):
+        key = f"find:{src}:{external_id}?{suffix}"
+        entry = cache.get(key)
+        try:
+            if entry is not None:
+                response = json.loads(entry.body)
+            else:
+                response = _find_response(external_id, params)
+                cache.set(key, json.dumps(response).encode("utf-8"), ttl)
+        except Exception as error:  # pylint: disable=W0703
+            return external_id, error
+        return external_id, _find_results(
+            response, Movie, Show, Person, Season, Episode, language
+        )
+
+    return _imap_unordered(_find, _unique(external_ids), workers)
+
+
+def _find_response(external_id, params):
+    # The mappings are kept by `find_many`, so the response cache
+    # is skipped instead of holding them a second time.
+    url = URL.FIND.format(external_id=external_id)
+    return _requests._loads(_requests._send("GET", url, params).body)
+
+
+def _unique(items):
+    seen = set()
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            yield item
+
+
+def _imap_unordered(function, items, workers):
+    """Yield `function(item)` for each item of `items`, called in
+    `workers` threads, as the calls finish.
+
+    At most two calls per worker are queued at a time, so any
+    number of items can be processed with little memory, and
+    items are only taken from `items` when a call finishes."""
+    executor = ThreadPoolExecutor(max_workers=workers)
+    pending = set()
+    try:
+        for item in items:
+            pending.add(executor.submit(function, item))
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
 def get_movie_certifications(country=None):
     """Get an up to date list of the officially supported
     movie certifications on TMDb."""
@@ -311,3 +465,34 @@ def get_primary_translations():
 def get_timezones():
     """Get the list of timezones used throughout TMDb."""
     return GET(URL.TIMEZONES_CONFIGURATION, **{"api_key": tmdb_api_key()})
+
+
+def hydrate(objects, *, workers: int = 8):
+    """Load the data of many objects concurrently.
+
+    The `objects` argument is an iterable of `Movie`, `Show`,
+    `Person`, `Season`, `Episode` (or any other) objects. Each
+    object loads its data into the `data` attribute exactly as
+    when one of its properties is read for the first time.
+
+    The optional `workers` argument is the maximum number of
+    requests made at the same time. (Default: 8)
+
+    A failed request does not stop the others. Returns a list of
+    `(object, error)` tuples for the objects that failed.
+    """
+
+    def _hydrate(obj):
+        try:
+            with obj._loading_lock():
+                # Skip the objects whose details were loaded by
+                # another thread while waiting for the lock.
+                if "details" not in obj._loaded_resources():
+                    obj._init()
+                    obj._mark_loaded("details")
+        except Exception as error:  # pylint: disable=W0703
+            return obj, error
+
+    unique = list({id(obj): obj for obj in objects}.values())
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return [r for r in executor.map(_hydrate, unique) if r is not None]
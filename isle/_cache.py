@@ -0,0 +1,306 @@
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+
+__all__ = ["MemoryCache", "SQLiteCache"]
+
+
+class CacheEntry(NamedTuple):
+    """A cached response body, its `ETag`, if any, and the time
+    (as returned by `time.time()`) at which it expires."""
+
+    body: bytes
+    etag: Optional[str]
+    expires: float
+
+
+def _is_below(key, url):
+    return key == url or key.startswith((f"{url}/", f"{url}?"))
+
+
+class MemoryCache:
+    """An in-memory LRU cache of response bodies.
+
+    Holds at most `maxsize` responses and, if `maxbytes` is set,
+    at most `maxbytes` bytes of response bodies. The least
+    recently used responses are evicted first. Expired responses
+    with an `ETag` are kept until they are evicted, so that they
+    can be revalidated. The cache is thread-safe."""
+
+    def __init__(self, maxsize=1024, maxbytes=None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return the `CacheEntry` stored under `key`, or `None`.
+        An expired entry is only returned if it has an `ETag`."""
+        with self._lock:
+            entry = self._entries.get(key)
+            fresh = entry is not None and entry.expires > time.time()
+            if entry is not None and not fresh and entry.etag is None:
+                self._remove(key)
+                entry = None
+            if fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, body, ttl, etag=None):
+        """Store `body` and its `etag` under `key` for `ttl`
+        seconds."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = CacheEntry(body, etag, time.time() + ttl)
+            self._bytes += len(body)
+            while self._entries and (
+                len(self._entries) > self.maxsize
+                or self.maxbytes is not None
+                and self._bytes > self.maxbytes
+            ):
+                self._remove(next(iter(self._entries)))
+
+    def refresh(self, key, ttl):
+        """Keep the revalidated entry under `key` for another `ttl`
+        seconds."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires = time.time() + ttl
+                self._entries[key] = entry._replace(expires=expires)
+            # The lookup was counted as a miss, but the response
+            # turned out to be still valid.
+            self.misses -= 1
+            self.hits += 1
+
+    def invalidate(self, url):
+        """Remove the responses for `url` and all URLs below it."""
+        with self._lock:
+            for key in [k for k in self._entries if _is_below(k, url)]:
+                self._remove(key)
+
+    def clear(self):
+        """Remove all responses."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        """Return the number of entries, their total size in bytes,
+        and the number of hits and misses."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _remove(self, key):
+        self._bytes -= len(self._entries.pop(key).body)
+
+
+class SQLiteCache:
+    """A cache of response bodies in an SQLite database.
+
+    Several threads and processes can share the same file, which
+    is opened in WAL mode. Bodies are compressed with zlib. If
+    `maxbytes` is set, the least recently used responses are
+    evicted once the compressed bodies take more than `maxbytes`
+    bytes; the size is checked every `check_every` writes and on
+    `vacuum`. Expired responses with an `ETag` are kept until they
+    are evicted, so that they can be revalidated."""
+
+    def __init__(self, path, maxbytes=None, timeout=30.0, check_every=100):
+        self.path = os.fspath(path)
+        self.maxbytes = maxbytes
+        self.timeout = timeout
+        self.check_every = check_every
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    body BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    etag TEXT,
+                    expires REAL NOT NULL,
+                    used REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS responses_expires
+                    ON responses (expires);
+                CREATE INDEX IF NOT EXISTS responses_used
+                    ON responses (used);
+                """
+            )
+
+    def get(self, key):
+        """Return the `CacheEntry` stored under `key`, or `None`.
+        An expired entry is only returned if it has an `ETag`."""
+        conn = self._connect()
+        row = conn.execute(
+            """
+            SELECT body, etag, expires, used FROM responses WHERE key = ?
+            """,
+            (key,),
+        ).fetchone()
+        now = time.time()
+        if row is None or row[2] <= now:
+            self.misses += 1
+            if row is None or row[1] is None:
+                return None
+        else:
+            self.hits += 1
+        # Recording every hit would turn reads into writes; the
+        # eviction order does not need to be more precise.
+        if now - row[3] > 60:
+            conn.execute(
+                "UPDATE responses SET used = ? WHERE key = ?", (now, key)
+            )
+        return CacheEntry(zlib.decompress(row[0]), row[1], row[2])
+
+    def set(self, key, body, ttl, etag=None):
+        """Store `body` and its `etag` under `key` for `ttl`
+        seconds."""
+        data = zlib.compress(body)
+        now = time.time()
+        self._connect().execute(
+            """
+            INSERT OR REPLACE INTO responses
+                (key, body, size, etag, expires, used)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (key, data, len(data), etag, now + ttl, now),
+        )
+        self._writes += 1
+        if self.maxbytes is not None and self._writes >= self.check_every:
+            self._writes = 0
+            self.evict()
+
+    def refresh(self, key, ttl):
+        """Keep the revalidated entry under `key` for another `ttl`
+        seconds."""
+        now = time.time()
+        self._connect().execute(
+            "UPDATE responses SET expires = ?, used = ? WHERE key = ?",
+            (now + ttl, now, key),
+        )
+        # The lookup was counted as a miss, but the response turned
+        # out to be still valid.
+        self.misses -= 1
+        self.hits += 1
+
+    def invalidate(self, url):
+        """Remove the responses for `url` and all URLs below it."""
+        # "0" and "@" follow "/" and "?", so both ranges can be
+        # looked up in the primary key index.
+        self._connect().execute(
+            """
+            DELETE FROM responses
+            WHERE key = ?
+               OR key >= ? AND key < ?
+               OR key >= ? AND key < ?
+            """,
+            (url, f"{url}/", f"{url}0", f"{url}?", f"{url}@"),
+        )
+
+    def clear(self):
+        """Remove all responses."""
+        self._connect().execute("DELETE FROM responses")
+
+    def evict(self):
+        """Remove expired responses without an `ETag` and, if the
+        cache is larger than `maxbytes`, the least recently used
+        ones."""
+        conn = self._connect()
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "DELETE FROM responses WHERE expires <= ? AND etag IS NULL",
+                (time.time(),),
+            )
+            if self.maxbytes is None:
+                return
+            (total,) = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            excess = total - self.maxbytes
+            keys = []
+            for key, size in conn.execute(
+                "SELECT key, size FROM responses ORDER BY used"
+            ):
+                if excess <= 0:
+                    break
+                keys.append((key,))
+                excess -= size
+            conn.executemany("DELETE FROM responses WHERE key = ?", keys)
+
+    def vacuum(self):
+        """Evict responses and give the free space back to the
+        file system."""
+        self.evict()
+        self._connect().execute("VACUUM")
+
+    def stats(self):
+        """Return the number of entries, the size of their
+        compressed bodies in bytes, the number of expired entries,
+        and the number of hits and misses of this instance."""
+        entries, size, expired = (
+            self._connect()
+            .execute(
+                """
+                SELECT COUNT(*), COALESCE(SUM(size), 0),
+                       COALESCE(SUM(expires <= ?), 0)
+                FROM responses
+                """,
+                (time.time(),),
+            )
+            .fetchone()
+        )
+        return {
+            "entries": entries,
+            "bytes": size,
+            "expired": expired,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def close(self):
+        """Close the connection of the current thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _connect(self):
+        # Connections cannot be shared between threads, nor
+        # survive a fork.
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
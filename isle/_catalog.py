@@ -0,0 +1,373 @@
+import json
+import os
+import sqlite3
+import threading
+
+from .objects import Company, Keyword, Movie, Person, Show
+
+
+__all__ = ["Catalog"]
+
+
+_KINDS = {
+    Movie: "movie",
+    Show: "tv",
+    Person: "person",
+    Company: "company",
+    Keyword: "keyword",
+}
+
+_CLASSES = {kind: cls for cls, kind in _KINDS.items()}
+
+# Options of `discover_movies` and `discover_shows` which compare
+# a column with a value.
+_MOVIE_RANGES = {
+    "primary_release_year": ("year", "="),
+    "year": ("year", "="),
+    "primary_release_date.gte": ("date", ">="),
+    "primary_release_date.lte": ("date", "<="),
+    "release_date.gte": ("date", ">="),
+    "release_date.lte": ("date", "<="),
+}
+
+_SHOW_RANGES = {
+    "first_air_date_year": ("year", "="),
+    "first_air_date.gte": ("date", ">="),
+    "first_air_date.lte": ("date", "<="),
+    "air_date.gte": ("date", ">="),
+    "air_date.lte": ("date", "<="),
+}
+
+_COMMON_RANGES = {
+    "vote_average.gte": ("vote_average", ">="),
+    "vote_average.lte": ("vote_average", "<="),
+    "vote_count.gte": ("vote_count", ">="),
+    "vote_count.lte": ("vote_count", "<="),
+    "with_runtime.gte": ("runtime", ">="),
+    "with_runtime.lte": ("runtime", "<="),
+    "with_original_language": ("original_language", "="),
+}
+
+# Options which match the ids of linked objects. Commas mean
+# "and", pipes mean "or", as in TMDb.
+_LINKS = {
+    "with_genres": "genre",
+    "with_companies": "company",
+    "with_keywords": "keyword",
+    "with_cast": "cast",
+    "with_crew": "crew",
+    "with_people": "person",
+}
+
+# Options of the `search_*` functions which compare a column with
+# a value, by kind.
+_SEARCH_RANGES = {
+    "movie": {
+        "year": ("year", "="),
+        "primary_release_year": ("year", "="),
+    },
+    "tv": {"first_air_date_year": ("year", "=")},
+}
+
+_SORTS = {
+    "popularity": "popularity",
+    "release_date": "date",
+    "primary_release_date": "date",
+    "first_air_date": "date",
+    "vote_average": "vote_average",
+    "vote_count": "vote_count",
+    "original_title": "original_name",
+    "original_name": "original_name",
+    "title": "name",
+    "name": "name",
+}
+
+
+class Catalog:
+    """A local store of movies, shows, people, companies and
+    keywords in an SQLite database.
+
+    Objects are stored with all their loaded data, and the fields
+    used by the `discover` options (dates, votes, genres,
+    companies, keywords and people) are indexed, so the same
+    questions can be answered without requests. The `search_*`
+    and `discover_*` methods work like the functions with the same
+    names, and return the same objects, already loaded. Options
+    which cannot be answered from the stored data raise a
+    `ValueError`.
+
+    Several threads and processes can share the same file, which
+    is opened in WAL mode."""
+
+    def __init__(self, path, timeout=30.0):
+        self.path = os.fspath(path)
+        self.timeout = timeout
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS objects (
+                    kind TEXT NOT NULL,
+                    id INTEGER NOT NULL,
+                    data TEXT NOT NULL,
+                    name TEXT,
+                    original_name TEXT,
+                    date TEXT,
+                    year INTEGER,
+                    vote_average REAL,
+                    vote_count INTEGER,
+                    popularity REAL,
+                    runtime INTEGER,
+                    original_language TEXT,
+                    PRIMARY KEY (kind, id)
+                );
+                CREATE INDEX IF NOT EXISTS objects_year
+                    ON objects (kind, year);
+                CREATE INDEX IF NOT EXISTS objects_date
+                    ON objects (kind, date);
+                CREATE INDEX IF NOT EXISTS objects_vote_average
+                    ON objects (kind, vote_average);
+                CREATE INDEX IF NOT EXISTS objects_popularity
+                    ON objects (kind, popularity);
+                CREATE INDEX IF NOT EXISTS objects_name
+                    ON objects (kind, name);
+                CREATE TABLE IF NOT EXISTS links (
+                    kind TEXT NOT NULL,
+                    id INTEGER NOT NULL,
+                    link TEXT NOT NULL,
+                    link_id INTEGER NOT NULL,
+                    PRIMARY KEY (link, link_id, kind, id)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS links_object
+                    ON links (kind, id);
+                """
+            )
+
+    def add(self, objects):
+        """Store `objects`, replacing the stored ones with the same
+        type and id. Returns the number of stored objects."""
+        n = 0
+        with self._connect() as conn:
+            for obj in objects:
+                kind = _kind(obj)
+                data = obj.data
+                conn.execute(
+                    "DELETE FROM links WHERE kind = ? AND id = ?",
+                    (kind, obj.tmdb_id),
+                )
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO objects VALUES
+                        (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (kind, obj.tmdb_id, json.dumps(data), *_columns(data)),
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO links VALUES (?, ?, ?, ?)",
+                    (
+                        (kind, obj.tmdb_id, link, link_id)
+                        for link, link_id in _links(data)
+                    ),
+                )
+                n += 1
+        return n
+
+    def remove(self, objects):
+        """Remove `objects` from the catalog."""
+        with self._connect() as conn:
+            for obj in objects:
+                key = (_kind(obj), obj.tmdb_id)
+                conn.execute(
+                    "DELETE FROM objects WHERE kind = ? AND id = ?", key
+                )
+                conn.execute(
+                    "DELETE FROM links WHERE kind = ? AND id = ?", key
+                )
+
+    def get(self, cls, tmdb_id):
+        """Return the stored object of type `cls` with `tmdb_id`,
+        or `None`."""
+        row = (
+            self._connect()
+            .execute(
+                "SELECT data FROM objects WHERE kind = ? AND id = ?",
+                (_KINDS[cls], tmdb_id),
+            )
+            .fetchone()
+        )
+        return None if row is None else _load(cls, row[0])
+
+    def search_movie(self, query: str, **kwargs):
+        """Search for stored movies by their titles."""
+        return self._search("movie", query, kwargs)
+
+    def search_show(self, query: str, **kwargs):
+        """Search for stored TV shows by their titles."""
+        return self._search("tv", query, kwargs)
+
+    def search_person(self, query: str, **kwargs):
+        """Search for stored people by their names."""
+        return self._search("person", query, kwargs)
+
+    def search_company(self, query: str, **kwargs):
+        """Search for stored companies by their names."""
+        return self._search("company", query, kwargs)
+
+    def search_keyword(self, query: str, **kwargs):
+        """Search for stored keywords."""
+        return self._search("keyword", query, kwargs)
+
+    def discover_movies(self, options: dict):
+        """Discover stored movies with the options of
+        `isle.discover_movies`. Raises a `ValueError` for the
+        options which are not supported."""
+        return self._discover("movie", options, _MOVIE_RANGES)
+
+    def discover_shows(self, options: dict):
+        """Discover stored TV shows with the options of
+        `isle.discover_shows`. Raises a `ValueError` for the
+        options which are not supported."""
+        return self._discover("tv", options, _SHOW_RANGES)
+
+    def __len__(self):
+        query = "SELECT COUNT(*) FROM objects"
+        return self._connect().execute(query).fetchone()[0]
+
+    def close(self):
+        """Close the connection of the current thread."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _search(self, kind, query, options):
+        ranges = _SEARCH_RANGES.get(kind, {})
+        # "%" and "_" in the query match themselves, as in TMDb.
+        pattern = "%{}%".format(
+            query.replace("\\", "\\\\")
+            .replace("%", "\\%")
+            .replace("_", "\\_")
+        )
+        where = [
+            "(name LIKE ? ESCAPE '\\' OR original_name LIKE ? ESCAPE '\\')"
+        ]
+        params = [pattern, pattern]
+        include_adult = False
+        for option, value in options.items():
+            if option in ranges:
+                column, op = ranges[option]
+                where.append(f"{column} {op} ?")
+                params.append(value)
+            elif option == "include_adult":
+                include_adult = str(value).lower() == "true"
+            elif option not in ("language", "page", "prefetch"):
+                raise ValueError(f"unsupported option: {option}")
+        objects = self._select(kind, where, params, "popularity DESC")
+        if include_adult:
+            return objects
+        return (obj for obj in objects if not obj.data.get("adult"))
+
+    def _discover(self, kind, options, ranges):
+        ranges = {**ranges, **_COMMON_RANGES}
+        where, params = [], []
+        order = "popularity DESC"
+        for option, value in options.items():
+            if option in ranges:
+                column, op = ranges[option]
+                where.append(f"{column} {op} ?")
+                params.append(value)
+            elif option in _LINKS:
+                link = _LINKS[option]
+                for ids in str(value).split(","):
+                    ids = [int(i) for i in ids.split("|")]
+                    where.append(
+                        "id IN (SELECT id FROM links WHERE link = ? "
+                        f"AND link_id IN ({', '.join('?' * len(ids))}) "
+                        "AND kind = ?)"
+                    )
+                    params.extend([link, *ids, kind])
+            elif option == "sort_by":
+                field, _, direction = value.rpartition(".")
+                if field not in _SORTS or direction not in ("asc", "desc"):
+                    raise ValueError(f"unsupported sort_by: {value}")
+                order = f"{_SORTS[field]} {direction.upper()}"
+            elif option not in ("language", "page"):
+                raise ValueError(f"unsupported option: {option}")
+        return self._select(kind, where, params, order)
+
+    def _select(self, kind, where, params, order):
+        if where:
+            # Without statistics, SQLite prefers scanning the index
+            # of the sort column over using the index of a filter.
+            # The "+" keeps the filters' indexes in use.
+            order = f"+{order}"
+        where = " AND ".join(["kind = ?", *where])
+        rows = self._connect().execute(
+            f"SELECT data FROM objects WHERE {where} ORDER BY {order}",
+            [kind, *params],
+        )
+        return (_load(_CLASSES[kind], data) for (data,) in rows)
+
+    def _connect(self):
+        # Connections cannot be shared between threads, nor
+        # survive a fork.
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=self.timeout)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+
+def _kind(obj):
+    for cls, kind in _KINDS.items():
+        if isinstance(obj, cls):
+            return kind
+    raise TypeError(f"cannot store {type(obj).__name__} in a catalog")
+
+
+def _load(cls, data):
+    data = json.loads(data)
+    return cls._shared(data["id"], data)
+
+
+def _columns(data):
+    name = data.get("title") or data.get("name")
+    original_name = data.get("original_title") or data.get("original_name")
+    date = data.get("release_date") or data.get("first_air_date") or None
+    runtime = data.get("runtime")
+    if runtime is None and data.get("episode_run_time"):
+        runtime = data["episode_run_time"][0]
+    return (
+        name,
+        original_name,
+        date,
+        int(date[:4]) if date else None,
+        data.get("vote_average"),
+        data.get("vote_count"),
+        data.get("popularity"),
+        runtime,
+        data.get("original_language"),
+    )
+
+
+def _links(data):
+    """Yield `(link, id)` tuples for the objects linked to the
+    object with `data`."""
+    for genre in data.get("genres", ()):
+        yield "genre", genre["id"]
+    for genre_id in data.get("genre_ids", ()):
+        yield "genre", genre_id
+    for company in data.get("production_companies", ()):
+        yield "company", company["id"]
+    keywords = data.get("keywords", {})
+    for keyword in keywords.get("keywords", keywords.get("results", ())):
+        yield "keyword", keyword["id"]
+    credits = data.get("credits", {})
+    for person in credits.get("cast", ()):
+        yield "cast", person["id"]
+        yield "person", person["id"]
+    for person in credits.get("crew", ()):
+        yield "crew", person["id"]
+        yield "person", person["id"]
@@ -0,0 +1,118 @@
+import gzip
+import json
+import os
+
+from ._frozen import FrozenDict, FrozenList, unwrap
+from .objects import (
+    Company,
+    Credit,
+    Episode,
+    Keyword,
+    Movie,
+    Person,
+    Season,
+    Show,
+    TMDbList,
+)
+
+
+__all__ = ["dump", "load"]
+
+
+_TYPES = {
+    cls.__name__: cls
+    for cls in (
+        Movie,
+        Show,
+        Person,
+        Company,
+        Keyword,
+        TMDbList,
+        Season,
+        Episode,
+        Credit,
+    )
+}
+
+
+def dump(objects, path):
+    """Write `objects` to a JSON Lines file, one object per line,
+    with all their loaded data.
+
+    The file is compressed with gzip if `path` ends with `.gz`.
+    Objects are written one at a time, so any number of them can
+    be written with the memory of one. Dumping an object never
+    loads anything. Returns the number of written objects.
+    """
+    n = 0
+    with _open(path, "wt") as file:
+        for obj in objects:
+            file.write(json.dumps(_record(obj), default=_default))
+            file.write("\n")
+            n += 1
+    return n
+
+
+def load(path):
+    """Read the objects written by `dump`.
+
+    The file is decompressed with gzip if `path` ends with `.gz`.
+    Returns a generator which reads one line at a time. Each item
+    is an object of the dumped type with the dumped data, built
+    without making any request; it only makes requests for data
+    which was not loaded when it was dumped.
+    """
+    with _open(path, "rt") as file:
+        for line in file:
+            yield _build(json.loads(line))
+
+
+def _open(path, mode):
+    if os.fspath(path).endswith(".gz"):
+        return gzip.open(path, mode, encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _default(value):
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return unwrap(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _record(obj):
+    # The ids of seasons and episodes are properties which may
+    # load data, so they are rebuilt from their numbers instead.
+    for name, cls in _TYPES.items():
+        if isinstance(obj, cls):
+            record = {"type": name, "data": obj.data}
+            if isinstance(obj, (Season, Episode)):
+                record["show_id"] = obj.show_id
+            loaded = obj._loaded_resources()
+            if loaded:
+                record["loaded"] = sorted(loaded)
+            return record
+    raise TypeError(f"cannot dump {type(obj).__name__}")
+
+
+def _build(record):
+    obj = _construct(_TYPES[record["type"]], record)
+    if "loaded" in record:
+        obj._mark_loaded(*record["loaded"])
+    return obj
+
+
+def _construct(cls, record):
+    data = record["data"]
+    if cls is Season:
+        return cls(data["season_number"], show_id=record["show_id"], **data)
+    if cls is Episode:
+        data = dict(data)
+        return cls(
+            data.pop("episode_number"),
+            show_id=record["show_id"],
+            season_number=data.pop("season_number"),
+            **data,
+        )
+    if cls is Credit:
+        return cls(data["credit_id"], **data)
+    return cls(data["id"], **data)
@@ -0,0 +1,95 @@
+import copy
+from collections.abc import Mapping, Sequence
+
+
+class FrozenDict(Mapping):
+    """A read-only view of a dict.
+
+    Nested dicts and lists are returned as read-only views too,
+    so reading a value never copies anything."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, key):
+        return freeze(self._data[key])
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __eq__(self, other):
+        other = unwrap(other)
+        if isinstance(other, dict):
+            return self._data == other
+        return super().__eq__(other)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._data!r})"
+
+
+class FrozenList(Sequence):
+    """A read-only view of a list.
+
+    Nested dicts and lists are returned as read-only views too,
+    so reading an item never copies anything."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return FrozenList(self._data[index])
+        return freeze(self._data[index])
+
+    def __iter__(self):
+        return map(freeze, self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, value):
+        return unwrap(value) in self._data
+
+    def __eq__(self, other):
+        other = unwrap(other)
+        if isinstance(other, list):
+            return self._data == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._data!r})"
+
+
+def freeze(value):
+    """Return a read-only view of `value` if it is a dict or a
+    list, or `value` itself otherwise."""
+    if isinstance(value, dict):
+        return FrozenDict(value)
+    if isinstance(value, list):
+        return FrozenList(value)
+    return value
+
+
+def unwrap(value):
+    """Return the dict or list behind a read-only view, or `value`
+    itself if it is not a view."""
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value._data
+    return value
+
+
+def thaw(value):
+    """Return a mutable deep copy of `value`."""
+    return copy.deepcopy(unwrap(value))
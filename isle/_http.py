@@ -0,0 +1,199 @@
+import gzip
+import http.client
+import select
+import threading
+import time
+from base64 import b64encode
+from io import BytesIO
+from typing import NamedTuple
+from urllib.error import HTTPError, URLError
+from urllib.parse import unquote, urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+
+# Errors that mean a kept-alive connection was closed by the
+# server while it was idle in the pool.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+
+# Methods which can be sent again without side effects when a
+# kept-alive connection turns out to be closed.
+_IDEMPOTENT_METHODS = ("GET", "HEAD")
+
+
+class Response(NamedTuple):
+    """A fully read HTTP response."""
+
+    status: int
+    headers: http.client.HTTPMessage
+    body: bytes
+
+
+class ConnectionPool:
+    """A thread-safe pool of HTTP/1.1 keep-alive connections.
+
+    Idle connections are kept per `(scheme, host, port)`. At most
+    `maxsize` idle connections are kept for a host; a connection
+    which has been idle for more than `idle_timeout` seconds is
+    closed instead of being reused.
+
+    The proxies of the environment (`HTTP_PROXY`, `HTTPS_PROXY` and
+    `NO_PROXY`) are used as by `urllib.request.urlopen`."""
+
+    def __init__(self, maxsize=10, idle_timeout=60.0, timeout=30.0):
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def request(self, method, url, body=None, headers=None):
+        """Send a request and return a `Response`. Raises
+        `HTTPError` if the status code is 400 or greater and
+        `URLError` if the server is unreachable."""
+        parts = urlsplit(url)
+        proxy = _proxy(parts)
+        key = (parts.scheme, parts.hostname, parts.port, proxy)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        headers = {
+            "Accept-Encoding": "gzip",
+            "Connection": "keep-alive",
+            **(headers or {}),
+        }
+        if proxy is not None and parts.scheme == "http":
+            # Plain HTTP requests are sent to the proxy with the full
+            # URL, HTTPS requests go through a tunnel.
+            target = f"http://{parts.netloc}{target}"
+            headers.update(_proxy_headers(proxy))
+        conn, reused = self._get_conn(key)
+        try:
+            try:
+                response, data = self._send(
+                    conn, method, target, body, headers
+                )
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if not reused or method not in _IDEMPOTENT_METHODS:
+                    raise
+                conn = self._new_conn(key)
+                response, data = self._send(
+                    conn, method, target, body, headers
+                )
+        except OSError as error:
+            conn.close()
+            raise URLError(error)
+        if response.will_close:
+            conn.close()
+        else:
+            self._put_conn(key, conn)
+        if response.headers.get("Content-Encoding") == "gzip":
+            data = gzip.decompress(data)
+        if response.status >= 400:
+            raise HTTPError(
+                url,
+                response.status,
+                response.reason,
+                response.headers,
+                BytesIO(data),
+            )
+        return Response(response.status, response.headers, data)
+
+    def clear(self):
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn, _ in conns:
+                conn.close()
+
+    def _send(self, conn, method, target, body, headers):
+        conn.request(method, target, body=body, headers=headers)
+        response = conn.getresponse()
+        # The body must be read before the connection goes back
+        # to the pool, `will_close` is only reliable afterwards.
+        return response, response.read()
+
+    def _get_conn(self, key):
+        now = time.monotonic()
+        expired = []
+        conn = None
+        with self._lock:
+            conns = self._idle.get(key, [])
+            while conns:
+                candidate, last_used = conns.pop()
+                idle = now - last_used
+                if idle > self.idle_timeout or _is_closed(candidate):
+                    expired.append(candidate)
+                else:
+                    conn = candidate
+                    break
+        for candidate in expired:
+            candidate.close()
+        if conn is not None:
+            return conn, True
+        return self._new_conn(key), False
+
+    def _new_conn(self, key):
+        scheme, host, port, proxy = key
+        if scheme == "https":
+            Connection = http.client.HTTPSConnection
+        else:
+            Connection = http.client.HTTPConnection
+        if proxy is None:
+            return Connection(host, port, timeout=self.timeout)
+        conn = Connection(
+            proxy.hostname, proxy.port or 80, timeout=self.timeout
+        )
+        if scheme == "https":
+            conn.set_tunnel(host, port, headers=_proxy_headers(proxy))
+        return conn
+
+    def _put_conn(self, key, conn):
+        with self._lock:
+            conns = self._idle.setdefault(key, [])
+            if len(conns) < self.maxsize:
+                conns.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+
+def _is_closed(conn):
+    """Return `True` if the server closed the idle connection
+    `conn`: its socket is readable, although no request is in
+    flight."""
+    if conn.sock is None:
+        return True
+    try:
+        if hasattr(select, "poll"):
+            poll = select.poll()
+            poll.register(conn.sock, select.POLLIN)
+            return bool(poll.poll(0))
+        return bool(select.select([conn.sock], [], [], 0)[0])
+    except (OSError, ValueError):
+        return True
+
+
+def _proxy(parts):
+    """Return the split URL of the proxy for the split URL `parts`,
+    or `None` if it is reached directly."""
+    proxy = getproxies().get(parts.scheme)
+    if proxy is None or proxy_bypass(parts.hostname):
+        return None
+    if "://" not in proxy:
+        proxy = f"http://{proxy}"
+    return urlsplit(proxy)
+
+
+def _proxy_headers(proxy):
+    if proxy.username is None:
+        return {}
+    credentials = f"{unquote(proxy.username)}:{unquote(proxy.password or '')}"
+    token = b64encode(credentials.encode("utf-8")).decode("ascii")
+    return {"Proxy-Authorization": f"Basic {token}"}
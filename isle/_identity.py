@@ -0,0 +1,43 @@
+import threading
+import weakref
+
+
+__all__ = ["configure_identity_map"]
+
+
+_enabled = False
+_objects = weakref.WeakValueDictionary()
+_lock = threading.Lock()
+
+
+def configure_identity_map(enabled=True):
+    """Turn the identity map on or off. (Default: off)
+
+    While it is on, the search, discover and find functions and
+    the properties of objects return one shared object per TMDb
+    id (and language), as long as it is referenced anywhere. Data
+    loaded by one reference, for example with `get_all()`, is
+    then seen by every other reference, and is not requested
+    again. Data from new search results only fills in fields the
+    shared object does not have yet.
+    """
+    global _enabled
+    with _lock:
+        _enabled = enabled
+        _objects.clear()
+
+
+def lookup(cls, tmdb_id, payload, language):
+    """Return the object of type `cls` for `tmdb_id` and
+    `language`, merging `payload` into its data, or a new object
+    if there is none or the identity map is off."""
+    if not _enabled:
+        return cls(tmdb_id, **payload)
+    key = (cls, tmdb_id, language)
+    with _lock:
+        obj = _objects.get(key)
+        if obj is None:
+            obj = _objects[key] = cls(tmdb_id, **payload)
+        else:
+            obj._merge(payload)
+    return obj
@@ -0,0 +1,117 @@
+import copy
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from ._memo import Data
+
+
+__all__ = ["localize"]
+
+
+_MAXSIZE = 4096
+
+_views = OrderedDict()
+_lock = threading.Lock()
+
+
+def localize(objects, languages, *, workers: int = 8):
+    """Return views of `Movie`, `Show` or `Episode` objects in
+    several languages.
+
+    The `languages` argument is a list of ISO-639-1 codes, with or
+    without a country (such as `"fr"` or `"pt-BR"`). A view is an
+    object of the same type whose `title`, `name`, `overview`,
+    `homepage` and `tagline` are translated, and whose images are
+    the ones in its language or without text.
+
+    Each object makes at most one request, which loads the
+    translations to all the languages and their images together,
+    so the number of requests does not grow with the number of
+    languages. Views are kept per object and language, and asking
+    for them again makes no request at all.
+
+    The optional `workers` argument is the maximum number of
+    requests made at the same time. (Default: 8)
+
+    Returns a list with a `{language: view}` dict for each object.
+    """
+    languages = list(languages)
+
+    def _localize(obj):
+        views, missing = {}, []
+        for language in languages:
+            view = _cached(obj, language)
+            if view is None:
+                missing.append(language)
+            else:
+                views[language] = view
+        if missing:
+            _load(obj, missing)
+            for language in missing:
+                views[language] = _store(obj, language, _view(obj, language))
+        return views
+
+    objects = list(objects)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_localize, objects))
+
+
+def _key(obj, language):
+    return type(obj), obj._details_url, language
+
+
+def _cached(obj, language):
+    key = _key(obj, language)
+    with _lock:
+        view = _views.get(key)
+        if view is not None:
+            _views.move_to_end(key)
+        return view
+
+
+def _store(obj, language, view):
+    with _lock:
+        _views[_key(obj, language)] = view
+        while len(_views) > _MAXSIZE:
+            _views.popitem(last=False)
+    return view
+
+
+def _forget(cls, details_url):
+    """Drop the views of the object at `details_url`."""
+    with _lock:
+        for key in [key for key in _views if key[:2] == (cls, details_url)]:
+            del _views[key]
+
+
+def _load(obj, languages):
+    append = [key for key in ("translations", "images") if key not in obj.data]
+    if append:
+        codes = sorted({language.partition("-")[0] for language in languages})
+        obj.get_all(append, include_image_language=",".join(codes + ["null"]))
+
+
+def _view(obj, language):
+    iso_639_1, _, iso_3166_1 = language.partition("-")
+    fields = {}
+    for item in obj.data["translations"]["translations"]:
+        if item["iso_639_1"] == iso_639_1 and iso_3166_1 in (
+            "",
+            item["iso_3166_1"],
+        ):
+            fields = {k: v for k, v in item["data"].items() if v}
+            break
+    data = Data({**obj.data, **fields})
+    if "images" in data:
+        data["images"] = {
+            kind: [i for i in items if i.get("iso_639_1") in (iso_639_1, None)]
+            if isinstance(items, list)
+            else items
+            for kind, items in data["images"].items()
+        }
+    view = copy.copy(obj)
+    view.data = data
+    view.n_requests = 0
+    view._memo = {}
+    return view
@@ -0,0 +1,85 @@
+class Data(dict):
+    """A dict which counts how many times it has been changed."""
+
+    __slots__ = ("version",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self.version += 1
+        return super().setdefault(key, default)
+
+    def pop(self, *args):
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self):
+        self.version += 1
+        return super().popitem()
+
+    def clear(self):
+        super().clear()
+        self.version += 1
+
+
+class memoized_property:
+    """A property which is computed once and then kept until the
+    `data` of its object changes.
+
+    Lists and dicts are returned as shallow copies, so callers can
+    change them without changing the memoized value, while the
+    objects in them are built only once. Objects whose `_is_stale`
+    method returns `True` are never served from the memo."""
+
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        try:
+            memo = obj._memo
+        except AttributeError:
+            memo = obj._memo = {}
+        data = obj.data
+        version = getattr(data, "version", None)
+        entry = memo.get(self.name)
+        if (
+            entry is not None
+            and version is not None
+            and entry[0] is data
+            and entry[1] == version
+            and not obj._is_stale()
+        ):
+            value = entry[2]
+        else:
+            value = self.func(obj)
+            # Computing the value may have loaded more data.
+            data = obj.data
+            memo[self.name] = (data, getattr(data, "version", None), value)
+        return _shallow_copy(value)
+
+
+def _shallow_copy(value):
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, dict):
+        return dict(value)
+    return value
@@ -0,0 +1,84 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+
+# Statuses that mean "slow down and try again later".
+RETRY_STATUSES = (429, 503)
+
+
+class RateLimiter:
+    """A token bucket shared by all threads.
+
+    The bucket holds up to `burst` tokens and is refilled with
+    `rate` tokens per second. Every request takes a token; when
+    the bucket is empty, requests queue up and wait for their
+    turn instead of being rejected. If `rate` is `None`, requests
+    are only delayed while the limiter is paused.
+
+    A request answered with 429 or 503 is retried up to `retries`
+    times. Meanwhile all requests are paused for `Retry-After`
+    seconds or, without that header, for an exponentially growing
+    delay starting at `backoff` seconds."""
+
+    def __init__(self, rate=40.0, burst=40, retries=5, backoff=1.0):
+        self.rate = rate
+        self.burst = burst
+        self.retries = retries
+        self.backoff = backoff
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Take a token and return the number of seconds to wait
+        before the request can be sent."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            paused = max(0.0, self._updated - now)
+            if self.rate is None:
+                return paused
+            self._tokens -= 1
+            return paused + max(0.0, -self._tokens / self.rate)
+
+    def acquire(self):
+        """Block until a request can be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def pause(self, seconds):
+        """Hold back all requests for `seconds` seconds."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = max(self._updated, now + seconds)
+
+    def retry_delay(self, headers, attempt):
+        """Return the number of seconds to wait before the next
+        attempt. Some jitter is added so that waiting clients do
+        not retry all at once."""
+        delay = self.backoff * 2 ** attempt
+        retry_after = headers.get("Retry-After") if headers else None
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    date = parsedate_to_datetime(retry_after)
+                    delay = date.timestamp() - time.time()
+                except (TypeError, ValueError):
+                    pass
+        return max(0.0, delay) + random.uniform(0, self.backoff)
+
+    def _refill(self, now):
+        if now > self._updated:
+            if self.rate is not None:
+                elapsed = now - self._updated
+                self._tokens = min(
+                    self.burst, self._tokens + elapsed * self.rate
+                )
+            self._updated = now
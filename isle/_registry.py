@@ -0,0 +1,160 @@
+import threading
+import time
+
+from . import _urls as URL
+from ._config import tmdb_api_key
+from ._requests import GET
+
+
+__all__ = ["configure_reference_data", "refresh_reference_data"]
+
+
+def _parse_languages(response):
+    languages = {}
+    for item in response:
+        languages[item["iso_639_1"]] = {
+            "english_name": item["english_name"],
+            "name": item["name"],
+        }
+    return languages
+
+
+def _parse_countries(response):
+    countries = {}
+    for item in response:
+        countries[item["iso_3166_1"]] = item["english_name"]
+    return countries
+
+
+def _parse_images(response):
+    return response["images"]
+
+
+def _parse_genres(response):
+    return {item["id"]: item["name"] for item in response["genres"]}
+
+
+# The URL of each table and the function which builds the table
+# from its response.
+_SOURCES = {
+    "languages": (URL.LANGUAGES_CONFIGURATION, _parse_languages),
+    "countries": (URL.COUNTRIES_CONFIGURATION, _parse_countries),
+    "images": (URL.IMAGE_CONFIGURATION, _parse_images),
+    "movie_genres": (URL.MOVIE_GENRES, _parse_genres),
+    "show_genres": (URL.SHOW_GENRES, _parse_genres),
+}
+
+
+class _Registry:
+    """Reference data shared by all objects of the process.
+
+    Each table is loaded on first use and reloaded once it is older
+    than `ttl` seconds. Concurrent first uses of a table wait for a
+    single request instead of sending one each."""
+
+    def __init__(self, sources, ttl=24 * 60 * 60):
+        self.ttl = ttl
+        self._sources = sources
+        self._tables = {}
+        self._locks = {name: threading.Lock() for name in sources}
+
+    def get(self, name):
+        table = self._tables.get(name)
+        if table is not None and time.monotonic() - table[1] < self.ttl:
+            return table[0]
+        with self._locks[name]:
+            # Another thread may have loaded it in the meantime.
+            table = self._tables.get(name)
+            if table is None or time.monotonic() - table[1] >= self.ttl:
+                table = self._load(name)
+        return table[0]
+
+    def loaded(self, name):
+        """Return the table `name` as it is, even if it is old,
+        without requesting it. Raises a `RuntimeError` if it is not
+        loaded."""
+        table = self._tables.get(name)
+        if table is None:
+            raise RuntimeError(
+                f"The {name} reference data is not loaded, "
+                "await `isle.aio.load_reference_data()` first"
+            )
+        return table[0]
+
+    def refresh(self, *names):
+        for name in names or list(self._tables):
+            with self._locks[name]:
+                self._load(name)
+
+    def store(self, name, response):
+        """Build the table `name` from its `response`."""
+        table = (self._sources[name][1](response), time.monotonic())
+        self._tables[name] = table
+        return table
+
+    def _load(self, name):
+        url = self._sources[name][0]
+        return self.store(name, GET(url, api_key=tmdb_api_key()))
+
+    def check(self, names):
+        """Raise a `ValueError` for the unknown table names."""
+        unknown = sorted(set(names) - self._sources.keys())
+        if unknown:
+            raise ValueError(f"Unknown reference data: {', '.join(unknown)}")
+
+
+_registry = _Registry(_SOURCES)
+
+
+def _table(name):
+    return _registry.get(name)
+
+
+def _loaded_table(name):
+    return _registry.loaded(name)
+
+
+def languages():
+    """Return a dict mapping ISO 639-1 codes to the English and
+    original names of the languages."""
+    return _registry.get("languages")
+
+
+def countries():
+    """Return a dict mapping ISO 3166-1 codes to the English names
+    of the countries."""
+    return _registry.get("countries")
+
+
+def image_config():
+    """Return the base URLs and sizes of images."""
+    return _registry.get("images")
+
+
+def movie_genres():
+    """Return a dict mapping the ids of movie genres to their
+    names."""
+    return _registry.get("movie_genres")
+
+
+def show_genres():
+    """Return a dict mapping the ids of TV show genres to their
+    names."""
+    return _registry.get("show_genres")
+
+
+def configure_reference_data(*, ttl):
+    """Set the number of seconds after which the languages,
+    countries, genres and image configuration shared by all
+    objects are downloaded again. (Default: 86400)"""
+    _registry.ttl = ttl
+
+
+def refresh_reference_data(*tables):
+    """Download the reference data shared by all objects again.
+
+    The `tables` are any of `"languages"`, `"countries"`,
+    `"images"`, `"movie_genres"` and `"show_genres"`. If no table
+    is given, all tables loaded so far are refreshed."""
+    _registry.check(tables)
+    _registry.refresh(*tables)
@@ -1,37 +1,346 @@
 import json
-from urllib.parse import urlencode, urljoin
-from urllib.request import Request, urlopen
+import threading
+import time
+from collections import deque
+from collections.abc import Generator
+from concurrent.futures import Future, ThreadPoolExecutor
+from fnmatch import fnmatchcase
+from itertools import count, islice
+from urllib.error import HTTPError
+from urllib.parse import urlencode, urlsplit
 
+from . import _urls as URL
+from ._http import ConnectionPool
+from ._ratelimit import RETRY_STATUSES, RateLimiter
 
-def GET_total_pages_for(url, params):
-    first_page = GET(url, page=1, **params)
-    return first_page["total_pages"]
+
+__all__ = ["configure_pool", "configure_rate_limit", "configure_cache"]
+
+
+# How long the responses of an endpoint are cached, in seconds.
+# Patterns are matched against the path after the API version,
+# the first match wins. 0 means that responses are never cached.
+_DEFAULT_TTLS = {
+    "/configuration*": 24 * 60 * 60,
+    "/genre/*": 24 * 60 * 60,
+    "*/latest": 0,
+    "/account*": 0,
+    "/authentication/*": 0,
+    "/guest_session/*": 0,
+    "*/account_states": 0,
+    "*/changes": 0,
+}
+
+
+_pool = ConnectionPool()
+_limiter = RateLimiter()
+_cache = None
+_ttl = 60 * 60
+_ttls = list(_DEFAULT_TTLS.items())
+
+# The GET requests being sent, by request, and the lock which
+# guards them.
+_flights = {}
+_flights_lock = threading.Lock()
+
+
+def configure_pool(*, maxsize=None, idle_timeout=None, timeout=None):
+    """Configure the keep-alive connection pool used for all
+    requests to TMDb.
+
+    The optional `maxsize` argument is the number of idle
+    connections kept open per host. (Default: 10)
+
+    The optional `idle_timeout` argument is the number of seconds
+    after which an idle connection is closed. (Default: 60)
+
+    The optional `timeout` argument is the socket timeout in
+    seconds. (Default: 30)
+    """
+    if maxsize is not None:
+        _pool.maxsize = maxsize
+    if idle_timeout is not None:
+        _pool.idle_timeout = idle_timeout
+    if timeout is not None:
+        _pool.timeout = timeout
+        _pool.clear()
+
+
+def configure_rate_limit(rate=40.0, burst=40, *, retries=5, backoff=1.0):
+    """Configure the client-side rate limit shared by all threads.
+
+    The `rate` argument is the number of requests per second.
+    Requests above the limit wait for their turn. If `rate` is
+    `None`, requests are not limited. (Default: 40)
+
+    The `burst` argument is the number of requests that can be
+    sent at once after a quiet period. (Default: 40)
+
+    A request answered with "429 Too Many Requests" (or "503
+    Service Unavailable") is retried up to `retries` times.
+    Meanwhile all requests wait for the time from the
+    `Retry-After` header, or for an exponentially growing delay
+    starting at `backoff` seconds. (Default: 5 and 1.0)
+    """
+    with _limiter._lock:
+        _limiter.rate = rate
+        _limiter.burst = burst
+        _limiter.retries = retries
+        _limiter.backoff = backoff
+        _limiter._tokens = min(_limiter._tokens, float(burst))
+
+
+def configure_cache(cache, *, ttl=3600, ttls=None):
+    """Cache the responses of GET requests to TMDb.
+
+    The `cache` argument is a `MemoryCache`, a `SQLiteCache`, or
+    any object with the same `get`, `set`, `refresh` and
+    `invalidate` methods. If `cache` is `None`, responses are not
+    cached. (Default: `None`)
+
+    The optional `ttl` argument is the number of seconds a response
+    is kept. (Default: 3600)
+
+    The optional `ttls` argument maps endpoint patterns such as
+    `"/movie/*/credits"` to the number of seconds their responses
+    are kept, `0` meaning never. Patterns are matched against the
+    path after `/3` and take precedence over the defaults:
+    configuration and genre lists are kept for a day, and `latest`,
+    account and authentication endpoints are never cached.
+
+    Responses are cached by their URL and parameters; the API key
+    is left out, so different keys share the same responses. An
+    expired response with an `ETag` is revalidated with
+    `If-None-Match` and, if TMDb answers "304 Not Modified", kept
+    for another `ttl` seconds without downloading it again.
+    """
+    global _cache, _ttl, _ttls
+    _cache = cache
+    _ttl = ttl
+    _ttls = list((ttls or {}).items()) + list(_DEFAULT_TTLS.items())
+
+
+def _ttl_for(url):
+    prefix = f"{URL.BASE}/{URL.V}"
+    if url.startswith(prefix):
+        path = url[len(prefix) :]
+    else:
+        path = urlsplit(url).path
+    for pattern, ttl in _ttls:
+        if fnmatchcase(path, pattern):
+            return ttl
+    return _ttl
+
+
+def _cache_key(url, params):
+    params = sorted((k, v) for k, v in params.items() if k != "api_key")
+    return f"{url}?{urlencode(params)}" if params else url
+
+
+def _flight_key(url, params):
+    # Unlike the cache key, it keeps the API key: callers with
+    # different keys must not share a response or an error.
+    return f"{url}?{urlencode(sorted(params.items()))}"
+
+
+def _cache_get(url, params):
+    """Return the cache key of a GET request, or `None` if its
+    response must not be cached, and the cached entry, if any."""
+    cache = _cache
+    if cache is None or _ttl_for(url) <= 0:
+        return None, None
+    key = _cache_key(url, params)
+    return key, cache.get(key)
+
+
+def _is_fresh(entry):
+    return entry is not None and entry.expires > time.time()
+
+
+def _revalidation_headers(entry):
+    if entry is not None and entry.etag:
+        return {"If-None-Match": entry.etag}
+    return {}
+
+
+def _cache_update(key, url, entry, response):
+    """Cache the response of a GET request and return its body.
+    A "304 Not Modified" response revalidates the cached entry."""
+    cache = _cache
+    if response.status == 304 and entry is not None:
+        if cache is not None:
+            cache.refresh(key, _ttl_for(url))
+        return entry.body
+    if key is not None and cache is not None:
+        etag = response.headers.get("ETag")
+        cache.set(key, response.body, _ttl_for(url), etag)
+    return response.body
+
+
+def _invalidate(url):
+    # A write changes the resource it is sent to, e.g. a POST to
+    # `/list/{id}/add_item` changes `/list/{id}`.
+    if _cache is None:
+        return
+    parent = url.rsplit("/", 1)[0]
+    _cache.invalidate(url)
+    if urlsplit(parent).path.count("/") > 1:
+        _cache.invalidate(parent)
+
+
+def _loads(body):
+    return json.loads(body.decode("utf-8"))
+
+
+def _send(method, url, params, body=None, headers=None):
+    headers = dict(headers or {})
+    if body is not None:
+        headers["content-type"] = "application/json"
+    url = f"{url}?{urlencode(params)}"
+    for attempt in count():
+        _limiter.acquire()
+        try:
+            response = _pool.request(method, url, body=body, headers=headers)
+        except HTTPError as error:
+            if error.code not in RETRY_STATUSES or attempt >= _limiter.retries:
+                raise
+            _limiter.pause(_limiter.retry_delay(error.headers, attempt))
+        else:
+            return response
+
+
+def _single_flight(key, function, *args):
+    """Return `function(*args)`, or, if a call with the same `key`
+    is already running in another thread, wait for its result
+    instead of calling `function` again."""
+    with _flights_lock:
+        flight = _flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = _flights[key] = Future()
+    if not leader:
+        return flight.result()
+    try:
+        result = function(*args)
+    except BaseException as error:
+        flight.set_exception(error)
+        raise
+    else:
+        flight.set_result(result)
+        return result
+    finally:
+        with _flights_lock:
+            del _flights[key]
+
+
+def _get_body(url, params):
+    key, entry = _cache_get(url, params)
+    if _is_fresh(entry):
+        return entry.body
+    headers = _revalidation_headers(entry)
+    response = _send("GET", url, params, headers=headers)
+    return _cache_update(key, url, entry, response)
 
 
 def GET(url, **params):
-    params = urlencode({**params})
-    with urlopen(f"{url}?{params}") as response:
-        return json.loads(response.read().decode("utf-8"))
+    # Identical requests sent at the same time by several threads
+    # share one response. Each caller decodes its own copy of the
+    # body, so callers never share mutable results.
+    key = _flight_key(url, params)
+    return _loads(_single_flight(key, _get_body, url, params))
+
 
+class Pages(Generator):
+    """Iterate over the results of a paginated endpoint.
 
-def GET_pages(url, params):
-    for page in range(1, GET_total_pages_for(url, params) + 1):
-        yield from GET(url, page=page, **params)["results"]
+    The first page is requested lazily, either on the first
+    iteration or when `total_pages` or `total_results` is read,
+    and is never requested twice.
+
+    If `prefetch` is greater than zero, up to `prefetch` upcoming
+    pages are requested concurrently in the background while the
+    current one is consumed. Results are still yielded in page
+    order.
+
+    If `item` is given, each result is passed to it and the
+    returned value is yielded instead, e.g. a `Movie` object."""
+
+    def __init__(self, url, params, prefetch=0, item=None):
+        self.url = url
+        self.params = params
+        self.prefetch = prefetch
+        self.item = item
+        self._first_page = None
+        self._results = self._iter_results()
+
+    @property
+    def first_page(self):
+        if self._first_page is None:
+            self._first_page = GET(self.url, page=1, **self.params)
+        return self._first_page
+
+    @property
+    def total_pages(self):
+        return self.first_page["total_pages"]
+
+    @property
+    def total_results(self):
+        return self.first_page["total_results"]
+
+    def send(self, value):
+        return self._results.send(value)
+
+    def throw(self, *args):
+        return self._results.throw(*args)
+
+    def close(self):
+        self._results.close()
+
+    def _get_page(self, page):
+        return GET(self.url, page=page, **self.params)
+
+    def _items(self, page):
+        if self.item is None:
+            return page["results"]
+        return map(self.item, page["results"])
+
+    def _iter_results(self):
+        yield from self._items(self.first_page)
+        pages = iter(range(2, self.total_pages + 1))
+        if self.prefetch <= 0:
+            for page in pages:
+                yield from self._items(self._get_page(page))
+            return
+        executor = ThreadPoolExecutor(max_workers=self.prefetch)
+        window = deque(
+            executor.submit(self._get_page, page)
+            for page in islice(pages, self.prefetch)
+        )
+        try:
+            while window:
+                results = self._items(window.popleft().result())
+                for page in islice(pages, 1):
+                    window.append(executor.submit(self._get_page, page))
+                yield from results
+        finally:
+            for future in window:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+
+def GET_pages(url, params, prefetch=0, item=None):
+    return Pages(url, params, prefetch, item)
 
 
 def POST(url, data, **params):
-    headers = {"content-type": "application/json"}
-    data = json.dumps(data).encode("utf-8")
-    params = urlencode(params)
-    request = Request(f"{url}?{params}", headers=headers, data=data)
-    with urlopen(request) as response:
-        return json.loads(response.read().decode("utf-8"))
+    body = json.dumps(data).encode("utf-8")
+    response = _send("POST", url, params, body)
+    _invalidate(url)
+    return _loads(response.body)
 
 
 def DELETE(url, data, **params):
-    headers = {"content-type": "application/json"}
-    data = json.dumps(data).encode("utf-8")
-    url = f"{url}?{urlencode(params)}"
-    request = Request(url, headers=headers, data=data, method="DELETE")
-    with urlopen(request) as response:
-        return json.loads(response.read().decode("utf-8"))
+    body = json.dumps(data).encode("utf-8")
+    response = _send("DELETE", url, params, body)
+    _invalidate(url)
+    return _loads(response.body)
@@ -0,0 +1,139 @@
+import datetime
+import json
+import os
+
+from . import _locale, _requests
+from . import _urls as URL
+from ._api import _imap_unordered
+from ._config import tmdb_api_key
+from .objects import Movie, Person, Show
+
+
+__all__ = ["Sync"]
+
+
+# TMDb returns the changes of at most 14 days per request.
+_MAX_WINDOW = datetime.timedelta(days=14)
+_ONE_DAY = datetime.timedelta(days=1)
+
+_FEEDS = {
+    "movie": (URL.MOVIE_CHANGE_LIST, Movie),
+    "tv": (URL.SHOW_CHANGE_LIST, Show),
+    "person": (URL.PERSON_CHANGE_LIST, Person),
+}
+
+
+class Sync:
+    """Keep a local copy of TMDb up to date with its changes feed.
+
+    The `path` argument is a JSON file where the last synced date
+    of each feed is saved. It is created on the first run.
+
+    The optional `kinds` argument is a list of the feeds to follow:
+    `"movie"`, `"tv"` or `"person"`. (Default: all of them)
+
+    The optional `workers` argument is the maximum number of
+    objects loaded at the same time. (Default: 8)
+    """
+
+    def __init__(self, path, *, kinds=tuple(_FEEDS), workers: int = 8):
+        unknown = [kind for kind in kinds if kind not in _FEEDS]
+        if unknown:
+            raise ValueError(f"unknown feeds: {', '.join(unknown)}")
+        self.path = path
+        self.kinds = tuple(kinds)
+        self.workers = workers
+
+    @property
+    def checkpoint(self):
+        """Return the last synced date of each feed."""
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                saved = json.load(file)
+        except FileNotFoundError:
+            return {}
+        return {
+            kind: datetime.datetime.strptime(day, "%Y-%m-%d").date()
+            for kind, day in saved.items()
+        }
+
+    def run(self, *, since=None, until=None):
+        """Yield `(object, error)` tuples for every movie, show or
+        person changed since the last run, feed after feed. The
+        objects of a feed are yielded as soon as they are loaded,
+        and only a few are loaded ahead of the consumer.
+
+        Each changed object is loaded again with `get_all()`, after
+        its cached responses and localized views are dropped. The
+        `error` is `None`, or the exception raised while loading
+        the object (for example, when it has been deleted).
+
+        The optional `since` argument is the date to start from
+        when a feed has never been synced. (Default: the day
+        before `until`)
+
+        The optional `until` argument is the last date to sync.
+        (Default: today)
+
+        The checkpoint of a feed is saved after all the objects of
+        a window of at most 14 days have been yielded, so a run
+        which is stopped early resumes from that window.
+        """
+        until = until or datetime.date.today()
+        checkpoint = self.checkpoint
+        for kind in self.kinds:
+            start = checkpoint.get(kind) or since or until - _ONE_DAY
+            seen = set()
+            for start, end in _windows(start, until):
+                yield from self._sync(kind, start, end, seen)
+                checkpoint[kind] = end
+                self._save(checkpoint)
+
+    def _sync(self, kind, start, end, seen):
+        url, Obj = _FEEDS[kind]
+        ids = [i for i in _changed_ids(url, start, end) if i not in seen]
+        seen.update(ids)
+        # Objects are built and loaded as workers become free, so
+        # a slow consumer holds only a few loaded objects at once.
+        objects = (Obj._shared(tmdb_id) for tmdb_id in ids)
+        yield from _imap_unordered(_refresh, objects, self.workers)
+
+    def _save(self, checkpoint):
+        saved = {kind: day.isoformat() for kind, day in checkpoint.items()}
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(saved, file)
+        os.replace(temporary, self.path)
+
+
+def _windows(start, until):
+    """Split the dates from `start` to `until` into windows the
+    changes feed accepts."""
+    while True:
+        end = min(start + _MAX_WINDOW, until)
+        yield start, end
+        if end >= until:
+            return
+        start = end
+
+
+def _changed_ids(url, start, end):
+    params = {
+        "api_key": tmdb_api_key(),
+        "start_date": start.isoformat(),
+        "end_date": end.isoformat(),
+    }
+    pages = _requests.GET_pages(url, params)
+    return list(dict.fromkeys(item["id"] for item in pages))
+
+
+def _refresh(obj):
+    cache = _requests._cache
+    if cache is not None:
+        cache.invalidate(obj._details_url)
+    _locale._forget(type(obj), obj._details_url)
+    try:
+        obj.get_all()
+    except Exception as error:  # pylint: disable=W0703
+        return obj, error
+    return obj, None
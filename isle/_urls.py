@@ -56,6 +56,7 @@ MOVIE_GET_POPULAR = f"{BASE}/{V}/movie/popular"
 MOVIE_GET_NOW_PLAYING = f"{BASE}/{V}/movie/now_playing"
 MOVIE_GET_TOP_RATED = f"{BASE}/{V}/movie/top_rated"
 MOVIE_GET_UPCOMING = f"{BASE}/{V}/movie/upcoming"
+MOVIE_CHANGE_LIST = f"{BASE}/{V}/movie/changes"
 
 MOVIE_DETAILS = f"{BASE}/{V}/movie/{{movie_id}}"
 MOVIE_ALTERNATIVE_TITLES = f"{MOVIE_DETAILS}/alternative_titles"
@@ -95,6 +96,7 @@ SHOW_GET_AIRING_TODAY = f"{BASE}/{V}/tv/airing_today"
 SHOW_GET_ON_THE_AIR = f"{BASE}/{V}/tv/on_the_air"
 SHOW_GET_POPULAR = f"{BASE}/{V}/tv/popular"
 SHOW_GET_TOP_RATED = f"{BASE}/{V}/tv/top_rated"
+SHOW_CHANGE_LIST = f"{BASE}/{V}/tv/changes"
 
 SHOW_DETAILS = f"{BASE}/{V}/tv/{{show_id}}"
 SHOW_ALTERNATIVE_TITLES = f"{SHOW_DETAILS}/alternative_titles"
@@ -132,6 +134,7 @@ ALL_SHOW_SECOND_SUFFIXES = [
 
 PERSON_GET_POPULAR = f"{BASE}/{V}/person/popular"
 PERSON_GET_LATEST = f"{BASE}/{V}/person/latest"
+PERSON_CHANGE_LIST = f"{BASE}/{V}/person/changes"
 
 PERSON_DETAILS = f"{BASE}/{V}/person/{{person_id}}"
 PERSON_CHANGES = f"{PERSON_DETAILS}/changes"
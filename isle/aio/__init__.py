@@ -0,0 +1,9 @@
+"""An asyncio interface to The Movie Database API"""
+from .objects import *
+from ._api import *
+from ._requests import *
+
+
+__all__ = (
+    _api.__all__ + objects.__all__ + _requests.__all__
+)  # pylint: disable=E0602
@@ -0,0 +1,251 @@
+import asyncio
+
+from isle import _registry as REGISTRY
+from isle import _urls as URL
+from isle._api import _find_results, _media, _shared
+from isle._config import tmdb_api_key
+from isle.objects import Country, Genre, Language
+
+from ._requests import GET, GET_pages
+from .objects import Company, Episode, Keyword, Movie, Person, Season, Show
+
+
+__all__ = [
+    "search_movie",
+    "search_show",
+    "search_person",
+    "search_company",
+    "search_keyword",
+    "multi_search",
+    "discover_movies",
+    "discover_shows",
+    "find",
+    "get_movie_certifications",
+    "get_show_certifications",
+    "get_movie_genres",
+    "get_show_genres",
+    "get_image_configurations",
+    "get_countries",
+    "get_jobs",
+    "get_languages",
+    "get_primary_translations",
+    "get_timezones",
+    "load_reference_data",
+]
+
+
+def search_movie(query: str, *, prefetch: int = 0, **kwargs):
+    """Search for movies. See `isle.search_movie`.
+
+    Returns an asynchronous generator with awaitable
+    `total_pages` and `total_results` attributes. Each item is a
+    `Movie` object."""
+    params = {"query": query, "api_key": tmdb_api_key(), **kwargs}
+    return GET_pages(
+        URL.SEARCH_MOVIE, params, prefetch, _shared(Movie, params)
+    )
+
+
+def search_show(query: str, *, prefetch: int = 0, **kwargs):
+    """Search for TV shows. See `isle.search_show`.
+
+    Returns an asynchronous generator with awaitable
+    `total_pages` and `total_results` attributes. Each item is a
+    `Show` object."""
+    params = {"query": query, "api_key": tmdb_api_key(), **kwargs}
+    return GET_pages(URL.SEARCH_SHOW, params, prefetch, _shared(Show, params))
+
+
+def search_person(query: str, *, prefetch: int = 0, **kwargs):
+    """Search for people. See `isle.search_person`.
+
+    Returns an asynchronous generator with awaitable
+    `total_pages` and `total_results` attributes. Each item is a
+    `Person` object."""
+    params = {"query": query, "api_key": tmdb_api_key(), **kwargs}
+    return GET_pages(
+        URL.SEARCH_PERSON, params, prefetch, _shared(Person, params)
+    )
+
+
+def search_company(query: str, *, prefetch: int = 0, **kwargs):
+    """Search for companies. See `isle.search_company`.
+
+    Returns an asynchronous generator with awaitable
+    `total_pages` and `total_results` attributes. Each item is a
+    `Company` object."""
+    params = {"query": query, "api_key": tmdb_api_key(), **kwargs}
+    return GET_pages(
+        URL.SEARCH_COMPANY, params, prefetch, _shared(Company, params)
+    )
+
+
+def search_keyword(query: str, *, prefetch: int = 0, **kwargs):
+    """Search for keywords. See `isle.search_keyword`.
+
+    Returns an asynchronous generator with awaitable
+    `total_pages` and `total_results` attributes. Each item is a
+    `Keyword` object."""
+    params = {"query": query, "api_key": tmdb_api_key(), **kwargs}
+    return GET_pages(
+        URL.SEARCH_KEYWORD, params, prefetch, _shared(Keyword, params)
+    )
+
+
+def multi_search(query: str, *, prefetch: int = 0, **kwargs):
+    """Search for movies, TV shows and people in a single request.
+    See `isle.multi_search`.
+
+    Returns an asynchronous generator with awaitable
+    `total_pages` and `total_results` attributes. Each element
+    is either a `Movie`, or a `Show`, or a `Person` object."""
+    params = {"query": query, "api_key": tmdb_api_key(), **kwargs}
+    return GET_pages(
+        URL.MULTI_SEARCH,
+        params,
+        prefetch,
+        _media({"tv": Show, "movie": Movie, "person": Person}, params),
+    )
+
+
+def discover_movies(options: dict, *, prefetch: int = 0):
+    """Discover movies. See `isle.discover_movies`.
+
+    Returns an asynchronous generator with awaitable
+    `total_pages` and `total_results` attributes. Each item is a
+    `Movie` object."""
+    params = {"api_key": tmdb_api_key(), **options}
+    return GET_pages(
+        URL.DISCOVER_MOVIES, params, prefetch, _shared(Movie, params)
+    )
+
+
+def discover_shows(options: dict, *, prefetch: int = 0):
+    """Discover TV shows. See `isle.discover_shows`.
+
+    Returns an asynchronous generator with awaitable
+    `total_pages` and `total_results` attributes. Each item is a
+    `Show` object."""
+    params = {"api_key": tmdb_api_key(), **options}
+    return GET_pages(
+        URL.DISCOVER_SHOWS, params, prefetch, _shared(Show, params)
+    )
+
+
+async def find(external_id: str, *, src: str, **options):
+    """Search for objects by an external id. See `isle.find`."""
+    params = {"api_key": tmdb_api_key(), "external_source": src, **options}
+    response = await GET(URL.FIND.format(external_id=external_id), **params)
+    return _find_results(
+        response, Movie, Show, Person, Season, Episode, params.get("language")
+    )
+
+
+async def get_movie_certifications(country=None):
+    """Get an up to date list of the officially supported
+    movie certifications on TMDb."""
+    res = (await GET(URL.MOVIE_CERTIFICATION, api_key=tmdb_api_key()))[
+        "certifications"
+    ]
+    return res[country] if country else res
+
+
+async def get_show_certifications(country=None):
+    """Get an up to date list of the officially supported TV
+    show certifications on TMDb."""
+    res = (await GET(URL.SHOW_CERTIFICATION, api_key=tmdb_api_key()))[
+        "certifications"
+    ]
+    return res[country] if country else res
+
+
+async def get_movie_genres(objects=False):
+    """Get the list of official genres for movies."""
+    genres = (await GET(URL.MOVIE_GENRES, api_key=tmdb_api_key()))["genres"]
+    if objects:
+        return [Genre(tmdb_id=g["id"], name=g["name"]) for g in genres]
+    else:
+        return genres
+
+
+async def get_show_genres(objects=False):
+    """Get the list of official genres for TV shows."""
+    genres = (await GET(URL.SHOW_GENRES, api_key=tmdb_api_key()))["genres"]
+    if objects:
+        return [Genre(tmdb_id=g["id"], name=g["name"]) for g in genres]
+    else:
+        return genres
+
+
+async def get_image_configurations():
+    """Get the data relevant to building image URLs as well
+    as the change key map."""
+    return await GET(URL.IMAGE_CONFIGURATION, api_key=tmdb_api_key())
+
+
+async def get_countries(objects=False):
+    """Get the list of countries (ISO 3166-1 tags) used
+    throughout TMDb."""
+    countries = await GET(URL.COUNTRIES_CONFIGURATION, api_key=tmdb_api_key())
+    if objects:
+        return [Country(**c) for c in countries]
+    else:
+        return countries
+
+
+async def get_jobs():
+    """Get a list of the jobs and departments we use on
+    TMDb."""
+    return await GET(URL.JOBS_CONFIGURATION, api_key=tmdb_api_key())
+
+
+async def get_languages(objects=False):
+    """Get the list of languages (ISO 639-1 tags) used
+    throughout TMDb."""
+    languages = await GET(URL.LANGUAGES_CONFIGURATION, api_key=tmdb_api_key())
+    if objects:
+        return [
+            Language(
+                iso_639_1=l["iso_639_1"],
+                english_name=l["english_name"],
+                original_name=l["name"],
+            )
+            for l in languages
+        ]
+    else:
+        return languages
+
+
+async def get_primary_translations():
+    """Get a list of the officially supported translations
+    on TMDb."""
+    return await GET(
+        URL.PRIMARY_TRANSLATIONS_CONFIGURATION, api_key=tmdb_api_key()
+    )
+
+
+async def get_timezones():
+    """Get the list of timezones used throughout TMDb."""
+    return await GET(URL.TIMEZONES_CONFIGURATION, api_key=tmdb_api_key())
+
+
+async def load_reference_data(*tables):
+    """Download the reference data shared by all objects: the
+    languages, countries, genres and image configuration. See
+    `isle.refresh_reference_data`.
+
+    Inside an event loop, properties which need them (such as
+    `genres`, `languages` or `Image.url`) never request them, and
+    raise a `RuntimeError` until they are loaded. If no table is
+    given, all tables are downloaded, concurrently."""
+    registry = REGISTRY._registry
+    registry.check(tables)
+    names = tables or list(registry._sources)
+    responses = await asyncio.gather(
+        *(
+            GET(registry._sources[name][0], api_key=tmdb_api_key())
+            for name in names
+        )
+    )
+    for name, response in zip(names, responses):
+        registry.store(name, response)
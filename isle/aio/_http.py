@@ -0,0 +1,199 @@
+import asyncio
+import gzip
+import http.client
+import ssl
+from io import BytesIO
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlsplit
+
+from isle._http import _IDEMPOTENT_METHODS, Response, _proxy
+
+
+# Errors that mean a kept-alive connection was closed by the
+# server while it was idle in the pool.
+_STALE_CONNECTION_ERRORS = (
+    ConnectionError,
+    asyncio.IncompleteReadError,
+    http.client.BadStatusLine,
+)
+
+
+class AsyncConnectionPool:
+    """A pool of HTTP/1.1 keep-alive connections for asyncio.
+
+    At most `limit` connections are open to a host at the same
+    time; other requests wait until a connection is released. A
+    connection which has been idle for more than `idle_timeout`
+    seconds is closed instead of being reused.
+
+    Proxies are not supported: a request to a host which the
+    environment sends through a proxy raises a `URLError`."""
+
+    def __init__(self, limit=10, idle_timeout=60.0, timeout=30.0):
+        self.limit = limit
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self._loop = None
+        self._idle = {}
+        self._semaphores = {}
+        self._ssl_context = None
+
+    async def request(self, method, url, body=None, headers=None):
+        """Send a request and return a `Response`. Raises
+        `HTTPError` if the status code is 400 or greater and
+        `URLError` if the server is unreachable."""
+        self._check_loop()
+        parts = urlsplit(url)
+        if _proxy(parts) is not None:
+            raise URLError(
+                f"isle.aio cannot reach {parts.hostname} through a proxy, "
+                "use the synchronous API or exclude it with NO_PROXY"
+            )
+        key = (parts.scheme, parts.hostname, parts.port)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        headers = {
+            "Host": parts.netloc,
+            "Accept-Encoding": "gzip",
+            "Connection": "keep-alive",
+            **(headers or {}),
+        }
+        if body is not None:
+            headers["Content-Length"] = str(len(body))
+        head = "".join(
+            [f"{method} {target} HTTP/1.1\r\n"]
+            + [f"{name}: {value}\r\n" for name, value in headers.items()]
+            + ["\r\n"]
+        )
+        message = head.encode("latin-1") + (body or b"")
+        if key not in self._semaphores:
+            self._semaphores[key] = asyncio.Semaphore(self.limit)
+        async with self._semaphores[key]:
+            response, _ = await self._exchange(key, method, message)
+        if response.headers.get("Content-Encoding") == "gzip":
+            response = response._replace(body=gzip.decompress(response.body))
+        if response.status >= 400:
+            raise HTTPError(
+                url,
+                response.status,
+                http.client.responses.get(response.status, ""),
+                response.headers,
+                BytesIO(response.body),
+            )
+        return response
+
+    def clear(self):
+        """Close all idle connections."""
+        idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for _, writer, _ in conns:
+                writer.close()
+
+    async def _exchange(self, key, method, message):
+        try:
+            conn, reused = await self._get_conn(key)
+        except (OSError, asyncio.TimeoutError) as error:
+            raise URLError(error)
+        try:
+            try:
+                result = await self._send(conn, method, message)
+            except _STALE_CONNECTION_ERRORS:
+                conn[1].close()
+                if not reused or method not in _IDEMPOTENT_METHODS:
+                    raise
+                conn = await self._new_conn(key)
+                result = await self._send(conn, method, message)
+        except BaseException as error:
+            conn[1].close()
+            if isinstance(error, (OSError, asyncio.TimeoutError)):
+                raise URLError(error)
+            raise
+        response, will_close = result
+        if will_close:
+            conn[1].close()
+        else:
+            loop = asyncio.get_event_loop()
+            self._idle.setdefault(key, []).append((*conn, loop.time()))
+        return result
+
+    async def _send(self, conn, method, message):
+        reader, writer = conn
+        writer.write(message)
+        return await asyncio.wait_for(
+            self._read_response(reader, method), self.timeout
+        )
+
+    async def _read_response(self, reader, method):
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Remote end closed connection")
+        try:
+            version, status, *_ = status_line.decode("latin-1").split()
+            status = int(status)
+        except ValueError:
+            raise http.client.BadStatusLine(status_line)
+        lines = []
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            lines.append(line)
+        headers = http.client.parse_headers(BytesIO(b"".join(lines)))
+        will_close = (
+            version == "HTTP/1.0"
+            or headers.get("Connection", "").lower() == "close"
+        )
+        if method == "HEAD" or status in (204, 304) or status < 200:
+            body = b""
+        elif headers.get("Transfer-Encoding", "").lower() == "chunked":
+            body = await self._read_chunked(reader)
+        elif headers.get("Content-Length") is not None:
+            body = await reader.readexactly(int(headers["Content-Length"]))
+        else:
+            body, will_close = await reader.read(), True
+        return Response(status, headers, body), will_close
+
+    async def _read_chunked(self, reader):
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+        while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+            pass
+        return b"".join(chunks)
+
+    async def _get_conn(self, key):
+        now = asyncio.get_event_loop().time()
+        conns = self._idle.get(key, [])
+        while conns:
+            reader, writer, last_used = conns.pop()
+            if now - last_used > self.idle_timeout or reader.at_eof():
+                writer.close()
+            else:
+                return (reader, writer), True
+        return await self._new_conn(key), False
+
+    async def _new_conn(self, key):
+        scheme, host, port = key
+        if scheme == "https":
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            port, context = port or 443, self._ssl_context
+        else:
+            port, context = port or 80, None
+        return await asyncio.wait_for(
+            asyncio.open_connection(host, port, ssl=context), self.timeout
+        )
+
+    def _check_loop(self):
+        # Streams belong to the loop they were opened in, so the
+        # pool starts over when it is used from a new event loop.
+        loop = asyncio.get_event_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._idle = {}
+            self._semaphores = {}
@@ -0,0 +1,196 @@
+import asyncio
+import json
+from collections import deque
+from collections.abc import AsyncGenerator
+from itertools import count, islice
+from urllib.error import HTTPError
+from urllib.parse import urlencode
+
+from isle import _requests
+from isle._cache import MemoryCache
+from isle._ratelimit import RETRY_STATUSES
+
+from ._http import AsyncConnectionPool
+
+
+__all__ = ["configure_pool"]
+
+
+_pool = AsyncConnectionPool()
+
+# The GET requests being sent, by event loop and request.
+_flights = {}
+
+
+def configure_pool(*, limit=None, idle_timeout=None, timeout=None):
+    """Configure the connection pool shared by all asynchronous
+    requests to TMDb.
+
+    The optional `limit` argument is the maximum number of
+    connections open to a host at the same time. Requests above
+    the limit wait for a free connection. (Default: 10)
+
+    The optional `idle_timeout` argument is the number of seconds
+    after which an idle connection is closed. (Default: 60)
+
+    The optional `timeout` argument is the timeout of a single
+    request in seconds. (Default: 30)
+    """
+    if limit is not None:
+        _pool.limit = limit
+        _pool._semaphores = {}
+    if idle_timeout is not None:
+        _pool.idle_timeout = idle_timeout
+    if timeout is not None:
+        _pool.timeout = timeout
+
+
+async def _send(method, url, params, body=None, headers=None):
+    headers = dict(headers or {})
+    if body is not None:
+        headers["content-type"] = "application/json"
+    url = f"{url}?{urlencode(params)}"
+    for attempt in count():
+        # The rate limit is shared with the synchronous API.
+        limiter = _requests._limiter
+        delay = limiter.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        try:
+            response = await _pool.request(
+                method, url, body=body, headers=headers
+            )
+        except HTTPError as error:
+            if error.code not in RETRY_STATUSES or attempt >= limiter.retries:
+                raise
+            limiter.pause(limiter.retry_delay(error.headers, attempt))
+        else:
+            return response
+
+
+async def _cached(function, *args):
+    # The cache is shared with the synchronous API. Its backends
+    # block (`SQLiteCache` may wait for a lock), so all but the
+    # in-memory one run in a thread instead of in the event loop.
+    cache = _requests._cache
+    if cache is None or isinstance(cache, MemoryCache):
+        return function(*args)
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, function, *args)
+
+
+async def _get_body(url, params):
+    key, entry = await _cached(_requests._cache_get, url, params)
+    if _requests._is_fresh(entry):
+        return entry.body
+    headers = _requests._revalidation_headers(entry)
+    response = await _send("GET", url, params, headers=headers)
+    return await _cached(_requests._cache_update, key, url, entry, response)
+
+
+async def GET(url, **params):
+    # Identical requests awaited at the same time in an event loop
+    # share one response. The shared task is shielded, so a
+    # cancelled caller does not cancel it for the others.
+    key = (asyncio.get_event_loop(), _requests._flight_key(url, params))
+    flight = _flights.get(key)
+    if flight is None:
+        flight = _flights[key] = asyncio.ensure_future(_get_body(url, params))
+        flight.add_done_callback(lambda _: _flights.pop(key, None))
+    return _requests._loads(await asyncio.shield(flight))
+
+
+class Pages(AsyncGenerator):
+    """Iterate asynchronously over the results of a paginated
+    endpoint. See `isle._requests.Pages`.
+
+    The first page is requested on the first iteration, or when
+    `total_pages` or `total_results` is awaited, and is never
+    requested twice."""
+
+    def __init__(self, url, params, prefetch=0, item=None):
+        self.url = url
+        self.params = params
+        self.prefetch = prefetch
+        self.item = item
+        self._first_page = None
+        self._results = self._iter_results()
+
+    @property
+    def total_pages(self):
+        """An awaitable of the number of pages."""
+        return self._total("total_pages")
+
+    @property
+    def total_results(self):
+        """An awaitable of the number of results."""
+        return self._total("total_results")
+
+    def asend(self, value):
+        return self._results.asend(value)
+
+    def athrow(self, *args):
+        return self._results.athrow(*args)
+
+    def aclose(self):
+        return self._results.aclose()
+
+    async def _get_first_page(self):
+        if self._first_page is None:
+            self._first_page = asyncio.ensure_future(
+                GET(self.url, page=1, **self.params)
+            )
+        return await self._first_page
+
+    async def _total(self, key):
+        return (await self._get_first_page())[key]
+
+    def _get_page(self, page):
+        return asyncio.ensure_future(GET(self.url, page=page, **self.params))
+
+    def _items(self, page):
+        if self.item is None:
+            return page["results"]
+        return map(self.item, page["results"])
+
+    async def _iter_results(self):
+        first_page = await self._get_first_page()
+        for item in self._items(first_page):
+            yield item
+        pages = iter(range(2, first_page["total_pages"] + 1))
+        if self.prefetch <= 0:
+            for page in pages:
+                for item in self._items(await self._get_page(page)):
+                    yield item
+            return
+        window = deque(
+            self._get_page(page) for page in islice(pages, self.prefetch)
+        )
+        try:
+            while window:
+                results = self._items(await window.popleft())
+                for page in islice(pages, 1):
+                    window.append(self._get_page(page))
+                for item in results:
+                    yield item
+        finally:
+            for future in window:
+                future.cancel()
+
+
+def GET_pages(url, params, prefetch=0, item=None):
+    return Pages(url, params, prefetch, item)
+
+
+async def POST(url, data, **params):
+    body = json.dumps(data).encode("utf-8")
+    response = await _send("POST", url, params, body)
+    await _cached(_requests._invalidate, url)
+    return _requests._loads(response.body)
+
+
+async def DELETE(url, data, **params):
+    body = json.dumps(data).encode("utf-8")
+    response = await _send("DELETE", url, params, body)
+    await _cached(_requests._invalidate, url)
+    return _requests._loads(response.body)
@@ -0,0 +1,131 @@
+from isle import objects
+from isle import _registry as REGISTRY
+from isle import _urls as URL
+from isle._config import tmdb_api_key
+
+from ._requests import GET, GET_pages
+
+
+__all__ = [
+    "Movie",
+    "Show",
+    "Person",
+    "Season",
+    "Episode",
+    "Company",
+    "Keyword",
+]
+
+
+class _Async:
+    """Makes `get_details` and `get_all` coroutines.
+
+    Properties never make requests: reading a property which
+    needs data that is not loaded yet raises a `RuntimeError`, and
+    so does reading one which needs reference data before
+    `isle.aio.load_reference_data()`. Objects returned by
+    properties (such as the people in `Movie.cast`) are regular
+    synchronous objects."""
+
+    __slots__ = ()
+
+    _reference = staticmethod(REGISTRY._loaded_table)
+
+    def _init(self):
+        raise RuntimeError(
+            f"{self!r} has no such data loaded, "
+            "await `get_all()` or `get_details()` first"
+        )
+
+    def _load(self, key):
+        self._init()
+
+    async def _async_request(self, url: str, **params):
+        self.n_requests += 1
+        return await GET(url, **{"api_key": tmdb_api_key(), **params})
+
+    async def get_all(self, append=None, **params):
+        """Get all information in a single request.
+
+        The optional `append` argument is a list of the
+        sub-resources to include, such as `["credits"]`.
+        (Default: `default_append`)"""
+        append = self._append(append)
+        if append:
+            params = {"append_to_response": append, **params}
+        all_data = await self.get_details(**params)
+        self.data.update(all_data)
+        self._mark_appended(params)
+        return all_data
+
+    async def get_details(self, **params):
+        """Get the primary information."""
+        details = await self._async_request(self._details_url, **params)
+        self.data.update(details)
+        return details
+
+
+class Movie(_Async, objects.Movie):
+    """Represents a movie."""
+
+    __slots__ = ()
+
+
+class Show(_Async, objects.Show):
+    """Represents a TV show."""
+
+    __slots__ = ()
+
+    async def get_seasons(self, **params):
+        """Get all the seasons of a TV show with their episodes,
+        loading the details first if needed. Up to 20 seasons are
+        appended to each request. Returns a list of the seasons'
+        details."""
+        if "seasons" not in self.data:
+            await self.get_details(**params)
+        seasons = []
+        for keys, request in self._season_requests(params):
+            details = await self.get_details(**request)
+            seasons.extend(details[key] for key in keys if key in details)
+        return seasons
+
+
+class Person(_Async, objects.Person):
+    """Represents a person."""
+
+    __slots__ = ()
+
+
+class Season(_Async, objects.Season):
+    """Represents a TV show season."""
+
+    __slots__ = ()
+
+
+class Episode(_Async, objects.Episode):
+    """Represents a TV show episode."""
+
+    __slots__ = ()
+
+
+class Company(_Async, objects.Company):
+    """Represents a company."""
+
+    __slots__ = ()
+
+
+class Keyword(_Async, objects.Keyword):
+    """Represents a keyword."""
+
+    __slots__ = ()
+
+    def iter_movies(self, *, prefetch=0, **params):
+        """Get the movies that belong to a keyword. Returns an
+        asynchronous generator."""
+        self.n_requests += 1
+        return GET_pages(
+            URL.KEYWORD_MOVIES.format(keyword_id=self.tmdb_id),
+            {"api_key": tmdb_api_key(), **params},
+            prefetch,
+            lambda item: Movie._shared(item["id"], item),
+        )
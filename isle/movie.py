@@ -26,19 +26,19 @@ def get_popular(**kwargs):
     """Get the popular movies on TMDb. This list
     updates daily.
 
-    Returns a generator. Each item is a `Movie` object."""
+    Returns a generator with `total_pages` and `total_results`
+    attributes. Each item is a `Movie` object."""
     params = {"api_key": tmdb_api_key(), **kwargs}
-    for item in GET_pages(URL.MOVIE_GET_POPULAR, params):
-        yield Movie(item["id"], **item)
+    return GET_pages(URL.MOVIE_GET_POPULAR, params, item=_movie)
 
 
 def get_top_rated(**kwargs):
     """Get the top rated movies on TMDb.
 
-    Returns a generator. Each item is a `Movie` object."""
+    Returns a generator with `total_pages` and `total_results`
+    attributes. Each item is a `Movie` object."""
     params = {"api_key": tmdb_api_key(), **kwargs}
-    for item in GET_pages(URL.MOVIE_GET_TOP_RATED, params):
-        yield Movie(item["id"], **item)
+    return GET_pages(URL.MOVIE_GET_TOP_RATED, params, item=_movie)
 
 
 def get_now_playing(**kwargs):
@@ -48,10 +48,10 @@ def get_now_playing(**kwargs):
     the search to only look for theatrical release dates within the
     specified country.
 
-    Returns a generator. Each item is a `Movie` object."""
+    Returns a generator with `total_pages` and `total_results`
+    attributes. Each item is a `Movie` object."""
     params = {"api_key": tmdb_api_key(), **kwargs}
-    for item in GET_pages(URL.MOVIE_GET_NOW_PLAYING, params):
-        yield Movie(item["id"], **item)
+    return GET_pages(URL.MOVIE_GET_NOW_PLAYING, params, item=_movie)
 
 
 def get_upcoming(**kwargs):
@@ -61,7 +61,11 @@ def get_upcoming(**kwargs):
     the search to only look for theatrical release dates within
     the specified country.
 
-    Returns a generator. Each item is a `Movie` object."""
+    Returns a generator with `total_pages` and `total_results`
+    attributes. Each item is a `Movie` object."""
     params = {"api_key": tmdb_api_key(), **kwargs}
-    for item in GET_pages(URL.MOVIE_GET_UPCOMING, params):
-        yield Movie(item["id"], **item)
+    return GET_pages(URL.MOVIE_GET_UPCOMING, params, item=_movie)
+
+
+def _movie(item):
+    return Movie(item["id"], **item)
@@ -1,10 +1,15 @@
-import copy
+import threading
 from abc import ABC, abstractmethod
+from sys import intern
 from typing import NamedTuple, Iterator, List, Optional, Tuple
 from operator import itemgetter
 
+import isle._identity as IDENTITY
+import isle._registry as REGISTRY
 import isle._urls as URL
 from isle._config import tmdb_api_key
+from isle._frozen import freeze, thaw, unwrap
+from isle._memo import Data, memoized_property
 from isle._requests import DELETE, GET, POST, GET_pages
 
 
@@ -32,9 +37,52 @@ def __dir__(name):
     return sorted(__all__)
 
 
+# TMDb appends at most 20 sub-resources to a request.
+_MAX_APPENDS = 20
+
+# Guards the creation of the objects' loading locks.
+_locks_lock = threading.Lock()
+
+
+def _payload(kwargs):
+    # Objects built from the data of other objects share it
+    # instead of holding read-only views of it. Keys are interned,
+    # so objects built from different responses share them too.
+    return {intern(key): unwrap(value) for key, value in kwargs.items()}
+
+
 class TMDb(ABC):
+    __slots__ = (
+        "data",
+        "tmdb_id",
+        "n_requests",
+        "_memo",
+        "_loaded",
+        "_lock",
+        "__weakref__",
+    )
+
+    # The sub-resources which can be appended to the details.
+    _all_suffixes = ()
+
+    # The sub-resources which are requested on their own when a
+    # property needs them and they are not loaded yet.
+    _routes = ()
+
+    # The sub-resources `get_all()` appends when it is called
+    # without `append`. `None` means all of them.
+    default_append = None
+
+    # The number of loaded sub-resources after which a missing key
+    # loads all the missing data with `get_all()` instead of the
+    # smallest request. `None` means never.
+    get_all_after = 2
+
+    # Returns a table of the reference data shared by all objects.
+    _reference = staticmethod(REGISTRY._table)
+
     def __init__(self, tmdb_id: int, **kwargs):
-        self.data = {"id": tmdb_id, **kwargs}
+        self.data = Data({"id": tmdb_id, **_payload(kwargs)})
         self.tmdb_id = self.data["id"]
         self.n_requests = 0
 
@@ -42,18 +90,133 @@ class TMDb(ABC):
     def _init(self):
         pass
 
+    @classmethod
+    def _shared(cls, tmdb_id, payload=(), language=None):
+        """Return the object for `tmdb_id` from the identity map,
+        or a new object built from `payload`."""
+        return IDENTITY.lookup(cls, tmdb_id, dict(payload), language)
+
+    def _merge(self, payload):
+        """Add the fields of `payload` which are not loaded yet."""
+        missing = {k: v for k, v in payload.items() if k not in self.data}
+        if missing:
+            self.data.update(_payload(missing))
+
+    def _is_stale(self):
+        """Return `True` if the loaded data is known to be out of
+        date, so memoized properties must be computed again."""
+        return False
+
     def _getdata(self, key):
+        """Return the value under `key`, loading it first if
+        needed. Dicts and lists are returned as read-only views
+        instead of copies."""
         if key not in self.data:
+            # Threads reading the same missing key wait for the
+            # first one to load it instead of loading it again.
+            with self._loading_lock():
+                if key not in self.data:
+                    self._load(key)
+        return freeze(self.data[key])
+
+    def _loading_lock(self):
+        """Return the lock held while the object loads missing
+        data. It is created on first use."""
+        try:
+            return self._lock
+        except AttributeError:
+            with _locks_lock:
+                if not hasattr(self, "_lock"):
+                    self._lock = threading.RLock()
+            return self._lock
+
+    def _load(self, key):
+        """Load the data under `key` with the smallest request: its
+        own sub-resource if it has one, otherwise the details.
+
+        Once `get_all_after` sub-resources are loaded, the object
+        is likely to need more of them, so all the missing data is
+        loaded with `get_all()` instead.
+
+        Nothing is requested if the data under `key` comes from a
+        response which is already loaded, since the key is then
+        known to be missing from it."""
+        resource = key if key in self._routes else "details"
+        if resource in self._loaded_resources():
+            return
+        if self._all_suffixes and self._needs_all():
+            append = self._missing()
+            if key in self._all_suffixes and key not in append:
+                append.append(key)
+            self.get_all(append)
+        elif key in self._routes:
+            self.data[key] = self._request(f"{self._details_url}/{key}")
+        elif self._all_suffixes:
+            self.get_details()
+        else:
             self._init()
-        return copy.deepcopy(self.data[key])
+        self._mark_loaded(resource)
+
+    def _loaded_resources(self):
+        """Return the names of the loaded responses: `"details"` and
+        the names of the sub-resources."""
+        return getattr(self, "_loaded", frozenset())
+
+    def _mark_loaded(self, *resources):
+        self._loaded = self._loaded_resources().union(resources)
+
+    def _needs_all(self):
+        after = self.get_all_after
+        if after is None:
+            return False
+        return sum(key in self.data for key in self._routes) >= after
+
+    def _append(self, append):
+        """Return the `append_to_response` parameter for the
+        sub-resources in `append`."""
+        if append is None:
+            append = self.default_append
+        if append is None:
+            append = self._all_suffixes
+        unknown = [key for key in append if key not in self._all_suffixes]
+        if unknown:
+            raise ValueError(
+                f"{type(self).__name__} has no sub-resources "
+                f"{', '.join(unknown)}"
+            )
+        return ",".join(append)
+
+    def _missing(self):
+        """Return the sub-resources `get_all` appends by default
+        which are not loaded yet."""
+        append = self.default_append
+        if append is None:
+            append = self._all_suffixes
+        return [key for key in append if key not in self.data]
+
+    def _get_all(self, append, **params):
+        append = self._append(append)
+        if append:
+            params = {"append_to_response": append, **params}
+        all_data = self.get_details(**params)
+        self.data.update(all_data)
+        self._mark_appended(params)
+        return all_data
+
+    def _mark_appended(self, params):
+        append = params.get("append_to_response")
+        appended = append.split(",") if append else ()
+        self._mark_loaded("details", *appended)
 
     def _request(self, url: str, **params):
         self.n_requests += 1
         return GET(url, **{"api_key": tmdb_api_key(), **params})
 
-    def _iter_request(self, url: str, **params):
+    def _iter_request(self, url: str, prefetch: int = 0, item=None, **params):
         self.n_requests += 1
-        return GET_pages(url, {"api_key": tmdb_api_key(), **params})
+        return GET_pages(
+            url, {"api_key": tmdb_api_key(), **params}, prefetch, item
+        )
 
     def _post_request(self, url, data, **params):
         params = {"api_key": tmdb_api_key(), **params}
@@ -67,17 +230,6 @@ class TMDb(ABC):
         self.n_requests += 1
         return request
 
-    def _get_all_languages(self):
-        data = self._request(
-            URL.LANGUAGES_CONFIGURATION, **{"api_key": tmdb_api_key()}
-        )
-        languages = {}
-        for item in data:
-            iso_639_1 = item["iso_639_1"]
-            del item["iso_639_1"]
-            languages[iso_639_1] = item
-        return languages
-
     def __repr__(self):
         return f"{type(self).__name__}({self.tmdb_id})"
 
@@ -90,6 +242,8 @@ class TMDb(ABC):
 class Account(TMDb):
     """Represents an user account."""
 
+    __slots__ = ("_token", "_session")
+
     class _Token(NamedTuple):
         id: str
         expires_at: str
@@ -105,7 +259,7 @@ class Account(TMDb):
         pass
 
     def __init__(self):
-        self.data = {}
+        self.data = Data()
         self._token = None
         self._session = None
         self.n_requests = 0
@@ -214,84 +368,87 @@ class Account(TMDb):
         self.data.update(request)
         return request
 
-    def iter_lists(self, **params):
+    def iter_lists(self, *, prefetch=0, **params):
         """Get lists created by an account. Will include
         private lists if you are the owner."""
         params = {"session_id": self._session_id, **params}
-        response = self._iter_request(
-            URL.ACCOUNT_CREATED_LISTS.format(account_id=self.tmdb_id), **params
+        return self._iter_request(
+            URL.ACCOUNT_CREATED_LISTS.format(account_id=self.tmdb_id),
+            prefetch=prefetch,
+            item=lambda item: TMDbList(item["id"], **item),
+            **params,
         )
-        for item in response:
-            yield TMDbList(item["id"], **item)
 
-    def iter_favorite_movies(self, **params):
+    def iter_favorite_movies(self, *, prefetch=0, **params):
         """Get your favorite movies."""
         params = {"session_id": self._session_id, **params}
-        response = self._iter_request(
+        return self._iter_request(
             URL.ACCOUNT_FAVORITE_MOVIES.format(account_id=self.tmdb_id),
+            prefetch=prefetch,
+            item=lambda item: Movie._shared(item["id"], item),
             **params,
         )
-        for item in response:
-            yield Movie(item["id"], **item)
 
-    def iter_favorite_shows(self, **params):
+    def iter_favorite_shows(self, *, prefetch=0, **params):
         """Get your favorite TV shows."""
         params = {"session_id": self._session_id, **params}
-        response = self._iter_request(
+        return self._iter_request(
             URL.ACCOUNT_FAVORITE_SHOWS.format(account_id=self.tmdb_id),
+            prefetch=prefetch,
+            item=lambda item: Show._shared(item["id"], item),
             **params,
         )
-        for item in response:
-            yield Show(item["id"], **item)
 
-    def iter_rated_movies(self, **params):
+    def iter_rated_movies(self, *, prefetch=0, **params):
         """Get all the movies you have rated."""
         params = {"session_id": self._session_id, **params}
-        response = self._iter_request(
-            URL.ACCOUNT_RATED_MOVIES.format(account_id=self.tmdb_id), **params
+        return self._iter_request(
+            URL.ACCOUNT_RATED_MOVIES.format(account_id=self.tmdb_id),
+            prefetch=prefetch,
+            item=lambda item: Movie._shared(item["id"], item),
+            **params,
         )
-        for item in response:
-            yield Movie(item["id"], **item)
 
-    def iter_rated_shows(self, **params):
+    def iter_rated_shows(self, *, prefetch=0, **params):
         """Get all the TV shows you have rated."""
         params = {"session_id": self._session_id, **params}
-        response = self._iter_request(
-            URL.ACCOUNT_RATED_SHOWS.format(account_id=self.tmdb_id), **params
+        return self._iter_request(
+            URL.ACCOUNT_RATED_SHOWS.format(account_id=self.tmdb_id),
+            prefetch=prefetch,
+            item=lambda item: Show._shared(item["id"], item),
+            **params,
         )
-        for item in response:
-            yield Show(item["id"], **item)
 
-    def iter_rated_episodes(self, **params):
+    def iter_rated_episodes(self, *, prefetch=0, **params):
         """Get all the TV episodes you have rated."""
         params = {"session_id": self._session_id, **params}
-        response = self._iter_request(
+        return self._iter_request(
             URL.ACCOUNT_RATED_EPISODES.format(account_id=self.tmdb_id),
+            prefetch=prefetch,
+            item=lambda item: Episode(item["id"], **item),
             **params,
         )
-        for item in response:
-            yield Episode(item["id"], **item)
 
-    def iter_movie_watchlist(self, **params):
+    def iter_movie_watchlist(self, *, prefetch=0, **params):
         """Get all the movies you have added to your watchlist."""
         params = {"session_id": self._session_id, **params}
-        response = self._iter_request(
+        return self._iter_request(
             URL.ACCOUNT_MOVIE_WATCHLIST.format(account_id=self.tmdb_id),
+            prefetch=prefetch,
+            item=lambda item: Movie._shared(item["id"], item),
             **params,
         )
-        for item in response:
-            yield Movie(item["id"], **item)
 
-    def iter_show_watchlist(self, **params):
+    def iter_show_watchlist(self, *, prefetch=0, **params):
         """Get all the TV shows you have added to your
         watchlist."""
         params = {"session_id": self._session_id, **params}
-        response = self._iter_request(
+        return self._iter_request(
             URL.ACCOUNT_SHOW_WATCHLIST.format(account_id=self.tmdb_id),
+            prefetch=prefetch,
+            item=lambda item: Show._shared(item["id"], item),
             **params,
         )
-        for item in response:
-            yield Show(item["id"], **item)
 
     def mark_as_favorite(self, item):
         """Mark a movie or TV show as a favorite item."""
@@ -456,6 +613,8 @@ class Account(TMDb):
 class TMDbList(TMDb):
     """Represents a list."""
 
+    __slots__ = ("_changed",)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._changed = False
@@ -463,11 +622,16 @@ class TMDbList(TMDb):
     def _init(self):
         self.get_details()
 
+    def _is_stale(self):
+        return self._changed
+
     def _getdata(self, key):
         if key not in self.data or self._changed:
-            self._init()
-            self._changed = False
-        return copy.deepcopy(self.data[key])
+            with self._loading_lock():
+                if key not in self.data or self._changed:
+                    self._init()
+                    self._changed = False
+        return freeze(self.data[key])
 
     @property
     def name(self):
@@ -481,13 +645,13 @@ class TMDbList(TMDb):
 
     @property
     def creator(self):
-        return self._getdata("created_by")
+        return thaw(self._getdata("created_by"))
 
     @property
     def n_favorites(self):
         return self._getdata("favorite_count")
 
-    @property
+    @memoized_property
     def items(self):
         acc = []
         for item in self._getdata("items"):
@@ -495,17 +659,13 @@ class TMDbList(TMDb):
                 Obj = Movie
             elif item["media_type"] == "tv":
                 Obj = Show
-            acc.append(Obj(item["id"], **item))
+            acc.append(Obj._shared(item["id"], item))
         return acc
 
-    @property
+    @memoized_property
     def language(self):
         code = self._getdata("iso_639_1")
-        try:
-            item = self._all_languages[code]
-        except AttributeError:
-            self._all_languages = self._get_all_languages()
-            item = self._all_languages[code]
+        item = self._reference("languages")[code]
         return Language(
             iso_639_1=code,
             english_name=item["english_name"],
@@ -531,25 +691,23 @@ class TMDbList(TMDb):
 class Company(TMDb):
     """Represents a company."""
 
+    __slots__ = ()
+
+    _routes = ("alternative_names", "images")
+
     def _init(self):
         self.get_details()
 
-    def _getdata(self, key):
-        if key not in self.data:
-            if key == "alternative_names":
-                self.get_alternative_names()
-            elif key == "images":
-                self.get_images()
-            else:
-                self._init()
-        return copy.deepcopy(self.data[key])
+    @property
+    def _details_url(self):
+        return URL.COMPANY_DETAILS.format(company_id=self.tmdb_id)
 
     @property
     def name(self):
         """Return the name of a company."""
         return self._getdata("name")
 
-    @property
+    @memoized_property
     def also_known_as(self):
         """Return alternative names of a company."""
         names = []
@@ -567,16 +725,12 @@ class Company(TMDb):
         """Return a company's homepage."""
         return self._getdata("homepage")
 
-    @property
+    @memoized_property
     def country(self):
         """Return a company's origin country."""
         code = self._getdata("origin_country")
         if code:
-            try:
-                english_name = self._all_countries[code]
-            except AttributeError:
-                self._all_countries = self._get_all_countries()
-                english_name = self._all_countries[code]
+            english_name = self._reference("countries")[code]
             return Country(iso_3166_1=code, english_name=english_name)
         else:
             return code
@@ -584,26 +738,19 @@ class Company(TMDb):
     @property
     def parent_company(self):
         # TODO: definition
-        return self._getdata("parent_company")
+        return thaw(self._getdata("parent_company"))
 
-    @property
+    @memoized_property
     def logos(self):
         """Return logo images that belong to a comapny. Each item
         is an instance of the `Image` class."""
         logos = []
         for item in self._getdata("images")["logos"]:
-            logos.append(Image(item, type_="logo"))
+            logos.append(
+                Image(item, type_="logo", reference=self._reference)
+            )
         return logos
 
-    def _get_all_countries(self):
-        data = self._request(
-            URL.COUNTRIES_CONFIGURATION, **{"api_key": tmdb_api_key()}
-        )
-        countries = {}
-        for item in data:
-            countries[item["iso_3166_1"]] = item["english_name"]
-        return countries
-
     def get_details(self, **params):
         """Get a companies details."""
         details = self._request(
@@ -633,10 +780,19 @@ class Company(TMDb):
 class Movie(TMDb):
     """Represents a movie."""
 
-    def _init(self):
-        return self.get_all()
+    __slots__ = ()
+
+    _all_suffixes = tuple(URL.ALL_MOVIE_SECOND_SUFFIXES)
+    _routes = _all_suffixes
 
     @property
+    def _details_url(self):
+        return URL.MOVIE_DETAILS.format(movie_id=self.tmdb_id)
+
+    def _init(self):
+        return self.get_all(self._missing())
+
+    @memoized_property
     def title(self):
         """Return titles of a movie in different languages.
         Each key is an ISO-3166-1 code (such as `"US"`, `"RU"`,
@@ -655,7 +811,7 @@ class Movie(TMDb):
                 titles[code] = title
         return titles
 
-    @property
+    @memoized_property
     def overview(self):
         """Return the overviews of a movie in different
         languages. Each key is an ISO-3166-1 code (such as `"US"`,
@@ -674,7 +830,7 @@ class Movie(TMDb):
         """Return a movie slogan"""
         return self._getdata("tagline")
 
-    @property
+    @memoized_property
     def homepage(self):
         """Return a movie homepages. Each key is an ISO-3166-1
         code (such as `"US"`, `"RU"`, etc.) and the value is the
@@ -699,34 +855,26 @@ class Movie(TMDb):
         else:
             return None
 
-    @property
+    @memoized_property
     def releases(self):
         """Return release dates of a movie in different
         countries. Each key is an ISO-3166-1 code (such as `"US"`,
         `"RU"`, etc.) and the value is the corresponding date in
         `YYYY-MM-DD` format."""
 
-        def _remove_iso_639_1(d):
-            if "iso_639_1" in d:
-                del d["iso_639_1"]
-            return d
-
-        def _rename_to_date(d):
-            if "release_date" in d:
-                d["date"] = d["release_date"]
-                del d["release_date"]
-            return d
-
-        def _default_note(d):
-            if "note" not in d:
-                d["note"] = ""
-            return d
+        def _release(d):
+            release = {}
+            for key, value in d.items():
+                if key == "release_date":
+                    release["date"] = value
+                elif key != "iso_639_1":
+                    release[key] = value
+            release.setdefault("note", "")
+            return release
 
         dates = {}
         for item in self._getdata("release_dates")["results"]:
-            release_dates = list(map(_remove_iso_639_1, item["release_dates"]))
-            release_dates = list(map(_rename_to_date, release_dates))
-            release_dates = list(map(_default_note, release_dates))
+            release_dates = list(map(_release, item["release_dates"]))
             dates[item["iso_3166_1"]] = release_dates
         return dates
 
@@ -735,25 +883,29 @@ class Movie(TMDb):
         """Return `True` if a movie is for adults."""
         return self._getdata("adult")
 
-    @property
+    @memoized_property
     def backdrops(self):
         """Return backdrops that belong to a movie. Each item
         is an instance of the `Image` class."""
         backdrops = []
         for item in self._getdata("images")["backdrops"]:
-            backdrops.append(Image(item, type_="backdrop"))
+            backdrops.append(
+                Image(item, type_="backdrop", reference=self._reference)
+            )
         return backdrops
 
-    @property
+    @memoized_property
     def posters(self):
         """Return posters that belong to a movie. Each item is
         an instance of the `Image` class."""
         posters = []
         for item in self._getdata("images")["posters"]:
-            posters.append(Image(item, type_="poster"))
+            posters.append(
+                Image(item, type_="poster", reference=self._reference)
+            )
         return posters
 
-    @property
+    @memoized_property
     def languages(self):
         """Return the languages spoken in a movie. Each item is
         an instance of the `Language` class."""
@@ -761,11 +913,7 @@ class Movie(TMDb):
         for code in map(
             itemgetter("iso_639_1"), self._getdata("spoken_languages")
         ):
-            try:
-                item = self._all_languages[code]
-            except AttributeError:
-                self._all_languages = self._get_all_languages()
-                item = self._all_languages[code]
+            item = self._reference("languages")[code]
             languages.append(
                 Language(
                     iso_639_1=code,
@@ -775,7 +923,7 @@ class Movie(TMDb):
             )
         return languages
 
-    @property
+    @memoized_property
     def countries(self):
         """Return production countries. Each item is an instance of
         the `Country` class."""
@@ -814,16 +962,16 @@ class Movie(TMDb):
         `"Canceled"`."""
         return self._getdata("status")
 
-    @property
+    @memoized_property
     def companies(self):
         """Return the production companies. Each item is an
         instance of the `Company` class."""
         companies = []
         for item in self._getdata("production_companies"):
-            companies.append(Company(item["id"], **item))
+            companies.append(Company._shared(item["id"], item))
         return companies
 
-    @property
+    @memoized_property
     def cast(self):
         """Return movie cast as list of tuples `(Person, Credit)`."""
         cast = []
@@ -840,11 +988,11 @@ class Movie(TMDb):
                 character=item["character"],
                 **kwargs,
             )
-            person = Person(item["id"], **item)
+            person = Person._shared(item["id"], item)
             cast.append((person, credit))
         return cast
 
-    @property
+    @memoized_property
     def crew(self):
         """Return movie crew as list of tuples `(Person, Credit)`."""
         crew = []
@@ -856,11 +1004,11 @@ class Movie(TMDb):
                 "job": item["job"],
             }
             credit = Credit(item["credit_id"], media_data=self.data, **kwargs)
-            person = Person(item["id"], **item)
+            person = Person._shared(item["id"], item)
             crew.append((person, credit))
         return crew
 
-    @property
+    @memoized_property
     def vote(self):
         """Return an instance of the `Vote` class. It is like a
         `NamedTuple` object with two attributes: `average` and
@@ -869,7 +1017,7 @@ class Movie(TMDb):
         count = self._getdata("vote_count")
         return Vote(average=average, count=count)
 
-    @property
+    @memoized_property
     def videos(self):
         """Return videos. Each item is an instance of the `Video`
         class."""
@@ -879,20 +1027,27 @@ class Movie(TMDb):
             videos.append(Video(name=item["name"], type=item["type"], url=url))
         return videos
 
-    @property
+    @memoized_property
     def genres(self):
         """Return a movie genres."""
+        if "genres" not in self.data and "genre_ids" in self.data:
+            # Search and discover results only have the ids.
+            names = self._reference("movie_genres")
+            return [
+                Genre(tmdb_id=i, name=names.get(i))
+                for i in self.data["genre_ids"]
+            ]
         genres = []
         for item in self._getdata("genres"):
             genres.append(Genre(tmdb_id=item["id"], name=item["name"]))
         return genres
 
-    @property
+    @memoized_property
     def keywords(self):
         """Return a movie keywords."""
         keywords = []
         for item in self._getdata("keywords")["keywords"]:
-            keywords.append(Keyword(item["id"], **item))
+            keywords.append(Keyword._shared(item["id"], item))
         return keywords
 
     @property
@@ -915,15 +1070,14 @@ class Movie(TMDb):
         """Return the ID of a movie on Twitter."""
         return self._getdata("external_ids")["twitter_id"]
 
-    def get_all(self, **params):
+    def get_all(self, append=None, **params):
         """Get all information about a movie. This method
-        makes only one API request."""
-        methods = ",".join(URL.ALL_MOVIE_SECOND_SUFFIXES)
-        all_data = self.get_details(
-            **{"append_to_response": methods, **params}
-        )
-        self.data.update(all_data)
-        return all_data
+        makes only one API request.
+
+        The optional `append` argument is a list of the
+        sub-resources to include, such as `["credits"]`.
+        (Default: `default_append`)"""
+        return self._get_all(append, **params)
 
     def get_details(self, **params):
         """Get the primary information about a movie."""
@@ -1012,25 +1166,25 @@ class Movie(TMDb):
 
     def iter_recommendations(self, **params):
         """Get a list of recommended movies for a movie."""
-        yield from self._iter_request(
+        return self._iter_request(
             URL.MOVIE_RECOMMENDATIONS.format(movie_id=self.tmdb_id), **params
         )
 
     def iter_similar_movies(self, **params):
         """Get a list of recommended movies for a movie."""
-        yield from self._iter_request(
+        return self._iter_request(
             URL.MOVIE_SIMILAR.format(movie_id=self.tmdb_id), **params
         )
 
     def iter_reviews(self, **params):
         """Get the user reviews for a movie."""
-        yield from self._iter_request(
+        return self._iter_request(
             URL.MOVIE_REVIEWS.format(movie_id=self.tmdb_id), **params
         )
 
     def iter_lists(self, **params):
         """Get a list of lists that this movie belongs to."""
-        yield from self._iter_request(
+        return self._iter_request(
             URL.MOVIE_LISTS.format(movie_id=self.tmdb_id), **params
         )
 
@@ -1038,10 +1192,19 @@ class Movie(TMDb):
 class Show(TMDb):
     """Represents a TV show."""
 
-    def _init(self):
-        return self.get_all()
+    __slots__ = ()
+
+    _all_suffixes = tuple(URL.ALL_SHOW_SECOND_SUFFIXES)
+    _routes = _all_suffixes
 
     @property
+    def _details_url(self):
+        return URL.SHOW_DETAILS.format(show_id=self.tmdb_id)
+
+    def _init(self):
+        return self.get_all(self._missing())
+
+    @memoized_property
     def title(self):
         """Return titles of a TV show in different languages.
         Each key is an ISO-3166-1 code (such as `"US"`, `"RU"`,
@@ -1060,7 +1223,7 @@ class Show(TMDb):
                 titles[code] = title
         return titles
 
-    @property
+    @memoized_property
     def overview(self):
         """Return the overviews of a TV show in different
         languages. Each key is an ISO-3166-1 code (such as `"US"`,
@@ -1074,7 +1237,7 @@ class Show(TMDb):
                 overviews[code] = overview
         return overviews
 
-    @property
+    @memoized_property
     def homepage(self):
         """Return a TV show homepages. Each key is an ISO-3166-1
         code (such as `"US"`, `"RU"`, etc.) and the value is the
@@ -1090,36 +1253,40 @@ class Show(TMDb):
                 pages[code] = page
         return pages
 
-    @property
+    @memoized_property
     def creators(self):
         """Return the creators of a TV show."""
         creators = []
         for item in self._getdata("created_by"):
-            creators.append(Person(item["id"], **item))
+            creators.append(Person._shared(item["id"], item))
         return creators
 
-    @property
+    @memoized_property
     def backdrops(self):
         """Return backdrops that belong to a TV show. Each item
         is an instance of the `Image` class."""
         backdrops = []
         for item in self._getdata("images")["backdrops"]:
-            backdrops.append(Image(item, type_="backdrop"))
+            backdrops.append(
+                Image(item, type_="backdrop", reference=self._reference)
+            )
         return backdrops
 
-    @property
+    @memoized_property
     def posters(self):
         """Return posters that belong to a TV show. Each item is
         an instance of the `Image` class."""
         posters = []
         for item in self._getdata("images")["posters"]:
-            posters.append(Image(item, type_="poster"))
+            posters.append(
+                Image(item, type_="poster", reference=self._reference)
+            )
         return posters
 
     @property
     def runtimes(self):
         """Return the running times of TV show episodes."""
-        return self._getdata("episode_run_time")
+        return list(self._getdata("episode_run_time"))
 
     @property
     def first_air_date(self):
@@ -1136,18 +1303,14 @@ class Show(TMDb):
         """Return `True` if a TV show is in production."""
         return self._getdata("in_production")
 
-    @property
+    @memoized_property
     def languages(self):
         """Return the languages spoken in a TV show. Each item is
         an instance of the `Language` class."""
         iso_codes = self._getdata("languages")
         languages = []
         for code in iso_codes:
-            try:
-                item = self._all_languages[code]
-            except AttributeError:
-                self._all_languages = self._get_all_languages()
-                item = self._all_languages[code]
+            item = self._reference("languages")[code]
             languages.append(
                 Language(
                     iso_639_1=code,
@@ -1157,25 +1320,21 @@ class Show(TMDb):
             )
         return languages
 
-    @property
+    @memoized_property
     def last_episode(self):
         """Return the last episode."""
         item = self._getdata("last_episode_to_air")
         return Episode(
-            item["episode_number"],
-            show_id=self.tmdb_id,
-            season_number=item["season_number"],
+            item["episode_number"], **{"show_id": self.tmdb_id, **item}
         )
 
-    @property
+    @memoized_property
     def next_episode(self):
         """Return the next episode."""
         item = self._getdata("next_episode_to_air")
         if item:
             return Episode(
-                item["episode_number"],
-                show_id=self.tmdb_id,
-                season_number=item["season_number"],
+                item["episode_number"], **{"show_id": self.tmdb_id, **item}
             )
         else:
             return item
@@ -1190,18 +1349,14 @@ class Show(TMDb):
         """Return the number of seasons."""
         return self._getdata("number_of_seasons")
 
-    @property
+    @memoized_property
     def countries(self):
         """Return production countries. Each item is an instance of
         the `Country` class."""
         countries = []
         for code in self._getdata("origin_country"):
             if code:
-                try:
-                    english_name = self._all_countries[code]
-                except AttributeError:
-                    self._all_countries = self._get_all_countries()
-                    english_name = self._all_countries[code]
+                english_name = self._reference("countries")[code]
                 countries.append(
                     Country(iso_3166_1=code, english_name=english_name)
                 )
@@ -1217,24 +1372,25 @@ class Show(TMDb):
         https://developers.themoviedb.org/3/getting-started/popularity."""
         return self._getdata("popularity")
 
-    @property
+    @memoized_property
     def companies(self):
         """Return the production companies. Each item is an
         instance of the `Company` class."""
         companies = []
         for item in self._getdata("production_companies"):
-            companies.append(Company(item["id"], **item))
+            companies.append(Company._shared(item["id"], item))
         return companies
 
-    @property
+    @memoized_property
     def seasons(self):
         """Return seasons. Each item is an instance of the `Season`
         class."""
         seasons = []
         for item in self._getdata("seasons"):
-            seasons.append(
-                Season(item["season_number"], show_id=self.tmdb_id, **item)
-            )
+            n = item["season_number"]
+            # Seasons loaded by `get_seasons` come with their episodes.
+            item = self.data.get(f"season/{n}", item)
+            seasons.append(Season(n, show_id=self.tmdb_id, **item))
         return seasons
 
     @property
@@ -1245,7 +1401,7 @@ class Show(TMDb):
     def type(self):
         return self._getdata("type")
 
-    @property
+    @memoized_property
     def vote(self):
         """Return an instance of the `Vote` class. It is like a
         `NamedTuple` object with two attributes: `average` and
@@ -1254,7 +1410,7 @@ class Show(TMDb):
         count = self._getdata("vote_count")
         return Vote(average=average, count=count)
 
-    @property
+    @memoized_property
     def videos(self):
         """Return videos. Each item is an instance of the `Video`
         class."""
@@ -1264,20 +1420,27 @@ class Show(TMDb):
             videos.append(Video(name=item["name"], type=item["type"], url=url))
         return videos
 
-    @property
+    @memoized_property
     def genres(self):
         """Return a TV show genres."""
+        if "genres" not in self.data and "genre_ids" in self.data:
+            # Search and discover results only have the ids.
+            names = self._reference("show_genres")
+            return [
+                Genre(tmdb_id=i, name=names.get(i))
+                for i in self.data["genre_ids"]
+            ]
         genres = []
         for item in self._getdata("genres"):
             genres.append(Genre(tmdb_id=item["id"], name=item["name"]))
         return genres
 
-    @property
+    @memoized_property
     def keywords(self):
         """Return a TV show keywords."""
         keywords = []
         for item in self._getdata("keywords")["results"]:
-            keywords.append(Keyword(item["id"], **item))
+            keywords.append(Keyword._shared(item["id"], item))
         return keywords
 
     @property
@@ -1305,7 +1468,7 @@ class Show(TMDb):
         """Return the ID of a TV show on Twitter."""
         return self._getdata("external_ids")["twitter_id"]
 
-    @property
+    @memoized_property
     def ratings(self):
         """Return content ratings (certifications) that have been
         added to a TV show. Each key is an ISO-3166-1
@@ -1316,7 +1479,7 @@ class Show(TMDb):
             ratings[item["iso_3166_1"]] = item["rating"]
         return ratings
 
-    @property
+    @memoized_property
     def cast(self):
         """Return TV show cast as list of tuples
         `(Person, Credit)`."""
@@ -1334,11 +1497,11 @@ class Show(TMDb):
                 character=item["character"],
                 **kwargs,
             )
-            person = Person(item["id"], **item)
+            person = Person._shared(item["id"], item)
             cast.append((person, credit))
         return cast
 
-    @property
+    @memoized_property
     def crew(self):
         """Return TV show crew as list of tuples
         `(Person, Credit)`."""
@@ -1351,28 +1514,18 @@ class Show(TMDb):
                 "job": item["job"],
             }
             credit = Credit(item["credit_id"], media_data=self.data, **kwargs)
-            person = Person(item["id"], **item)
+            person = Person._shared(item["id"], item)
             crew.append((person, credit))
         return crew
 
-    def _get_all_countries(self):
-        data = self._request(
-            URL.COUNTRIES_CONFIGURATION, **{"api_key": tmdb_api_key()}
-        )
-        countries = {}
-        for item in data:
-            countries[item["iso_3166_1"]] = item["english_name"]
-        return countries
-
-    def get_all(self, **params):
+    def get_all(self, append=None, **params):
         """Get all information about a TV show. This method
-        makes only one API request."""
-        methods = ",".join(URL.ALL_SHOW_SECOND_SUFFIXES)
-        all_data = self.get_details(
-            **{"append_to_response": methods, **params}
-        )
-        self.data.update(all_data)
-        return all_data
+        makes only one API request.
+
+        The optional `append` argument is a list of the
+        sub-resources to include, such as `["credits"]`.
+        (Default: `default_append`)"""
+        return self._get_all(append, **params)
 
     def get_details(self, **params):
         """Get the primary information about a TV show."""
@@ -1382,6 +1535,25 @@ class Show(TMDb):
         self.data.update(details)
         return details
 
+    def get_seasons(self, **params):
+        """Get all the seasons of a TV show with their episodes.
+        Up to 20 seasons are appended to each request, so the
+        `seasons` property and their `episodes` need no more
+        requests. Returns a list of the seasons' details."""
+        seasons = []
+        for keys, request in self._season_requests(params):
+            details = self.get_details(**request)
+            seasons.extend(details[key] for key in keys if key in details)
+        return seasons
+
+    def _season_requests(self, params):
+        """Yield the appended keys and the parameters of each
+        request of `get_seasons`."""
+        numbers = [item["season_number"] for item in self._getdata("seasons")]
+        for i in range(0, len(numbers), _MAX_APPENDS):
+            keys = [f"season/{n}" for n in numbers[i : i + _MAX_APPENDS]]
+            yield keys, {"append_to_response": ",".join(keys), **params}
+
     def get_alternative_titles(self, **params):
         """Get all of the alternative titles for a TV show."""
         alternative_titles = self._request(
@@ -1452,13 +1624,13 @@ class Show(TMDb):
 
     def iter_recommendations(self, **params):
         """Get a list of recommended movies for a TV show."""
-        yield from self._iter_request(
+        return self._iter_request(
             URL.SHOW_RECOMMENDATIONS.format(show_id=self.tmdb_id), **params
         )
 
     def iter_reviews(self, **params):
         """Get the user reviews for a TV show."""
-        yield from self._iter_request(
+        return self._iter_request(
             URL.SHOW_REVIEWS.format(show_id=self.tmdb_id), **params
         )
 
@@ -1474,7 +1646,7 @@ class Show(TMDb):
 
     def iter_similar_shows(self, **params):
         """Get a list of recommended movies for a TV shows."""
-        yield from self._iter_request(
+        return self._iter_request(
             URL.SHOW_SIMILAR.format(show_id=self.tmdb_id), **params
         )
 
@@ -1499,14 +1671,25 @@ class Show(TMDb):
 class Season(TMDb):
     """Represents a TV show season."""
 
+    __slots__ = ("show_id", "number")
+
+    _all_suffixes = tuple(URL.ALL_SEASON_SECOND_SUFFIXES)
+    _routes = _all_suffixes
+
     def __init__(self, n: int, *, show_id: int, **kwargs):
-        self.data = {"season_number": n, **kwargs}
+        self.data = Data({"season_number": n, **_payload(kwargs)})
         self.show_id = show_id
         self.number = self.data["season_number"]
         self.n_requests = 0
 
     def _init(self):
-        self.get_all()
+        self.get_all(self._missing())
+
+    @property
+    def _details_url(self):
+        return URL.SEASON_DETAILS.format(
+            show_id=self.show_id, season_number=self.number
+        )
 
     @property
     def tmdb_id(self):
@@ -1533,18 +1716,19 @@ class Season(TMDb):
         """Return the air date of a season."""
         return self._getdata("air_date")
 
-    @property
+    @memoized_property
     def episodes(self):
         """Return a season's episodes."""
         episodes = []
         for item in self._getdata("episodes"):
-            episodes.append(
-                Episode(
-                    item["episode_number"],
-                    show_id=self.show_id,
-                    season_number=item["season_number"],
-                )
-            )
+            # Episodes carry their show's id, which `Episode` takes
+            # as an argument instead of keeping it in its data.
+            kwargs = {
+                "show_id": self.show_id,
+                "season_number": self.number,
+                **item,
+            }
+            episodes.append(Episode(item["episode_number"], **kwargs))
         return episodes
 
     @property
@@ -1552,17 +1736,17 @@ class Season(TMDb):
         """Return the ID of a season on TVDb."""
         return self._getdata("external_ids")["tvdb_id"]
 
-    @property
+    @memoized_property
     def posters(self):
         """Return poster images that belong to a season. Each item
         is an instance of the `Image` class."""
 
         def _i(i):
-            return Image(i, type_="poster")
+            return Image(i, type_="poster", reference=self._reference)
 
         return list(map(_i, self._getdata("images")["posters"]))
 
-    @property
+    @memoized_property
     def videos(self):
         """Return videos. Each item is an instance of the `Video`
         class."""
@@ -1572,7 +1756,7 @@ class Season(TMDb):
             videos.append(Video(name=item["name"], type=item["type"], url=url))
         return videos
 
-    @property
+    @memoized_property
     def cast(self):
         """Return TV season cast as list of tuples `(Person, Credit)`."""
         cast = []
@@ -1589,11 +1773,11 @@ class Season(TMDb):
                 character=item["character"],
                 **kwargs,
             )
-            person = Person(item["id"], **item)
+            person = Person._shared(item["id"], item)
             cast.append((person, credit))
         return cast
 
-    @property
+    @memoized_property
     def crew(self):
         """Return a TV season crew as list of tuples `(Person, Credit)`."""
         crew = []
@@ -1605,19 +1789,18 @@ class Season(TMDb):
                 "job": item["job"],
             }
             credit = Credit(item["credit_id"], media_data=self.data, **kwargs)
-            person = Person(item["id"], **item)
+            person = Person._shared(item["id"], item)
             crew.append((person, credit))
         return crew
 
-    def get_all(self, **params):
+    def get_all(self, append=None, **params):
         """Get all information about a TV season in a single
-        response."""
-        methods = ",".join(URL.ALL_SEASON_SECOND_SUFFIXES)
-        all_data = self.get_details(
-            **{"append_to_response": methods, **params}
-        )
-        self.data.update(all_data)
-        return all_data
+        response.
+
+        The optional `append` argument is a list of the
+        sub-resources to include, such as `["credits"]`.
+        (Default: `default_append`)"""
+        return self._get_all(append, **params)
 
     def get_details(self, **params):
         """Get the primary TV season details."""
@@ -1687,19 +1870,34 @@ class Season(TMDb):
 class Episode(TMDb):
     """Represents a TV show episode."""
 
+    __slots__ = ("show_id", "number", "season_number")
+
+    _all_suffixes = tuple(URL.ALL_EPISODE_SECOND_SUFFIXES)
+    _routes = _all_suffixes
+
     def __init__(self, n, *, show_id, season_number, **kwargs):
-        self.data = {
-            "episode_number": n,
-            "season_number": season_number,
-            **kwargs,
-        }
+        self.data = Data(
+            {
+                "episode_number": n,
+                "season_number": season_number,
+                **_payload(kwargs),
+            }
+        )
         self.show_id = show_id
         self.number = self.data["episode_number"]
         self.season_number = self.data["season_number"]
         self.n_requests = 0
 
     def _init(self):
-        self.get_all()
+        self.get_all(self._missing())
+
+    @property
+    def _details_url(self):
+        return URL.EPISODE_DETAILS.format(
+            show_id=self.show_id,
+            season_number=self.season_number,
+            episode_number=self.number,
+        )
 
     @property
     def tmdb_id(self):
@@ -1731,7 +1929,7 @@ class Episode(TMDb):
         """Return a season number."""
         return self._getdata("season_number")
 
-    @property
+    @memoized_property
     def title(self):
         """Return titles of an episode in different languages.
         Each key is an ISO-3166-1 code (such as `"US"`, `"RU"`,
@@ -1749,7 +1947,7 @@ class Episode(TMDb):
                 names[k] = v
         return names
 
-    @property
+    @memoized_property
     def overview(self):
         """Return the overviews of an episode in different
         languages. Each key is an ISO-3166-1 code (such as `"US"`,
@@ -1767,17 +1965,17 @@ class Episode(TMDb):
                 overviews[k] = v
         return overviews
 
-    @property
+    @memoized_property
     def stills(self):
         """Return images that belong to an episode. Each item is
         an instance of the `Image` class."""
 
         def _i(i):
-            return Image(i, type_="still")
+            return Image(i, type_="still", reference=self._reference)
 
         return list(map(_i, self._getdata("images")["stills"]))
 
-    @property
+    @memoized_property
     def videos(self):
         """Return videos. Each item is an instance of the `Video`
         class."""
@@ -1787,7 +1985,7 @@ class Episode(TMDb):
             videos.append(Video(name=item["name"], type=item["type"], url=url))
         return videos
 
-    @property
+    @memoized_property
     def vote(self):
         """Return an instance of the `Vote` class. It is like a
         `NamedTuple` object with two attributes: `average` and
@@ -1796,7 +1994,7 @@ class Episode(TMDb):
         count = self._getdata("vote_average")
         return Vote(average=average, count=count)
 
-    @property
+    @memoized_property
     def cast(self):
         """Return TV episode cast as list of tuples
         `(Person, Credit)`."""
@@ -1813,11 +2011,11 @@ class Episode(TMDb):
                 character=item["character"],
                 **kwargs,
             )
-            person = Person(item["id"], **item)
+            person = Person._shared(item["id"], item)
             cast.append((person, credit))
         return cast
 
-    @property
+    @memoized_property
     def crew(self):
         """Return TV episode crew as list of tuples
         `(Person, Credit)`."""
@@ -1829,11 +2027,11 @@ class Episode(TMDb):
                 "job": item["job"],
             }
             credit = Credit(item["credit_id"], media_data=self.data, **kwargs)
-            person = Person(item["id"], **item)
+            person = Person._shared(item["id"], item)
             crew.append((person, credit))
         return crew
 
-    @property
+    @memoized_property
     def guest_stars(self):
         """Return TV episode guest stars as list of tuples
         `(Person, Credit)`."""
@@ -1844,19 +2042,18 @@ class Episode(TMDb):
                 media_data=self.data,
                 character=item.get("character"),
             )
-            person = Person(item["id"], **item)
+            person = Person._shared(item["id"], item)
             guest_stars.append((person, credit))
         return guest_stars
 
-    def get_all(self, **params):
+    def get_all(self, append=None, **params):
         """Get all information about a TV episode in a single
-        response."""
-        methods = ",".join(URL.ALL_EPISODE_SECOND_SUFFIXES)
-        all_data = self.get_details(
-            **{"append_to_response": methods, **params}
-        )
-        self.data.update(all_data)
-        return all_data
+        response.
+
+        The optional `append` argument is a list of the
+        sub-resources to include, such as `["credits"]`.
+        (Default: `default_append`)"""
+        return self._get_all(append, **params)
 
     def get_details(self, **params):
         """Get the primary TV episode details."""
@@ -1962,8 +2159,17 @@ class Episode(TMDb):
 class Person(TMDb):
     """Represents a person."""
 
+    __slots__ = ()
+
+    _all_suffixes = tuple(URL.ALL_PERSON_SECOND_SUFFIXES)
+    _routes = _all_suffixes
+
+    @property
+    def _details_url(self):
+        return URL.PERSON_DETAILS.format(person_id=self.tmdb_id)
+
     def _init(self):
-        self.get_all()
+        self.get_all(self._missing())
 
     @property
     def name(self):
@@ -1973,7 +2179,7 @@ class Person(TMDb):
     @property
     def also_known_as(self):
         """Return other names (in other languages)."""
-        return self._getdata("also_known_as")
+        return list(self._getdata("also_known_as"))
 
     @property
     def known_for_department(self):
@@ -1994,7 +2200,7 @@ class Person(TMDb):
         """Return an integer between 0 and 2. Default 0."""
         return self._getdata("gender")
 
-    @property
+    @memoized_property
     def biography(self):
         """Return the biography of a person in different
         languages. Each key is an ISO-3166-1 code (such as `"US"`,
@@ -2009,7 +2215,7 @@ class Person(TMDb):
                 biographies[code] = bio
         return biographies
 
-    @property
+    @memoized_property
     def homepage(self):
         """Return a person homepage."""
         self._getdata("homepage")
@@ -2031,7 +2237,7 @@ class Person(TMDb):
     def is_adult(self):
         return self._getdata("adult")
 
-    @property
+    @memoized_property
     def movie_cast(self):
         """Return movies as list of tuples `(Movie, Credit)`."""
         cast = []
@@ -2048,11 +2254,11 @@ class Person(TMDb):
                 character=item["character"],
                 **kwargs,
             )
-            movie = Movie(item["id"], **item)
+            movie = Movie._shared(item["id"], item)
             cast.append((movie, credit))
         return cast
 
-    @property
+    @memoized_property
     def movie_crew(self):
         """Return movies as list of tuples `(Movie, Credit)`."""
         crew = []
@@ -2064,11 +2270,11 @@ class Person(TMDb):
                 "job": item["job"],
             }
             credit = Credit(item["credit_id"], person_data=self.data, **kwargs)
-            movie = Movie(item["id"], **item)
+            movie = Movie._shared(item["id"], item)
             crew.append((movie, credit))
         return crew
 
-    @property
+    @memoized_property
     def show_cast(self):
         """Return shows as list of tuples `(Show, Credit)`."""
         cast = []
@@ -2085,11 +2291,11 @@ class Person(TMDb):
                 character=item["character"],
                 **kwargs,
             )
-            show = Show(item["id"], **item)
+            show = Show._shared(item["id"], item)
             cast.append((show, credit))
         return cast
 
-    @property
+    @memoized_property
     def show_crew(self):
         """Return shows as list of tuples `(Show, Credit)`."""
         crew = []
@@ -2101,11 +2307,11 @@ class Person(TMDb):
                 "job": item["job"],
             }
             credit = Credit(item["credit_id"], person_data=self.data, **kwargs)
-            show = Show(item["id"], **item)
+            show = Show._shared(item["id"], item)
             crew.append((show, credit))
         return crew
 
-    @property
+    @memoized_property
     def cast(self):
         """Return movies and shows as list of tuples
         `(Movie or Show, Credit)`."""
@@ -2124,11 +2330,11 @@ class Person(TMDb):
                 **kwargs,
             )
             Obj = Show if item["media_type"] == "tv" else Movie
-            obj = Obj(item["id"], **item)
+            obj = Obj._shared(item["id"], item)
             cast.append((obj, credit))
         return cast
 
-    @property
+    @memoized_property
     def crew(self):
         """Return movies and shows as list of tuples
         `(Movie or Show, Credit)`."""
@@ -2142,7 +2348,7 @@ class Person(TMDb):
             }
             credit = Credit(item["credit_id"], person_data=self.data, **kwargs)
             Obj = Show if item["media_type"] == "tv" else Movie
-            obj = Obj(item["id"], **item)
+            obj = Obj._shared(item["id"], item)
             crew.append((obj, credit))
         return crew
 
@@ -2181,25 +2387,24 @@ class Person(TMDb):
         """Return the ID of a person on Twitter."""
         return self._getdata("external_ids")["twitter_id"]
 
-    @property
+    @memoized_property
     def profiles(self):
         """Return images that belong to a person. Each item is
         an instance of the `Image` class."""
 
         def _i(i):
-            return Image(i, type_="profile")
+            return Image(i, type_="profile", reference=self._reference)
 
         return list(map(_i, self._getdata("images")["profiles"]))
 
-    def get_all(self, **params):
+    def get_all(self, append=None, **params):
         """Get all information about a person in a single
-        response."""
-        methods = ",".join(URL.ALL_PERSON_SECOND_SUFFIXES)
-        all_data = self.get_details(
-            **{"append_to_response": methods, **params}
-        )
-        self.data.update(all_data)
-        return all_data
+        response.
+
+        The optional `append` argument is a list of the
+        sub-resources to include, such as `["credits"]`.
+        (Default: `default_append`)"""
+        return self._get_all(append, **params)
 
     def get_details(self, **params):
         """Get the primary person details."""
@@ -2264,7 +2469,7 @@ class Person(TMDb):
     def iter_tagged_images(self, **params):
         """Get the images that this person has been tagged
         in."""
-        yield from self._iter_request(
+        return self._iter_request(
             URL.PERSON_TAGGED_IMAGES.format(person_id=self.tmdb_id), **params
         )
 
@@ -2281,6 +2486,8 @@ class Person(TMDb):
 class Keyword(TMDb):
     """Represents a keyword."""
 
+    __slots__ = ()
+
     def _init(self):
         self.get_details()
 
@@ -2289,20 +2496,24 @@ class Keyword(TMDb):
         """Return a keyword's name"""
         return self._getdata("name")
 
+    @property
+    def _details_url(self):
+        return URL.KEYWORD_DETAILS.format(keyword_id=self.tmdb_id)
+
     def get_details(self):
         """Get the primary information about a keyword."""
-        details = self._request(
-            URL.KEYWORD_DETAILS.format(keyword_id=self.tmdb_id)
-        )
+        details = self._request(self._details_url)
         self.data.update(details)
         return details
 
-    def iter_movies(self, **params):
+    def iter_movies(self, *, prefetch=0, **params):
         """Get the movies that belong to a keyword."""
-        results = self._iter_request(
-            URL.KEYWORD_MOVIES.format(keyword_id=self.tmdb_id), **params
+        return self._iter_request(
+            URL.KEYWORD_MOVIES.format(keyword_id=self.tmdb_id),
+            prefetch=prefetch,
+            item=lambda item: Movie._shared(item["id"], item),
+            **params,
         )
-        yield from map(lambda x: Movie(x["id"]), results)
 
     def __str__(self):
         return self._getdata("name")
@@ -2319,24 +2530,48 @@ class Genre(NamedTuple):
 
 
 class Image:
-    """Represents an image."""
-
-    def __init__(self, image: dict, *, type_: str):
+    """Represents an image. The fields of the image (such as
+    `file_path`, `width` or `height`) are its attributes."""
+
+    __slots__ = (
+        "_type",
+        "aspect_ratio",
+        "file_path",
+        "height",
+        "width",
+        "iso_639_1",
+        "vote",
+        "_extra",
+        "_reference",
+    )
+
+    def __init__(self, image: dict, *, type_: str, reference=None):
         assert type_ in ["backdrop", "poster", "logo", "profile", "still"]
         self._type = type_
-        self._configs_data = {}
+        self._reference = reference or REGISTRY._table
+        self._extra = None
         for key in image.keys() - {"vote_average", "vote_count"}:
-            setattr(self, key, image[key])
+            if key in Image.__slots__:
+                setattr(self, key, image[key])
+            else:
+                # Fields which are not known in advance.
+                if self._extra is None:
+                    self._extra = {}
+                self._extra[key] = image[key]
         if {"vote_average", "vote_count"} <= image.keys():
             self.vote = Vote(
                 average=image["vote_average"], count=image["vote_count"]
             )
 
+    def __getattr__(self, name):
+        extra = None if name.startswith("_") else self._extra
+        if extra is None or name not in extra:
+            raise AttributeError(name)
+        return extra[name]
+
     @property
     def _configs(self):
-        if not self._configs_data:
-            self._configs_data.update(self._get_image_configs())
-        return self._configs_data
+        return self._reference("images")
 
     @property
     def url(self):
@@ -2348,7 +2583,8 @@ class Image:
 
     @property
     def sizes(self):
-        return self._configs[self._image_sizes_key]
+        # A read-only view: the configuration is shared by all images.
+        return freeze(self._configs[self._image_sizes_key])
 
     @property
     def _image_sizes_key(self):
@@ -2365,12 +2601,6 @@ class Image:
         else:
             raise ValueError(f"Unknown image type: {self._type}")
 
-    def _get_image_configs(self):
-        res = GET(URL.IMAGE_CONFIGURATION, **{"api_key": tmdb_api_key()})[
-            "images"
-        ]
-        return res
-
     def __repr__(self):
         return f"Image(height={self.height}, width={self.width}, _type={self._type})"
 
@@ -2420,8 +2650,10 @@ class Video(NamedTuple):
 class Credit(TMDb):
     """Represents a credit."""
 
+    __slots__ = ("_person_data", "_media_data", "_character")
+
     def __init__(self, tmdb_id, **kwargs):
-        self.data = {"credit_id": tmdb_id, **kwargs}
+        self.data = Data({"credit_id": tmdb_id, **_payload(kwargs)})
         self.tmdb_id = self.data["credit_id"]
         self._person_data = kwargs.get("person_data")
         self._media_data = kwargs.get("media_data")
@@ -2455,29 +2687,31 @@ class Credit(TMDb):
             return None
         return self._character or self._getdata("media")["character"]
 
-    @property
+    @memoized_property
     def person(self):
         data = self._person_data or self._getdata("person")
-        return Person(data["id"], **data)
+        return Person._shared(data["id"], data)
 
-    @property
+    @memoized_property
     def person_known_for(self):
         media = []
         for item in self._getdata("person")["known_for"]:
             Obj = Show if item["media_type"] == "tv" else Movie
-            media.append(Obj(item["id"], **item))
+            media.append(Obj._shared(item["id"], item))
         return media
 
-    @property
+    @memoized_property
     def media(self):
         Obj = Show if self.media_type == "tv" else Movie
         if self._media_data:
             data = self._media_data
         else:
-            data = self._getdata("media")
-            data.pop("seasons", None)
-            data.pop("episodes", None)
-        return Obj(data["id"], **data)
+            data = {
+                key: value
+                for key, value in self._getdata("media").items()
+                if key not in ("seasons", "episodes")
+            }
+        return Obj._shared(data["id"], data)
 
     def get_details(self):
         """Get a movie or TV credit details."""
@@ -12,10 +12,10 @@ def get_popular(**kwargs):
     """Get the current popular people on TMDb. This list updates
     daily.
 
-    Returns a generator. Each item is a `Show` object."""
+    Returns a generator with `total_pages` and `total_results`
+    attributes. Each item is a `Person` object."""
     params = {"api_key": tmdb_api_key(), **kwargs}
-    for item in GET_pages(URL.PERSON_GET_POPULAR, params):
-        yield Person(item["id"], **item)
+    return GET_pages(URL.PERSON_GET_POPULAR, params, item=_person)
 
 
 def get_latest(**kwargs):
@@ -24,3 +24,7 @@ def get_latest(**kwargs):
     params = {"api_key": tmdb_api_key(), **kwargs}
     item = GET(URL.PERSON_GET_LATEST, **params)
     return Person(item["id"], **item)
+
+
+def _person(item):
+    return Person(item["id"], **item)
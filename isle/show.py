@@ -26,10 +26,10 @@ def get_airing_today(**kwargs):
     """Get TV shows that are airing today. This query is purely day
     based as we do not currently support airing times.
 
-    Returns a generator. Each item is a `Show` object."""
+    Returns a generator with `total_pages` and `total_results`
+    attributes. Each item is a `Show` object."""
     params = {"api_key": tmdb_api_key(), **kwargs}
-    for item in GET_pages(URL.SHOW_GET_AIRING_TODAY, params):
-        yield Show(item["id"], **item)
+    return GET_pages(URL.SHOW_GET_AIRING_TODAY, params, item=_show)
 
 
 def get_on_the_air(**kwargs):
@@ -37,26 +37,30 @@ def get_on_the_air(**kwargs):
     for any TV show that has an episode with an air date in the
     next 7 days.
 
-    Returns a generator. Each item is a `Show` object."""
+    Returns a generator with `total_pages` and `total_results`
+    attributes. Each item is a `Show` object."""
     params = {"api_key": tmdb_api_key(), **kwargs}
-    for item in GET_pages(URL.SHOW_GET_ON_THE_AIR, params):
-        yield Show(item["id"], **item)
+    return GET_pages(URL.SHOW_GET_ON_THE_AIR, params, item=_show)
 
 
 def get_popular(**kwargs):
     """Get the current popular TV shows on TMDb. This list updates
     daily.
 
-    Returns a generator. Each item is a `Show` object."""
+    Returns a generator with `total_pages` and `total_results`
+    attributes. Each item is a `Show` object."""
     params = {"api_key": tmdb_api_key(), **kwargs}
-    for item in GET_pages(URL.SHOW_GET_POPULAR, params):
-        yield Show(item["id"], **item)
+    return GET_pages(URL.SHOW_GET_POPULAR, params, item=_show)
 
 
 def get_top_rated(**kwargs):
     """Get the top rated TV shows on TMDb.
 
-    Returns a generator. Each item is a `Show` object."""
+    Returns a generator with `total_pages` and `total_results`
+    attributes. Each item is a `Show` object."""
     params = {"api_key": tmdb_api_key(), **kwargs}
-    for item in GET_pages(URL.SHOW_GET_TOP_RATED, params):
-        yield Show(item["id"], **item)
+    return GET_pages(URL.SHOW_GET_TOP_RATED, params, item=_show)
+
+
+def _show(item):
+    return Show(item["id"], **item)
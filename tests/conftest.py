@@ -0,0 +1,89 @@
+import json
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+
+
+class StubServer(socketserver.ThreadingMixIn, HTTPServer):
+    """A local HTTP/1.1 server that answers with canned JSON.
+
+    `routes` maps a path to a dict, or to a callable which takes
+    the request and returns `(status, headers, body)`. Every
+    request is recorded in `requests` and every accepted
+    connection is counted in `connections`. If `drop_connections`
+    is set, the server silently closes kept-alive connections
+    after each response."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.routes = {}
+        self.requests = []
+        self.connections = 0
+        self.drop_connections = False
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        host, port = self.server_address
+        return f"http://{host}:{port}"
+
+    def get_request(self):
+        with self.lock:
+            self.connections += 1
+        return super().get_request()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _handle(self):
+        parts = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        request = {
+            "method": self.command,
+            "path": parts.path,
+            "params": dict(parse_qsl(parts.query)),
+            "headers": dict(self.headers),
+            "body": json.loads(self.rfile.read(length)) if length else None,
+        }
+        with self.server.lock:
+            self.server.requests.append(request)
+        route = self.server.routes.get(parts.path)
+        if route is None:
+            status, headers, body = 404, {}, {"status_code": 34}
+        elif callable(route):
+            status, headers, body = route(request)
+        else:
+            status, headers, body = 200, {}, route
+        payload = body if isinstance(body, bytes) else json.dumps(body)
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+        if self.server.drop_connections:
+            self.close_connection = True
+
+    do_GET = do_POST = do_DELETE = _handle
+
+
+@pytest.fixture
+def server():
+    server = StubServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
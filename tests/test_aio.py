@@ -0,0 +1,361 @@
+import asyncio
+import threading
+import time
+from urllib.error import HTTPError, URLError
+
+import pytest
+
+import isle.aio
+from isle.aio import _requests, objects
+from isle import _registry
+from isle import _requests as sync_requests
+from isle import _urls as URL
+from isle._ratelimit import RateLimiter
+from isle.aio._http import AsyncConnectionPool
+from isle.aio._requests import GET, GET_pages, POST
+
+
+@pytest.fixture
+def run():
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+@pytest.fixture(autouse=True)
+def pool(monkeypatch):
+    pool = AsyncConnectionPool()
+    monkeypatch.setattr(_requests, "_pool", pool)
+    return pool
+
+
+@pytest.fixture(autouse=True)
+def limiter(monkeypatch):
+    limiter = RateLimiter(rate=None, retries=3, backoff=0.01)
+    monkeypatch.setattr(sync_requests, "_limiter", limiter)
+    return limiter
+
+
+def paginate(n_pages):
+    def route(request):
+        page = int(request["params"]["page"])
+        return 200, {}, {"results": [page], "total_pages": n_pages}
+
+    return route
+
+
+def test_get(server, run):
+    server.routes["/movie/1"] = {"id": 1}
+    assert run(GET(f"{server.url}/movie/1", api_key="key")) == {"id": 1}
+    assert server.requests[0]["params"] == {"api_key": "key"}
+
+
+def test_get_reuses_connection(server, run):
+    server.routes["/movie/1"] = {"id": 1}
+
+    async def main():
+        for _ in range(5):
+            await GET(f"{server.url}/movie/1")
+
+    run(main())
+    assert len(server.requests) == 5
+    assert server.connections == 1
+
+
+def test_concurrent_requests_share_limited_connections(server, run, pool):
+    server.routes["/movie/1"] = lambda r: (200, {}, {"n": r["params"]["n"]})
+    pool.limit = 4
+
+    async def main():
+        requests = [GET(f"{server.url}/movie/1", n=n) for n in range(100)]
+        return await asyncio.gather(*requests)
+
+    assert run(main()) == [{"n": str(n)} for n in range(100)]
+    assert server.connections <= 4
+
+
+def test_concurrent_identical_requests_share_one_response(server, run):
+    def route(request):
+        time.sleep(0.1)
+        return 200, {}, {"id": 1}
+
+    server.routes["/movie/1"] = route
+
+    async def main():
+        url = f"{server.url}/movie/1"
+        return await asyncio.gather(*(GET(url) for _ in range(5)))
+
+    results = run(main())
+    assert results == [{"id": 1}] * 5
+    assert len({id(result) for result in results}) == 5
+    assert len(server.requests) == 1
+    assert _requests._flights == {}
+
+
+def test_concurrent_requests_with_different_api_keys_are_sent(server, run):
+    def route(request):
+        time.sleep(0.1)
+        if request["params"]["api_key"] != "valid":
+            return 401, {}, {"status_code": 7}
+        return 200, {}, {"id": 1}
+
+    server.routes["/movie/1"] = route
+
+    async def main():
+        url = f"{server.url}/movie/1"
+        return await asyncio.gather(
+            GET(url, api_key="invalid"),
+            GET(url, api_key="valid"),
+            return_exceptions=True,
+        )
+
+    invalid, valid = run(main())
+    assert isinstance(invalid, HTTPError) and valid == {"id": 1}
+    assert len(server.requests) == 2
+
+
+def test_post_sends_json(server, run):
+    server.routes["/list"] = lambda r: (201, {}, {"body": r["body"]})
+    assert run(POST(f"{server.url}/list", {"a": 1})) == {"body": {"a": 1}}
+
+
+def test_raises_http_error(server, run):
+    with pytest.raises(HTTPError) as error:
+        run(GET(f"{server.url}/missing"))
+    assert error.value.code == 404
+
+
+def test_reconnects_when_server_drops_idle_connection(server, run):
+    server.routes["/movie/1"] = {"id": 1}
+    server.drop_connections = True
+
+    async def main():
+        for _ in range(3):
+            assert await GET(f"{server.url}/movie/1") == {"id": 1}
+
+    run(main())
+    assert len(server.requests) == 3
+
+
+def test_raises_when_a_proxy_is_needed(server, run, monkeypatch):
+    monkeypatch.setenv("http_proxy", "http://127.0.0.1:9")
+    monkeypatch.delenv("no_proxy", raising=False)
+    with pytest.raises(URLError):
+        run(GET(f"{server.url}/movie/1"))
+    assert server.requests == []
+
+
+@pytest.mark.parametrize("prefetch", [0, 3])
+def test_get_pages(server, run, prefetch):
+    server.routes["/discover/movie"] = paginate(7)
+
+    async def main():
+        url = f"{server.url}/discover/movie"
+        return [item async for item in GET_pages(url, {}, prefetch)]
+
+    assert run(main()) == list(range(1, 8))
+    assert len(server.requests) == 7
+
+
+def test_search_movie_yields_async_movies(monkeypatch, run):
+    async def fake_pages(url, params, prefetch, item):
+        yield item({"id": 18148, "title": "Tokyo Story"})
+
+    monkeypatch.setattr(isle.aio._api, "GET_pages", fake_pages)
+
+    async def main():
+        return [movie async for movie in isle.aio.search_movie("Tokyo")]
+
+    (movie,) = run(main())
+    assert isinstance(movie, isle.aio.Movie)
+    assert movie.data["title"] == "Tokyo Story"
+
+
+def test_discover_movies_exposes_totals(monkeypatch, run):
+    requests = []
+
+    async def fake_get(url, **params):
+        requests.append(params["page"])
+        return {
+            "results": [{"id": params["page"]}],
+            "total_pages": 3,
+            "total_results": 3,
+        }
+
+    monkeypatch.setattr(_requests, "GET", fake_get)
+
+    async def main():
+        movies = isle.aio.discover_movies({})
+        totals = await movies.total_pages, await movies.total_results
+        return totals, [movie async for movie in movies]
+
+    totals, movies = run(main())
+    assert totals == (3, 3)
+    assert [movie.tmdb_id for movie in movies] == [1, 2, 3]
+    assert isinstance(movies[0], isle.aio.Movie)
+    assert requests == [1, 2, 3]
+
+
+def test_properties_never_request_reference_data(monkeypatch, run):
+    requests = []
+
+    async def fake_get(url, **params):
+        requests.append(url)
+        return {"genres": [{"id": 18, "name": "Drama"}]}
+
+    def sync_get(url, **params):
+        raise AssertionError("blocking request")
+
+    registry = _registry._Registry(_registry._SOURCES)
+    monkeypatch.setattr(_registry, "_registry", registry)
+    monkeypatch.setattr(_registry, "GET", sync_get)
+    monkeypatch.setattr(isle.aio._api, "GET", fake_get)
+    movie = isle.aio.Movie(
+        1, genre_ids=[18], images={"posters": [{"file_path": "/1.jpg"}]}
+    )
+
+    async def main():
+        with pytest.raises(RuntimeError):
+            movie.genres
+        with pytest.raises(RuntimeError):
+            movie.posters[0].url
+        await isle.aio.load_reference_data("movie_genres")
+        return movie.genres
+
+    (genre,) = run(main())
+    assert genre.name == "Drama"
+    assert requests == [URL.MOVIE_GENRES]
+
+
+def test_search_company_yields_async_companies(monkeypatch, run):
+    async def fake_pages(url, params, prefetch, item):
+        yield item({"id": 1, "logo_path": None})
+
+    monkeypatch.setattr(isle.aio._api, "GET_pages", fake_pages)
+    monkeypatch.setattr(objects, "GET", lambda *args, **kwargs: 1 / 0)
+
+    async def main():
+        return [company async for company in isle.aio.search_company("A")]
+
+    (company,) = run(main())
+    assert isinstance(company, isle.aio.Company)
+    with pytest.raises(RuntimeError):
+        company.name
+
+
+def test_get_all_is_awaitable(monkeypatch, run):
+    calls = []
+
+    async def fake_get(url, **params):
+        calls.append((url, params))
+        return {"id": 18148, "runtime": 136}
+
+    monkeypatch.setattr(objects, "GET", fake_get)
+    movie = isle.aio.Movie(18148)
+    with pytest.raises(RuntimeError):
+        movie.runtime
+    run(movie.get_all())
+    assert movie.runtime == 136
+    assert movie.n_requests == 1
+    url, params = calls[0]
+    assert url.endswith("/movie/18148")
+    assert "credits" in params["append_to_response"]
+
+
+def test_get_seasons_is_awaitable(monkeypatch, run):
+    requests = []
+
+    async def fake_get(url, **params):
+        keys = params.get("append_to_response", "")
+        requests.append(keys)
+        if not keys:
+            seasons = [{"season_number": n} for n in range(25)]
+            return {"id": 1, "seasons": seasons}
+        return {key: {"id": 100, "episodes": []} for key in keys.split(",")}
+
+    monkeypatch.setattr(objects, "GET", fake_get)
+    show = isle.aio.Show(1)
+    assert len(run(show.get_seasons())) == 25
+    assert requests[0] == ""
+    assert requests[2] == ",".join(f"season/{n}" for n in range(20, 25))
+    assert show.n_requests == 3
+
+
+def test_episode_details_url():
+    episode = isle.aio.Episode(2, show_id=1, season_number=3)
+    assert episode._details_url.endswith("/tv/1/season/3/episode/2")
+
+
+def test_retries_after_too_many_requests(server, run):
+    responses = iter([429, 200])
+    server.routes["/movie/1"] = lambda r: (
+        next(responses), {"Retry-After": "0"}, {}
+    )
+    run(GET(f"{server.url}/movie/1"))
+    assert len(server.requests) == 2
+
+
+def test_rate_limit_is_shared_with_sync_api(server, run, limiter):
+    server.routes["/movie/1"] = {"id": 1}
+    limiter.rate, limiter.burst, limiter._tokens = 100.0, 1, 1.0
+
+    async def main():
+        url = f"{server.url}/movie/1"
+        await asyncio.gather(*(GET(url, n=n) for n in range(11)))
+
+    start = time.monotonic()
+    run(main())
+    assert time.monotonic() - start >= 10 / 100 * 0.9
+
+
+def test_expired_responses_are_revalidated(server, run, monkeypatch):
+    for name in ("_cache", "_ttl", "_ttls"):
+        monkeypatch.setattr(
+            sync_requests, name, getattr(sync_requests, name)
+        )
+    isle.configure_cache(isle.MemoryCache(), ttl=0.001)
+
+    def route(request):
+        if request["headers"].get("If-None-Match") == '"v1"':
+            return 304, {"ETag": '"v1"'}, b""
+        return 200, {"ETag": '"v1"'}, {"id": 1}
+
+    server.routes["/movie/1"] = route
+    assert run(GET(f"{server.url}/movie/1")) == {"id": 1}
+    time.sleep(0.01)
+    assert run(GET(f"{server.url}/movie/1")) == {"id": 1}
+    assert [r["headers"].get("If-None-Match") for r in server.requests] == [
+        None,
+        '"v1"',
+    ]
+
+
+def test_sqlite_cache_runs_outside_the_event_loop(
+    server, run, monkeypatch, tmp_path
+):
+    for name in ("_cache", "_ttl", "_ttls"):
+        monkeypatch.setattr(
+            sync_requests, name, getattr(sync_requests, name)
+        )
+    cache = isle.SQLiteCache(tmp_path / "cache.sqlite")
+    threads = []
+    for method in ("get", "set", "invalidate"):
+
+        def record(*args, function=getattr(cache, method)):
+            threads.append(threading.current_thread())
+            return function(*args)
+
+        monkeypatch.setattr(cache, method, record)
+    isle.configure_cache(cache)
+    server.routes["/movie/1"] = {"id": 1}
+    server.routes["/movie/1/rating"] = lambda r: (201, {}, {})
+
+    async def main():
+        await GET(f"{server.url}/movie/1")
+        await GET(f"{server.url}/movie/1")
+        await POST(f"{server.url}/movie/1/rating", {"value": 8})
+
+    run(main())
+    assert len(server.requests) == 2
+    assert len(threads) == 5
+    assert threading.main_thread() not in threads
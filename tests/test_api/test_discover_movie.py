@@ -1,7 +1,7 @@
 import pytest
-import inspect
 import json
 import os
+from collections.abc import Generator
 from urllib.parse import urlencode
 from urllib.request import urlopen
 
@@ -33,7 +33,7 @@ def results():
 
 
 def test_output_is_generator(results):
-    assert inspect.isgenerator(results[1])
+    assert isinstance(results[1], Generator)
 
 
 def test_output_item_is_Movie_instance(results):
@@ -43,3 +43,24 @@ def test_output_item_is_Movie_instance(results):
 
 def test_amount_of_results(results, n_results):
     assert len(list(results[0])) == n_results
+
+
+def test_totals_are_read_from_the_first_page(monkeypatch):
+    requests = []
+
+    def GET(url, **params):
+        requests.append(params["page"])
+        return {
+            "page": params["page"],
+            "results": [{"id": params["page"], "title": "Tokyo Story"}],
+            "total_pages": 2,
+            "total_results": 2,
+        }
+
+    monkeypatch.setattr(isle._requests, "GET", GET)
+    movies = isle.discover_movies(OPTIONS)
+    assert (movies.total_pages, movies.total_results) == (2, 2)
+    movies = list(movies)
+    assert [movie.tmdb_id for movie in movies] == [1, 2]
+    assert all(isinstance(movie, Movie) for movie in movies)
+    assert requests == [1, 2]
@@ -0,0 +1,135 @@
+import threading
+import time
+from urllib.error import HTTPError
+
+import pytest
+
+import isle
+from isle import _api, _requests
+
+
+EMPTY = {
+    "movie_results": [],
+    "person_results": [],
+    "tv_results": [],
+    "tv_episode_results": [],
+    "tv_season_results": [],
+}
+
+RESPONSES = {
+    "tt0046438": {
+        **EMPTY,
+        "movie_results": [{"id": 18148, "title": "Tokyo Story"}],
+    },
+    "5468124": {
+        **EMPTY,
+        "tv_episode_results": [
+            {
+                "id": 1130462,
+                "episode_number": 1,
+                "season_number": 1,
+                "show_id": 63926,
+            }
+        ],
+    },
+}
+
+
+@pytest.fixture(autouse=True)
+def requests(monkeypatch):
+    requests = []
+    lock = threading.Lock()
+
+    def find_response(external_id, params):
+        with lock:
+            requests.append(external_id)
+        time.sleep(0.01)
+        if external_id == "tt500":
+            raise HTTPError("", 500, "Internal Server Error", {}, None)
+        return RESPONSES.get(external_id, EMPTY)
+
+    monkeypatch.setattr(_api, "_find_response", find_response)
+    return requests
+
+
+@pytest.fixture
+def cache():
+    return isle.MemoryCache()
+
+
+def test_find_many_yields_the_results_of_each_id(requests, cache):
+    ids = ["tt0046438", "tt0"]
+    found = dict(isle.find_many(ids, src="imdb_id", cache=cache))
+    assert [m.tmdb_id for m in found["tt0046438"]["movie_results"]] == [18148]
+    assert not any(found["tt0"].values())
+    assert sorted(requests) == ["tt0", "tt0046438"]
+
+
+def test_find_many_looks_up_repeated_ids_once(requests, cache):
+    ids = ["tt0046438", "tt0", "tt0046438", "tt0"] * 10
+    assert len(list(isle.find_many(ids, src="imdb_id", cache=cache))) == 2
+    assert sorted(requests) == ["tt0", "tt0046438"]
+
+
+def test_find_many_requests_concurrently(monkeypatch, cache):
+    barrier = threading.Barrier(4, timeout=5)
+
+    def find_response(external_id, params):
+        barrier.wait()  # fails unless 4 requests are in flight at once
+        return EMPTY
+
+    monkeypatch.setattr(_api, "_find_response", find_response)
+    ids = [f"tt{i}" for i in range(8)]
+    found = isle.find_many(ids, src="imdb_id", cache=cache, workers=4)
+    assert len(list(found)) == 8
+
+
+def test_find_many_caches_results_and_unknown_ids(requests, cache):
+    ids = ["tt0046438", "tt0"]
+    list(isle.find_many(ids, src="imdb_id", cache=cache))
+    found = dict(isle.find_many(ids, src="imdb_id", cache=cache))
+    assert found["tt0046438"]["movie_results"][0].tmdb_id == 18148
+    assert not any(found["tt0"].values())
+    assert len(requests) == 2
+
+
+def test_find_many_keeps_options_apart(requests, cache):
+    for language in ("fr", "de"):
+        found = isle.find_many(
+            ["tt0"], src="imdb_id", cache=cache, language=language
+        )
+        list(found)
+    assert len(requests) == 2
+
+
+def test_find_many_keeps_going_after_a_failed_lookup(requests, cache):
+    ids = [f"tt{i}" for i in range(1000)]
+    found = dict(isle.find_many(ids, src="imdb_id", cache=cache))
+    assert len(found) == 1000
+    assert isinstance(found["tt500"], HTTPError)
+    assert not any(found["tt499"].values())
+    list(isle.find_many(["tt500"], src="imdb_id", cache=cache))
+    assert requests.count("tt500") == 2
+
+
+def test_find_many_does_not_use_the_response_cache(monkeypatch, cache):
+    class Response:
+        body = b'{"movie_results": []}'
+
+    monkeypatch.setattr(_requests, "_cache", isle.MemoryCache())
+    monkeypatch.setattr(_requests, "_send", lambda *args: Response())
+    list(isle.find_many(["tt0"], src="imdb_id", cache=cache))
+    assert len(_requests._cache) == 0
+    assert len(cache) == 1
+
+
+def test_find_does_not_mutate_the_response(monkeypatch):
+    response = RESPONSES["5468124"]
+    monkeypatch.setattr(_api, "GET", lambda url, **params: response)
+    episode = isle.find("5468124", src="tvdb_id")["tv_episode_results"][0]
+    assert (episode.show_id, episode.season_number, episode.number) == (
+        63926,
+        1,
+        1,
+    )
+    assert response["tv_episode_results"][0]["show_id"] == 63926
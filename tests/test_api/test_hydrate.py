@@ -0,0 +1,74 @@
+import threading
+import time
+
+import isle
+from isle import objects
+
+
+def test_hydrate_loads_objects_concurrently(monkeypatch):
+    barrier = threading.Barrier(4, timeout=5)
+
+    def fake_get(url, **params):
+        barrier.wait()  # fails unless 4 requests are in flight at once
+        return {"id": int(url.rsplit("/", 1)[-1]), "runtime": 90}
+
+    monkeypatch.setattr(objects, "GET", fake_get)
+    movies = [isle.Movie(n) for n in range(8)]
+    assert isle.hydrate(movies, workers=4) == []
+    assert all(movie.data["runtime"] == 90 for movie in movies)
+    assert all(movie.n_requests == 1 for movie in movies)
+
+
+def test_hydrate_returns_errors(monkeypatch):
+    def fake_get(url, **params):
+        if url.endswith("/2"):
+            raise ValueError("not found")
+        return {"runtime": 90}
+
+    monkeypatch.setattr(objects, "GET", fake_get)
+    movies = [isle.Movie(1), isle.Movie(2), isle.Person(3)]
+    errors = isle.hydrate(movies, workers=2)
+    assert [(obj, type(error)) for obj, error in errors] == [
+        (movies[1], ValueError)
+    ]
+    assert movies[0].data["runtime"] == 90
+    assert movies[2].data["runtime"] == 90
+
+
+def test_hydrate_skips_objects_loaded_while_waiting(monkeypatch):
+    requests = []
+
+    def fake_get(url, **params):
+        requests.append(url)
+        time.sleep(0.2)
+        return {"id": 1, "runtime": 90}
+
+    monkeypatch.setattr(objects, "GET", fake_get)
+    movie = isle.Movie(1)
+    reader = threading.Thread(target=lambda: movie.runtime)
+    reader.start()
+    time.sleep(0.05)
+    assert isle.hydrate([movie]) == []
+    reader.join()
+    assert len(requests) == 1
+
+
+def test_hydrate_loads_details_after_another_resource(monkeypatch):
+    requests = []
+
+    def fake_get(url, **params):
+        requests.append(url)
+        time.sleep(0.2)
+        if url.endswith("/credits"):
+            return {"cast": [], "crew": []}
+        return {"id": 1, "runtime": 90}
+
+    monkeypatch.setattr(objects, "GET", fake_get)
+    movie = isle.Movie(1)
+    reader = threading.Thread(target=lambda: movie.cast)
+    reader.start()
+    time.sleep(0.05)
+    assert isle.hydrate([movie]) == []
+    reader.join()
+    assert movie.data["runtime"] == 90
+    assert len(requests) == 2
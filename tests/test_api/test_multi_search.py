@@ -1,6 +1,6 @@
-import inspect
 import json
 import os
+from collections.abc import Generator
 from urllib.parse import urlencode
 from urllib.request import urlopen
 
@@ -37,7 +37,7 @@ def results():
 
 
 def test_output_is_generator(results):
-    assert inspect.isgenerator(results[1])
+    assert isinstance(results[1], Generator)
 
 
 def test_output_item_type(results):
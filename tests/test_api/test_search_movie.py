@@ -1,7 +1,7 @@
 import pytest
-import inspect
 import os
 import json
+from collections.abc import Generator
 from urllib.parse import urlencode
 from urllib.request import urlopen
 
@@ -38,7 +38,7 @@ def results():
 
 
 def test_output_is_generator(results):
-    assert inspect.isgenerator(results[1])
+    assert isinstance(results[1], Generator)
 
 
 def test_output_item_is_Movie_instance(results):
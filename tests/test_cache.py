@@ -0,0 +1,286 @@
+import multiprocessing
+import os
+import threading
+import time
+
+import pytest
+
+import isle
+from isle import _requests
+from isle._cache import MemoryCache, SQLiteCache
+from isle._requests import DELETE, GET, POST
+
+
+@pytest.fixture(autouse=True)
+def cache(monkeypatch):
+    for name in ("_cache", "_ttl", "_ttls"):
+        monkeypatch.setattr(_requests, name, getattr(_requests, name))
+    cache = MemoryCache()
+    isle.configure_cache(cache)
+    return cache
+
+
+def test_memory_cache_get_and_set():
+    cache = MemoryCache()
+    assert cache.get("a") is None
+    cache.set("a", b"1", 60)
+    assert cache.get("a").body == b"1"
+    assert cache.stats() == {"entries": 1, "bytes": 1, "hits": 1, "misses": 1}
+
+
+def test_memory_cache_expires_entries():
+    cache = MemoryCache()
+    cache.set("a", b"1", 0.05)
+    time.sleep(0.1)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(maxsize=2)
+    cache.set("a", b"1", 60)
+    cache.set("b", b"2", 60)
+    cache.get("a")
+    cache.set("c", b"3", 60)
+    assert cache.get("b") is None
+    assert cache.get("a").body == b"1"
+    assert cache.get("c").body == b"3"
+
+
+def test_memory_cache_is_bounded_by_bytes():
+    cache = MemoryCache(maxbytes=10)
+    for key in "abcd":
+        cache.set(key, b"1234", 60)
+    assert cache.stats()["bytes"] == 8
+    assert cache.get("a") is None and cache.get("d").body == b"1234"
+
+
+def test_memory_cache_invalidate():
+    cache = MemoryCache()
+    for key in ("/list/1", "/list/1?language=en", "/list/1/x", "/list/12"):
+        cache.set(key, b"1", 60)
+    cache.invalidate("/list/1")
+    assert len(cache) == 1 and cache.get("/list/12").body == b"1"
+
+
+def test_get_is_cached(server):
+    server.routes["/movie/1"] = {"id": 1}
+    assert GET(f"{server.url}/movie/1", language="en") == {"id": 1}
+    assert GET(f"{server.url}/movie/1", language="en") == {"id": 1}
+    assert len(server.requests) == 1
+    GET(f"{server.url}/movie/1", language="fr")
+    assert len(server.requests) == 2
+
+
+def test_cached_responses_are_copies(server):
+    server.routes["/movie/1"] = {"id": 1}
+    GET(f"{server.url}/movie/1")["id"] = 2
+    assert GET(f"{server.url}/movie/1") == {"id": 1}
+
+
+def test_cache_key_ignores_api_key_and_order(server):
+    server.routes["/movie/1"] = {"id": 1}
+    GET(f"{server.url}/movie/1", api_key="a", language="en", page=1)
+    GET(f"{server.url}/movie/1", page=1, language="en", api_key="b")
+    assert len(server.requests) == 1
+    assert _requests._cache_key("/movie/1", {"api_key": "a"}) == "/movie/1"
+
+
+def test_latest_is_never_cached(server):
+    server.routes["/movie/latest"] = {"id": 1}
+    GET(f"{server.url}/movie/latest")
+    GET(f"{server.url}/movie/latest")
+    assert len(server.requests) == 2
+
+
+def test_ttl_per_endpoint(server, cache):
+    isle.configure_cache(cache, ttl=60, ttls={"/movie/*": 0.05})
+    server.routes["/movie/1"] = {"id": 1}
+    server.routes["/tv/1"] = {"id": 1}
+    for _ in range(2):
+        GET(f"{server.url}/movie/1")
+        GET(f"{server.url}/tv/1")
+        time.sleep(0.1)
+    assert [r["path"] for r in server.requests].count("/movie/1") == 2
+    assert [r["path"] for r in server.requests].count("/tv/1") == 1
+
+
+def test_default_ttls():
+    assert _requests._ttl_for(isle._urls.IMAGE_CONFIGURATION) == 86400
+    assert _requests._ttl_for(isle._urls.MOVIE_GET_LATEST) == 0
+    assert _requests._ttl_for(f"{isle._urls.BASE}/3/movie/1") == 3600
+
+
+def test_writes_invalidate_the_resource(server):
+    server.routes["/list/1"] = {"items": []}
+    server.routes["/list/1/add_item"] = {"status_code": 12}
+    server.routes["/list/2"] = {"items": []}
+    GET(f"{server.url}/list/1")
+    GET(f"{server.url}/list/2")
+    POST(f"{server.url}/list/1/add_item", {"media_id": 1})
+    GET(f"{server.url}/list/1")
+    GET(f"{server.url}/list/2")
+    paths = [r["path"] for r in server.requests]
+    assert paths.count("/list/1") == 2 and paths.count("/list/2") == 1
+    DELETE(f"{server.url}/list/1", {})
+    GET(f"{server.url}/list/1")
+    gets = [r["path"] for r in server.requests if r["method"] == "GET"]
+    assert gets.count("/list/1") == 3
+
+
+def test_no_cache(server):
+    isle.configure_cache(None)
+    server.routes["/movie/1"] = {"id": 1}
+    GET(f"{server.url}/movie/1")
+    GET(f"{server.url}/movie/1")
+    assert len(server.requests) == 2
+
+
+def fill_cache(path, start):
+    cache = SQLiteCache(path)
+    for i in range(start, start + 50):
+        cache.set(f"/movie/{i}", b'{"id": %d}' % i, 60)
+
+
+def test_sqlite_cache_get_and_set(tmp_path):
+    cache = SQLiteCache(tmp_path / "cache.db")
+    assert cache.get("a") is None
+    cache.set("a", b"1" * 1000, 60, "v1")
+    assert cache.get("a") == (
+        b"1" * 1000,
+        "v1",
+        pytest.approx(time.time() + 60, abs=1),
+    )
+    stats = cache.stats()
+    assert stats["entries"] == 1 and stats["bytes"] < 1000
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+def test_sqlite_cache_persists(tmp_path):
+    SQLiteCache(tmp_path / "cache.db").set("a", b"1", 60)
+    assert SQLiteCache(tmp_path / "cache.db").get("a").body == b"1"
+
+
+def test_sqlite_cache_is_shared_across_processes(tmp_path):
+    path = tmp_path / "cache.db"
+    SQLiteCache(path)
+    processes = [
+        multiprocessing.Process(target=fill_cache, args=(path, start))
+        for start in range(0, 200, 50)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    cache = SQLiteCache(path)
+    assert cache.stats()["entries"] == 200
+    assert cache.get("/movie/123").body == b'{"id": 123}'
+
+
+def test_sqlite_cache_is_thread_safe(tmp_path):
+    cache = SQLiteCache(tmp_path / "cache.db")
+    threads = [
+        threading.Thread(target=cache.set, args=(str(i), b"1", 60))
+        for i in range(20)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert cache.stats()["entries"] == 20
+
+
+def test_sqlite_cache_expires_entries(tmp_path):
+    cache = SQLiteCache(tmp_path / "cache.db")
+    cache.set("a", b"1", 0.05)
+    cache.set("b", b"1", 60)
+    time.sleep(0.1)
+    assert cache.get("a") is None
+    assert cache.stats()["expired"] == 1
+    cache.vacuum()
+    assert cache.stats()["entries"] == 1
+
+
+def test_sqlite_cache_evicts_least_recently_used(tmp_path):
+    cache = SQLiteCache(tmp_path / "cache.db", maxbytes=1000, check_every=10)
+    for i in range(100):
+        cache.set(str(i), os.urandom(100), 60)
+    assert cache.stats()["bytes"] <= 1000 + 10 * 120
+    cache.vacuum()
+    assert cache.stats()["bytes"] <= 1000
+    assert cache.get("99") is not None and cache.get("0") is None
+
+
+def test_sqlite_cache_invalidate(tmp_path):
+    cache = SQLiteCache(tmp_path / "cache.db")
+    for key in ("/list/1", "/list/1?language=en", "/list/1/x", "/list/12"):
+        cache.set(key, b"1", 60)
+    cache.invalidate("/list/1")
+    assert cache.stats()["entries"] == 1
+    assert cache.get("/list/12").body == b"1"
+
+
+def test_get_is_cached_on_disk(server, tmp_path):
+    server.routes["/movie/1"] = {"id": 1}
+    isle.configure_cache(SQLiteCache(tmp_path / "cache.db"))
+    GET(f"{server.url}/movie/1")
+    isle.configure_cache(SQLiteCache(tmp_path / "cache.db"))
+    assert GET(f"{server.url}/movie/1") == {"id": 1}
+    assert len(server.requests) == 1
+
+
+def etag_route(body, etag):
+    def route(request):
+        if request["headers"].get("If-None-Match") == etag:
+            return 304, {"ETag": etag}, b""
+        return 200, {"ETag": etag}, body
+
+    return route
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_expired_entries_with_etag_are_kept(backend, tmp_path):
+    if backend == "memory":
+        cache = MemoryCache()
+    else:
+        cache = SQLiteCache(tmp_path / "cache.db")
+    cache.set("a", b"1", 0, "v1")
+    cache.set("b", b"1", 0)
+    assert cache.get("a") == (b"1", "v1", pytest.approx(time.time(), abs=1))
+    assert cache.get("b") is None
+    cache.refresh("a", 60)
+    assert cache.get("a").expires > time.time() + 59
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 1
+
+
+def test_expired_responses_are_revalidated(server, cache):
+    isle.configure_cache(cache, ttl=0.05)
+    server.routes["/movie/1"] = etag_route({"id": 1}, '"v1"')
+    assert GET(f"{server.url}/movie/1") == {"id": 1}
+    time.sleep(0.1)
+    assert GET(f"{server.url}/movie/1") == {"id": 1}
+    assert GET(f"{server.url}/movie/1") == {"id": 1}
+    assert len(server.requests) == 2
+    assert "If-None-Match" not in server.requests[0]["headers"]
+    assert server.requests[1]["headers"]["If-None-Match"] == '"v1"'
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 1
+
+
+def test_changed_responses_replace_the_entry(server, cache):
+    isle.configure_cache(cache, ttl=0.001)
+    server.routes["/movie/1"] = etag_route({"id": 1}, '"v1"')
+    GET(f"{server.url}/movie/1")
+    time.sleep(0.01)
+    server.routes["/movie/1"] = etag_route({"id": 2}, '"v2"')
+    assert GET(f"{server.url}/movie/1") == {"id": 2}
+    assert cache.get(f"{server.url}/movie/1").etag == '"v2"'
+
+
+def test_revalidation_on_disk(server, tmp_path):
+    server.routes["/movie/1"] = etag_route({"id": 1}, '"v1"')
+    isle.configure_cache(SQLiteCache(tmp_path / "cache.db"), ttl=0.001)
+    GET(f"{server.url}/movie/1")
+    time.sleep(0.01)
+    isle.configure_cache(SQLiteCache(tmp_path / "cache.db"), ttl=0.001)
+    assert GET(f"{server.url}/movie/1") == {"id": 1}
+    assert server.requests[1]["headers"]["If-None-Match"] == '"v1"'
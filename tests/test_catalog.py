@@ -0,0 +1,137 @@
+import pytest
+
+import isle
+from isle import objects
+
+
+TOKYO_STORY = {
+    "id": 18148,
+    "title": "Tokyo Story",
+    "original_title": "東京物語",
+    "release_date": "1953-11-03",
+    "vote_average": 8.2,
+    "vote_count": 900,
+    "popularity": 9.5,
+    "runtime": 136,
+    "original_language": "ja",
+    "genres": [{"id": 18, "name": "Drama"}],
+    "production_companies": [{"id": 192, "name": "Shochiku"}],
+    "keywords": {"keywords": [{"id": 1, "name": "tokyo"}]},
+    "credits": {"cast": [{"id": 95504}], "crew": [{"id": 95501}]},
+}
+
+LATE_SPRING = {
+    "id": 20530,
+    "title": "Late Spring",
+    "original_title": "晩春",
+    "release_date": "1949-09-13",
+    "vote_average": 8.0,
+    "vote_count": 400,
+    "popularity": 7.0,
+    "genre_ids": [18, 10749],
+}
+
+
+@pytest.fixture
+def catalog(tmp_path, monkeypatch):
+    def GET(url, **params):
+        raise AssertionError(f"unexpected request to {url}")
+
+    monkeypatch.setattr(objects, "GET", GET)
+    catalog = isle.Catalog(tmp_path / "catalog.db")
+    catalog.add(
+        [
+            isle.Movie(18148, **TOKYO_STORY),
+            isle.Movie(20530, **LATE_SPRING),
+            isle.Show(1, name="Tokyo", first_air_date="2001-01-01"),
+            isle.Person(95501, name="Yasujirō Ozu"),
+        ]
+    )
+    yield catalog
+    catalog.close()
+
+
+def ids(objects):
+    return [obj.tmdb_id for obj in objects]
+
+
+def test_get_returns_loaded_objects(catalog):
+    movie = catalog.get(isle.Movie, 18148)
+    assert movie.runtime == 136 and movie.n_requests == 0
+    assert catalog.get(isle.Movie, 1) is None
+    assert len(catalog) == 4
+
+
+def test_search(catalog):
+    assert ids(catalog.search_movie("Tokyo")) == [18148]
+    assert ids(catalog.search_movie("晩春")) == [20530]
+    assert ids(catalog.search_show("tokyo")) == [1]
+    assert ids(catalog.search_person("Ozu")) == [95501]
+
+
+def test_search_options(catalog):
+    adult = {**LATE_SPRING, "id": 1, "title": "Spring", "popularity": 1.0}
+    adult["adult"] = True
+    catalog.add([isle.Movie(1, **adult)])
+    assert ids(catalog.search_movie("Spring", year=1949)) == [20530]
+    assert ids(catalog.search_movie("Spring", primary_release_year=1)) == []
+    assert ids(catalog.search_movie("Spring", include_adult=True)) == [
+        20530,
+        1,
+    ]
+    assert ids(catalog.search_movie("Spring", language="fr", page=2)) == [
+        20530
+    ]
+    assert ids(catalog.search_show("Tokyo", first_air_date_year=2001)) == [1]
+
+
+def test_search_matches_wildcards_literally(catalog):
+    catalog.add([isle.Movie(2, title="100% Tokyo_Story")])
+    assert ids(catalog.search_movie("100%")) == [2]
+    assert ids(catalog.search_movie("o_S")) == [2]
+    assert ids(catalog.search_movie("%")) == [2]
+    assert ids(catalog.search_movie("\\")) == []
+
+
+@pytest.mark.parametrize(
+    "options, expected",
+    [
+        ({}, [18148, 20530]),
+        ({"with_genres": 18, "sort_by": "vote_count.asc"}, [20530, 18148]),
+        ({"with_genres": "18,10749"}, [20530]),
+        ({"with_genres": "35|10749"}, [20530]),
+        ({"primary_release_year": 1953}, [18148]),
+        ({"primary_release_date.lte": "1950-01-01"}, [20530]),
+        ({"vote_average.gte": 8.1, "vote_count.gte": 100}, [18148]),
+        ({"with_companies": 192, "with_keywords": 1}, [18148]),
+        ({"with_crew": 95501}, [18148]),
+        ({"with_people": "95504", "with_cast": 95501}, []),
+        ({"with_original_language": "ja"}, [18148]),
+        ({"sort_by": "release_date.asc"}, [20530, 18148]),
+    ],
+)
+def test_discover_movies(catalog, options, expected):
+    assert ids(catalog.discover_movies(options)) == expected
+
+
+def test_discover_shows(catalog):
+    assert ids(catalog.discover_shows({"first_air_date_year": 2001})) == [1]
+
+
+def test_add_replaces_and_remove(catalog):
+    catalog.add([isle.Movie(20530, **{**LATE_SPRING, "genre_ids": [35]})])
+    assert ids(catalog.discover_movies({"with_genres": 35})) == [20530]
+    assert ids(catalog.discover_movies({"with_genres": 10749})) == []
+    catalog.remove([isle.Movie(20530)])
+    assert ids(catalog.discover_movies({})) == [18148]
+
+
+def test_unsupported(catalog):
+    with pytest.raises(ValueError):
+        catalog.discover_movies({"with_watch_providers": 8})
+    with pytest.raises(ValueError):
+        catalog.discover_movies({"sort_by": "revenue.desc"})
+    with pytest.raises(ValueError):
+        catalog.search_movie("Tokyo", region="JP")
+    with pytest.raises(TypeError):
+        catalog.add([isle.Season(1, show_id=1)])
@@ -0,0 +1,94 @@
+import gzip
+import tracemalloc
+
+import pytest
+
+import isle
+from isle import objects
+
+
+@pytest.fixture(autouse=True)
+def offline(monkeypatch):
+    def GET(url, **params):
+        raise AssertionError(f"unexpected request to {url}")
+
+    monkeypatch.setattr(objects, "GET", GET)
+
+
+def movie(n):
+    cast = [{"id": 1, "credit_id": "a", "character": "Shūkichi"}]
+    return isle.Movie(
+        n, title="Tokyo Story", runtime=136, credits={"cast": cast}
+    )
+
+
+@pytest.mark.parametrize("name", ["objects.jsonl", "objects.jsonl.gz"])
+def test_dump_and_load(tmp_path, name):
+    path = tmp_path / name
+    credit = isle.Credit("a", credit_type="cast", character="Shūkichi")
+    dumped = [
+        movie(18148),
+        isle.Season(1, show_id=2, id=3, name="Season 1"),
+        isle.Episode(4, show_id=2, season_number=1, id=5, name="Pilot"),
+        credit,
+    ]
+    assert isle.dump(dumped, path) == 4
+    loaded = list(isle.load(path))
+    assert [type(obj) for obj in loaded] == [type(obj) for obj in dumped]
+    assert [obj.data for obj in loaded] == [obj.data for obj in dumped]
+    tokyo_story, season, episode, credit = loaded
+    assert tokyo_story.runtime == 136 and tokyo_story.cast[0][1].character
+    assert (season.show_id, season.number, season.tmdb_id) == (2, 1, 3)
+    assert (episode.season_number, episode.number) == (1, 4)
+    assert episode.tmdb_id == 5
+    assert credit.character == "Shūkichi"
+    assert all(obj.n_requests == 0 for obj in loaded)
+
+
+def test_gzip(tmp_path):
+    path = tmp_path / "objects.jsonl.gz"
+    isle.dump([movie(1)], path)
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        assert '"title": "Tokyo Story"' in file.read()
+
+
+def test_views_in_data_are_written(tmp_path):
+    path = tmp_path / "objects.jsonl"
+    tokyo_story = movie(1)
+    tokyo_story.data["cast_copy"] = tokyo_story._getdata("credits")
+    isle.dump([tokyo_story], path)
+    (loaded,) = isle.load(path)
+    assert loaded.data["cast_copy"] == loaded.data["credits"]
+
+
+def test_unsupported_objects(tmp_path):
+    with pytest.raises(TypeError):
+        isle.dump([isle.Account()], tmp_path / "objects.jsonl")
+
+
+def test_memory_does_not_grow_with_the_number_of_objects(tmp_path):
+    path = tmp_path / "objects.jsonl.gz"
+
+    def peak(n):
+        tracemalloc.start()
+        isle.dump((movie(i) for i in range(n)), path)
+        for _ in isle.load(path):
+            pass
+        size = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return size
+
+    assert peak(5000) < 2 * peak(500)
+
+
+def test_loaded_responses_are_kept(tmp_path, monkeypatch):
+    path = tmp_path / "objects.jsonl"
+    monkeypatch.setattr(objects, "GET", lambda url, **params: {"id": 1})
+    dumped = isle.Movie(1)
+    dumped.get_all(["credits"])
+    isle.dump([dumped], path)
+    monkeypatch.undo()
+    (loaded,) = isle.load(path)
+    with pytest.raises(KeyError):
+        loaded.runtime
+    assert loaded.n_requests == 0
@@ -0,0 +1,52 @@
+import copy
+
+import pytest
+
+from isle._frozen import FrozenDict, FrozenList, freeze, thaw, unwrap
+
+
+DATA = {"credits": {"cast": [{"id": 1, "name": "Chishū Ryū"}]}, "id": 18148}
+
+
+def test_views_do_not_copy():
+    view = freeze(DATA)
+    assert isinstance(view, FrozenDict)
+    assert isinstance(view["credits"]["cast"], FrozenList)
+    assert unwrap(view["credits"]["cast"][0]) is DATA["credits"]["cast"][0]
+    assert freeze(1) == 1 and freeze("a") == "a"
+
+
+def test_views_are_read_only():
+    view = freeze(DATA)
+    with pytest.raises(TypeError):
+        view["id"] = 1
+    with pytest.raises(TypeError):
+        view["credits"]["cast"][0] = {}
+    with pytest.raises(AttributeError):
+        view["credits"]["cast"].append({})
+    with pytest.raises(AttributeError):
+        view.pop("id")
+
+
+def test_views_compare_equal_to_their_data():
+    view = freeze(DATA)
+    assert view == DATA and DATA == view
+    assert view["credits"]["cast"] == DATA["credits"]["cast"]
+    assert view["credits"]["cast"][:1] == DATA["credits"]["cast"]
+    assert view["credits"]["cast"] != [{}]
+    assert {"id": 1, "name": "Chishū Ryū"} in view["credits"]["cast"]
+
+
+def test_views_behave_like_dicts_and_lists():
+    view = freeze(DATA)
+    assert list(view) == ["credits", "id"] and len(view) == 2
+    assert view.get("missing") is None and "id" in view
+    item = view["credits"]["cast"][0]
+    assert dict(**item) == {"id": 1, "name": "Chishū Ryū"}
+    assert [item["id"] for item in view["credits"]["cast"]] == [1]
+
+
+def test_thaw_returns_a_mutable_copy():
+    data = thaw(freeze(DATA))
+    data["credits"]["cast"].clear()
+    assert DATA["credits"]["cast"] and copy.deepcopy(freeze(DATA)) == DATA
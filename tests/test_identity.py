@@ -0,0 +1,82 @@
+import gc
+
+import pytest
+
+import isle
+from isle import _api, _identity, objects
+
+
+MOVIE = {"id": 18148, "title": "Tokyo Story", "vote_count": 700}
+
+
+@pytest.fixture
+def identity_map():
+    isle.configure_identity_map(True)
+    yield
+    isle.configure_identity_map(False)
+
+
+@pytest.fixture(autouse=True)
+def pages(monkeypatch):
+    pages = {}
+
+    def GET_pages(url, params, prefetch=0, item=None):
+        return map(item, [dict(result) for result in pages[url]])
+
+    monkeypatch.setattr(_api, "GET_pages", GET_pages)
+    pages[isle._urls.SEARCH_MOVIE] = [MOVIE]
+    return pages
+
+
+def test_identity_map_is_off_by_default():
+    a, b = next(isle.search_movie("Tokyo")), next(isle.search_movie("Tokyo"))
+    assert a == b and a is not b
+
+
+def test_same_id_yields_one_object(identity_map):
+    movie = next(isle.search_movie("Tokyo"))
+    cast = [{**MOVIE, "credit_id": "a", "character": "Shūkichi"}]
+    person = isle.Person(1, movie_credits={"cast": cast, "crew": []})
+    assert next(isle.search_movie("Tokyo")) is movie
+    assert person.movie_cast[0][0] is movie
+
+
+def test_hydrating_one_reference_benefits_all(identity_map, monkeypatch):
+    requests = []
+
+    def GET(url, **params):
+        requests.append(url)
+        return {"id": 18148, "runtime": 136}
+
+    monkeypatch.setattr(objects, "GET", GET)
+    a = next(isle.search_movie("Tokyo"))
+    b = next(isle.search_movie("Tokyo"))
+    a.get_all()
+    assert b.runtime == 136 and len(requests) == 1
+
+
+def test_new_results_only_fill_in_missing_fields(identity_map, pages):
+    movie = next(isle.search_movie("Tokyo"))
+    movie.data["vote_count"] = 800
+    pages[isle._urls.SEARCH_MOVIE] = [{**MOVIE, "popularity": 9.5}]
+    assert next(isle.search_movie("Tokyo")) is movie
+    assert movie.data["vote_count"] == 800
+    assert movie.data["popularity"] == 9.5
+
+
+def test_languages_are_kept_apart(identity_map):
+    en = next(isle.search_movie("Tokyo", language="en"))
+    ja = next(isle.search_movie("Tokyo", language="ja"))
+    assert en is not ja
+    assert next(isle.search_movie("Tokyo", language="ja")) is ja
+
+
+def test_unreferenced_objects_are_dropped(identity_map):
+    next(isle.search_movie("Tokyo"))
+    gc.collect()
+    assert len(_identity._objects) == 0
+
+
+def test_classes_are_kept_apart(identity_map):
+    assert isle.Movie._shared(1) is isle.Movie._shared(1)
+    assert isle.Movie._shared(1) is not isle.Show._shared(1)
@@ -0,0 +1,90 @@
+import pytest
+
+import isle
+from isle import _locale, objects
+
+
+TRANSLATIONS = {
+    "translations": [
+        {
+            "iso_3166_1": "FR",
+            "iso_639_1": "fr",
+            "data": {
+                "title": "Voyage à Tokyo",
+                "overview": "",
+                "homepage": "",
+            },
+        },
+        {
+            "iso_3166_1": "BR",
+            "iso_639_1": "pt",
+            "data": {
+                "title": "Era Uma Vez em Tóquio",
+                "overview": "Um casal",
+                "homepage": "",
+            },
+        },
+    ]
+}
+
+IMAGES = {
+    "posters": [
+        {"file_path": "/fr.jpg", "iso_639_1": "fr"},
+        {"file_path": "/pt.jpg", "iso_639_1": "pt"},
+        {"file_path": "/none.jpg", "iso_639_1": None},
+    ]
+}
+
+
+@pytest.fixture(autouse=True)
+def requests(monkeypatch):
+    requests = []
+
+    def GET(url, **params):
+        requests.append((url, params))
+        return {
+            "id": int(url.rsplit("/", 1)[-1]),
+            "title": "Tokyo Story",
+            "original_title": "東京物語",
+            "overview": "An old couple",
+            "translations": TRANSLATIONS,
+            "images": IMAGES,
+        }
+
+    monkeypatch.setattr(objects, "GET", GET)
+    monkeypatch.setattr(_locale, "_views", _locale.OrderedDict())
+    return requests
+
+
+def test_one_request_for_all_languages(requests):
+    movie = isle.Movie(18148)
+    (views,) = isle.localize([movie], ["fr", "pt-BR", "en"])
+    assert len(requests) == 1
+    url, params = requests[0]
+    assert params["append_to_response"] == "translations,images"
+    assert params["include_image_language"] == "en,fr,pt,null"
+    assert views["fr"].title["default"] == "Voyage à Tokyo"
+    assert views["fr"].overview["default"] == "An old couple"
+    assert views["pt-BR"].overview["default"] == "Um casal"
+    assert views["en"].title["default"] == "Tokyo Story"
+    posters = [poster.file_path for poster in views["fr"].posters]
+    assert posters == ["/fr.jpg", "/none.jpg"]
+    assert movie.data["title"] == "Tokyo Story"
+
+
+def test_views_are_cached_per_object_and_language(requests):
+    movies = [isle.Movie(n) for n in range(5)]
+    first = isle.localize(movies, ["fr", "pt"], workers=2)
+    again = isle.localize([isle.Movie(n) for n in range(5)], ["pt", "fr"])
+    assert len(requests) == 5
+    assert all(a["fr"] is b["fr"] for a, b in zip(first, again))
+    isle.localize([isle.Movie(1)], ["fr", "ja"])
+    assert len(requests) == 6
+
+
+def test_loaded_objects_make_no_request(requests):
+    movie = isle.Movie(1, title="Tokyo Story", translations=TRANSLATIONS)
+    movie.data["images"] = IMAGES
+    (views,) = isle.localize([movie], ["fr"])
+    assert requests == [] and views["fr"] == movie
+    assert views["fr"].n_requests == 0
@@ -1,4 +1,4 @@
-import inspect
+from collections.abc import Generator
 from itertools import islice
 
 import pytest
@@ -14,27 +14,27 @@ def test_get_latest():
 
 def test_get_popular():
     movies = isle.movie.get_popular()
-    assert inspect.isgenerator(movies)
+    assert isinstance(movies, Generator)
     movie = next(movies)
     assert isinstance(movie, Movie)
 
 
 def test_get_top_rated():
     movies = isle.movie.get_top_rated()
-    assert inspect.isgenerator(movies)
+    assert isinstance(movies, Generator)
     movie = next(movies)
     assert isinstance(movie, Movie)
 
 
 def test_get_upcoming():
     movies = isle.movie.get_upcoming()
-    assert inspect.isgenerator(movies)
+    assert isinstance(movies, Generator)
     movie = next(movies)
     assert isinstance(movie, Movie)
 
 
 def test_get_now_playing():
     movies = isle.movie.get_now_playing()
-    assert inspect.isgenerator(movies)
+    assert isinstance(movies, Generator)
     movie = next(movies)
     assert isinstance(movie, Movie)
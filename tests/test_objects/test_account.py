@@ -1,5 +1,5 @@
-import inspect
 import os
+from collections.abc import Generator
 
 import pytest
 
@@ -71,49 +71,49 @@ def test_properties_download_once(logged_in_account):
 
 def test_iter_lists(once_logged_in_account):
     lists = once_logged_in_account.iter_lists()
-    assert inspect.isgenerator(lists)
+    assert isinstance(lists, Generator)
     assert all(isinstance(x, TMDbList) for x in lists)
 
 
 def test_iter_favorite_movies(once_logged_in_account):
     favorite_movies = once_logged_in_account.iter_favorite_movies()
-    assert inspect.isgenerator(favorite_movies)
+    assert isinstance(favorite_movies, Generator)
     assert all(isinstance(x, Movie) for x in favorite_movies)
 
 
 def test_iter_favorite_shows(once_logged_in_account):
     favorite_shows = once_logged_in_account.iter_favorite_shows()
-    assert inspect.isgenerator(favorite_shows)
+    assert isinstance(favorite_shows, Generator)
     assert all(isinstance(x, Show) for x in favorite_shows)
 
 
 def test_iter_rated_movies(once_logged_in_account):
     rated_movies = once_logged_in_account.iter_rated_movies()
-    assert inspect.isgenerator(rated_movies)
+    assert isinstance(rated_movies, Generator)
     assert all(isinstance(x, Movie) for x in rated_movies)
 
 
 def test_iter_rated_shows(once_logged_in_account):
     rated_shows = once_logged_in_account.iter_rated_shows()
-    assert inspect.isgenerator(rated_shows)
+    assert isinstance(rated_shows, Generator)
     assert all(isinstance(x, Show) for x in rated_shows)
 
 
 def test_iter_rated_episodes(once_logged_in_account):
     rated_episodes = once_logged_in_account.iter_rated_episodes()
-    assert inspect.isgenerator(rated_episodes)
+    assert isinstance(rated_episodes, Generator)
     assert all(isinstance(x, Episode) for x in rated_episodes)
 
 
 def test_iter_movie_watchlist(once_logged_in_account):
     movie_watchlist = once_logged_in_account.iter_movie_watchlist()
-    assert inspect.isgenerator(movie_watchlist)
+    assert isinstance(movie_watchlist, Generator)
     assert all(isinstance(x, Movie) for x in movie_watchlist)
 
 
 def test_iter_show_watchlist(once_logged_in_account):
     show_watchlist = once_logged_in_account.iter_show_watchlist()
-    assert inspect.isgenerator(show_watchlist)
+    assert isinstance(show_watchlist, Generator)
     assert all(isinstance(x, Movie) for x in show_watchlist)
 
 
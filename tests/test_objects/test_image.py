@@ -1,5 +1,8 @@
+from collections.abc import Sequence
+
 import pytest
 
+from isle import _registry
 from isle.objects import Image
 
 
@@ -25,12 +28,26 @@ def test_raises_error_when_init_without_type():
 
 
 def test_get_urls(image: Image):
-    assert image._configs_data == {}
     assert isinstance(image.url, dict)
-    assert image._configs_data != {}
 
 
 def test_get_sizes(image: Image):
-    assert image._configs_data == {}
-    assert isinstance(image.sizes, list)
-    assert image.sizes == image._configs_data["backdrop_sizes"]
+    assert isinstance(image.sizes, Sequence)
+    assert image.sizes == _registry.image_config()["backdrop_sizes"]
+
+
+def test_fields_are_attributes(image: Image):
+    assert (image.width, image.height) == (1280, 720)
+    assert image.file_path == "/fCayJrkfRaCRCTh8GqN30f8oyQF.jpg"
+    assert image.vote == (0, 0)
+    assert not hasattr(image, "vote_average")
+    assert not hasattr(image, "__dict__")
+
+
+def test_unknown_fields_are_attributes():
+    image = Image({"file_path": "/a.svg", "file_type": ".svg"}, type_="logo")
+    assert image.file_type == ".svg"
+    with pytest.raises(AttributeError):
+        image.vote
+    with pytest.raises(AttributeError):
+        image.width
@@ -1,7 +1,8 @@
-import inspect
+from collections.abc import Generator
 
 import pytest
 
+from isle import objects
 from isle.objects import Keyword, Movie
 
 
@@ -45,7 +46,7 @@ def test_get_details(keyword_without_name: Keyword):
 
 def test_iter_movies(keyword_with_name: Keyword):
     movies = keyword_with_name.iter_movies()
-    assert inspect.isgenerator(movies)
+    assert isinstance(movies, Generator)
     item = next(movies)
     assert isinstance(item, Movie)
 
@@ -62,3 +63,13 @@ def test_eq(keyword_with_name, keyword_without_name):
 def test_not_eq(keyword_with_name, keyword_without_name):
     keyword_without_name.tmdb_id = 1234
     assert keyword_with_name != keyword_without_name
+
+
+def test_iter_movies_keeps_the_payloads(monkeypatch):
+    def GET_pages(url, params, prefetch=0, item=None):
+        return map(item, [{"id": 2, "title": "Late Spring"}])
+
+    monkeypatch.setattr(objects, "GET_pages", GET_pages)
+    monkeypatch.setattr(objects, "GET", lambda url, **params: 1 / 0)
+    (movie,) = Keyword(1).iter_movies()
+    assert movie.data["title"] == "Late Spring"
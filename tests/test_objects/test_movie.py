@@ -1,4 +1,4 @@
-import inspect
+from collections.abc import Generator
 
 import pytest
 
@@ -235,21 +235,21 @@ def test_get_translations(empty_movie: Movie):
 
 def test_iter_recommendations(empty_movie: Movie):
     recommendations = empty_movie.iter_recommendations()
-    assert inspect.isgenerator(recommendations)
+    assert isinstance(recommendations, Generator)
     item = next(recommendations)
     assert isinstance(item, dict)
 
 
 def test_iter_similar_movies(empty_movie: Movie):
     similar_movies = empty_movie.iter_similar_movies()
-    assert inspect.isgenerator(similar_movies)
+    assert isinstance(similar_movies, Generator)
     item = next(similar_movies)
     assert isinstance(item, dict)
 
 
 def test_iter_reviews(empty_movie: Movie):
     reviews = empty_movie.iter_reviews()
-    assert inspect.isgenerator(reviews)
+    assert isinstance(reviews, Generator)
     item = next(reviews)
     assert isinstance(item, dict)
     assert all(x in item for x in ["author", "content"])
@@ -257,7 +257,7 @@ def test_iter_reviews(empty_movie: Movie):
 
 def test_iter_lists(empty_movie: Movie):
     lists = empty_movie.iter_lists()
-    assert inspect.isgenerator(lists)
+    assert isinstance(lists, Generator)
     item = next(lists)
     assert isinstance(item, dict)
     assert all(x in item for x in ["description", "item_count"])
@@ -1,5 +1,5 @@
-import inspect
 import re
+from collections.abc import Generator
 
 import pytest
 
@@ -199,7 +199,7 @@ def test_get_translations(empty_person: Person):
 
 def test_iter_tagged_images(empty_person: Person):
     tagged_images = empty_person.iter_tagged_images()
-    assert inspect.isgenerator(tagged_images)
+    assert isinstance(tagged_images, Generator)
     item = next(tagged_images)
     assert isinstance(item, dict)
 
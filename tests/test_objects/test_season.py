@@ -1,5 +1,6 @@
 import pytest
 
+from isle import objects
 from isle.objects import Credit, Episode, Image, Person, Season, Video
 
 
@@ -132,3 +133,17 @@ def test_eq(season: Season, empty_season: Season):
 def test_not_eq(season: Season, empty_season: Season):
     season.data["id"] = 1234
     assert season != empty_season
+
+
+def test_episodes_keep_their_payloads(monkeypatch):
+    monkeypatch.setattr(objects, "GET", lambda url, **params: 1 / 0)
+    episode = {
+        "id": 7,
+        "show_id": 1,
+        "season_number": 2,
+        "episode_number": 3,
+        "air_date": "2020-01-01",
+    }
+    (episode,) = Season(2, show_id=1, episodes=[episode]).episodes
+    assert (episode.show_id, episode.sn, episode.n) == (1, 2, 3)
+    assert episode.air_date == "2020-01-01"
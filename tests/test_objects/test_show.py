@@ -1,7 +1,8 @@
-import inspect
+from collections.abc import Generator
 
 import pytest
 
+from isle import objects
 from isle.objects import (
     Company,
     Country,
@@ -259,21 +260,21 @@ def test_get_videos(empty_show: Show):
 
 def test_iter_recommendations(empty_show: Show):
     recommendations = empty_show.iter_recommendations()
-    assert inspect.isgenerator(recommendations)
+    assert isinstance(recommendations, Generator)
     item = next(recommendations)
     assert isinstance(item, dict)
 
 
 def test_iter_reviews(empty_show: Show):
     reviews = empty_show.iter_reviews()
-    assert inspect.isgenerator(reviews)
+    assert isinstance(reviews, Generator)
     item = next(reviews)
     assert isinstance(item, dict)
 
 
 def test_iter_similar_shows(empty_show: Show):
     similar_shows = empty_show.iter_similar_shows()
-    assert inspect.isgenerator(similar_shows)
+    assert isinstance(similar_shows, Generator)
     item = next(similar_shows)
     assert isinstance(item, dict)
 
@@ -285,3 +286,51 @@ def test_eq(show: Show, empty_show: Show):
 def test_not_eq(show: Show, empty_show: Show):
     show.tmdb_id = 1234
     assert show != empty_show
+
+
+def test_get_seasons_appends_20_seasons_per_request(monkeypatch):
+    requests = []
+
+    def GET(url, **params):
+        requests.append(params["append_to_response"])
+        keys = params["append_to_response"].split(",")
+        numbers = [int(key[len("season/") :]) for key in keys]
+        return {
+            f"season/{n}": {
+                "id": 100 + n,
+                "season_number": n,
+                "episodes": [
+                    {"id": 1000 * n + e, "episode_number": e, "name": f"{e}"}
+                    for e in (1, 2)
+                ],
+            }
+            for n in numbers
+        }
+
+    monkeypatch.setattr(objects, "GET", GET)
+    seasons = [{"season_number": n} for n in range(45)]
+    show = Show(1, seasons=seasons)
+    assert len(show.get_seasons()) == 45
+    assert len(requests) == 3
+    assert requests[2] == ",".join(f"season/{n}" for n in range(40, 45))
+    season = show.seasons[44]
+    episode = season.episodes[1]
+    assert season.tmdb_id == 144 and episode.tmdb_id == 44002
+    assert (episode.season_number, episode.number) == (44, 2)
+    assert season.n_requests == 0 and episode.n_requests == 0
+    assert len(requests) == 3
+
+
+def test_last_and_next_episode_keep_their_payloads(monkeypatch):
+    monkeypatch.setattr(objects, "GET", lambda url, **params: 1 / 0)
+    episode = {
+        "id": 7,
+        "show_id": 1,
+        "season_number": 2,
+        "episode_number": 3,
+        "air_date": "2020-01-01",
+    }
+    show = Show(1, last_episode_to_air=episode, next_episode_to_air=episode)
+    for episode in (show.last_episode, show.next_episode):
+        assert (episode.show_id, episode.sn, episode.n) == (1, 2, 3)
+        assert episode.air_date == "2020-01-01"
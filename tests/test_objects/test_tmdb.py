@@ -1,6 +1,13 @@
+import json
 import pytest
-import inspect
+import threading
+import time
+from collections.abc import Generator
 
+import isle
+import isle.aio
+from isle import objects
+from isle._frozen import unwrap
 from isle.objects import TMDb
 
 
@@ -8,6 +15,7 @@ MOVIE_ID = 18148
 
 GET_URL = f"https://api.themoviedb.org/3/movie/{MOVIE_ID}"
 GET_ITER_URL = f"https://api.themoviedb.org/3/movie/{MOVIE_ID}/reviews"
+COMPANY_URL = "https://api.themoviedb.org/3/company/1"
 # POST_URL = ...
 # DELETE_URL = ...
 
@@ -25,7 +33,7 @@ def test_request(tmdb: TMDb):
 
 def test_iter_request(tmdb: TMDb):
     r = tmdb._iter_request(GET_ITER_URL, **{})
-    assert inspect.isgenerator(r)
+    assert isinstance(r, Generator)
     assert isinstance(next(r), dict)
 
 
@@ -57,3 +65,196 @@ def test_n_requests(tmdb: TMDb):
 
     # tmdb._post_request(POST_URL, **{})
     # assert tmdb.n_requests == 6
+
+
+def test_getdata_returns_read_only_views():
+    cast = [{"id": 1, "credit_id": "a", "character": "Shūkichi"}]
+    credits = {"cast": cast}
+    movie = isle.Movie(MOVIE_ID, credits=credits)
+    assert unwrap(movie._getdata("credits")) is credits
+    with pytest.raises(TypeError):
+        movie._getdata("credits")["cast"] = []
+    person, credit = movie.cast[0]
+    assert person.data == {"id": 1, "credit_id": "a", "character": "Shūkichi"}
+    assert type(person.data["id"]) is int and credit.character == "Shūkichi"
+
+
+def test_properties_do_not_change_data():
+    release = {"iso_639_1": "", "release_date": "1953-11-03", "type": 3}
+    results = [{"iso_3166_1": "JP", "release_dates": [release]}]
+    movie = isle.Movie(MOVIE_ID, release_dates={"results": results})
+    assert movie.releases == {
+        "JP": [{"date": "1953-11-03", "type": 3, "note": ""}]
+    }
+    assert movie.data["release_dates"]["results"][0]["release_dates"] == [
+        {"iso_639_1": "", "release_date": "1953-11-03", "type": 3}
+    ]
+
+
+def test_derived_properties_are_memoized():
+    cast = [{"id": 1, "credit_id": "a", "character": "Shūkichi"}]
+    movie = isle.Movie(MOVIE_ID, credits={"cast": cast})
+    assert movie.cast[0][0] is movie.cast[0][0]
+    assert movie.cast is not movie.cast
+    movie.cast.clear()
+    assert len(movie.cast) == 1
+
+
+def test_memo_is_invalidated_when_data_changes(monkeypatch):
+    monkeypatch.setattr(
+        objects, "GET", lambda url, **params: {"credits": {"cast": []}}
+    )
+    cast = [{"id": 1, "credit_id": "a", "character": "Shūkichi"}]
+    movie = isle.Movie(MOVIE_ID, credits={"cast": cast})
+    assert len(movie.cast) == 1
+    movie.get_all()
+    assert movie.cast == []
+    movie.data["credits"] = {"cast": cast}
+    assert len(movie.cast) == 1
+
+
+def test_changed_lists_are_reloaded(monkeypatch):
+    items = []
+    monkeypatch.setattr(
+        objects,
+        "GET",
+        lambda url, **params: {"items": list(items), "name": "Ozu"},
+    )
+    list_ = isle.TMDbList(1)
+    assert list_.items == []
+    items.append({"id": 2, "media_type": "movie"})
+    assert list_.items == []
+    list_._changed = True
+    assert list_.items == [isle.Movie(2)]
+
+
+@pytest.fixture
+def requests(monkeypatch):
+    requests = []
+
+    def GET(url, **params):
+        append = params.get("append_to_response")
+        requests.append((url, append))
+        if url.endswith("/keywords"):
+            return {"id": MOVIE_ID, "keywords": [{"id": 1, "name": "tokyo"}]}
+        if url.endswith("/alternative_names"):
+            return {"id": 1, "results": []}
+        appended = {key: {} for key in append.split(",")} if append else {}
+        return {"id": MOVIE_ID, "runtime": 136, **appended}
+
+    monkeypatch.setattr(objects, "GET", GET)
+    return requests
+
+
+def test_get_all_appends_the_requested_sub_resources(requests):
+    movie = isle.Movie(MOVIE_ID)
+    movie.get_all(["credits", "keywords"])
+    movie.get_all([])
+    assert requests == [(GET_URL, "credits,keywords"), (GET_URL, None)]
+    with pytest.raises(ValueError):
+        movie.get_all(["credits", "reviews_"])
+
+
+def test_default_append(requests, monkeypatch):
+    monkeypatch.setattr(isle.Movie, "default_append", ["external_ids"])
+    isle.Movie(MOVIE_ID).get_all()
+    assert requests == [(GET_URL, "external_ids")]
+
+
+def test_missing_keys_make_the_smallest_request(requests):
+    movie = isle.Movie(MOVIE_ID)
+    assert movie.keywords == [isle.Keyword(1)]
+    assert movie.runtime == 136
+    assert requests == [(f"{GET_URL}/keywords", None), (GET_URL, None)]
+    assert movie.n_requests == 2
+
+
+def test_company_routes(requests):
+    company = isle.Company(1)
+    company.data["images"] = {"logos": []}
+    company.data["alternative_names"] = {"results": []}
+    assert company.logos == [] and company.also_known_as == []
+    assert requests == []
+    isle.Company(1).also_known_as
+    assert requests == [(f"{COMPANY_URL}/alternative_names", None)]
+
+
+def test_get_all_after_enough_sub_resources(requests, monkeypatch):
+    monkeypatch.setattr(isle.Movie, "get_all_after", 1)
+    movie = isle.Movie(MOVIE_ID)
+    movie.keywords
+    movie.data["credits"] = {"cast": [], "crew": []}
+    assert movie._getdata("external_ids") == {}
+    url, append = requests[1]
+    append = append.split(",")
+    assert url == GET_URL and "external_ids" in append
+    assert "keywords" not in append and "credits" not in append
+
+
+def test_get_all_after_none(requests, monkeypatch):
+    monkeypatch.setattr(isle.Movie, "get_all_after", None)
+    movie = isle.Movie(MOVIE_ID, credits={}, keywords={}, videos={})
+    movie.runtime
+    assert requests == [(GET_URL, None)]
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        isle.Movie(1),
+        isle.Show(1),
+        isle.Person(1),
+        isle.Company(1),
+        isle.Keyword(1),
+        isle.TMDbList(1),
+        isle.Season(1, show_id=1),
+        isle.Episode(1, show_id=1, season_number=1),
+        isle.Credit("a"),
+        isle.Account(),
+        isle.aio.Movie(1),
+        isle.aio.Episode(1, show_id=1, season_number=1),
+    ],
+)
+def test_objects_have_no_instance_dict(obj):
+    assert not hasattr(obj, "__dict__")
+
+
+def test_payload_keys_are_interned():
+    a = isle.Person(1, **json.loads('{"known_for_department": "Acting"}'))
+    b = isle.Person(2, **json.loads('{"known_for_department": "Acting"}'))
+    key_a, key_b = (list(person.data)[1] for person in (a, b))
+    assert key_a == key_b and key_a is key_b
+
+
+def test_missing_keys_of_loaded_responses_are_not_requested(requests):
+    movie = isle.Movie(MOVIE_ID)
+    movie.get_all(["credits"])
+    with pytest.raises(KeyError):
+        movie.budget
+    with pytest.raises(KeyError):
+        movie.budget
+    movie.keywords
+    assert [url for url, _ in requests] == [GET_URL, f"{GET_URL}/keywords"]
+
+
+def test_threads_reading_a_missing_key_load_it_once(monkeypatch):
+    requests = []
+
+    def GET(url, **params):
+        requests.append(url)
+        time.sleep(0.2)
+        return {"id": MOVIE_ID, "runtime": 136}
+
+    monkeypatch.setattr(objects, "GET", GET)
+    movie = isle.Movie(MOVIE_ID)
+    runtimes = []
+    threads = [
+        threading.Thread(target=lambda: runtimes.append(movie.runtime))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert runtimes == [136] * 8
+    assert requests == [GET_URL]
@@ -1,4 +1,4 @@
-import inspect
+from collections.abc import Generator
 from itertools import islice
 
 import pytest
@@ -14,6 +14,6 @@ def test_get_latest():
 
 def test_get_popular():
     shows = isle.people.get_popular()
-    assert inspect.isgenerator(shows)
+    assert isinstance(shows, Generator)
     person = next(shows)
     assert isinstance(person, Person)
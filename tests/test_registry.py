@@ -0,0 +1,142 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+import isle
+from isle import _registry
+from isle import _urls as URL
+from isle.objects import Company, Image, Movie, Show
+
+
+RESPONSES = {
+    URL.LANGUAGES_CONFIGURATION: [
+        {"iso_639_1": "en", "english_name": "English", "name": "English"},
+        {"iso_639_1": "ja", "english_name": "Japanese", "name": "日本語"},
+    ],
+    URL.COUNTRIES_CONFIGURATION: [
+        {"iso_3166_1": "JP", "english_name": "Japan"},
+        {"iso_3166_1": "US", "english_name": "United States of America"},
+    ],
+    URL.MOVIE_GENRES: {"genres": [{"id": 18, "name": "Drama"}]},
+    URL.SHOW_GENRES: {"genres": [{"id": 16, "name": "Animation"}]},
+    URL.IMAGE_CONFIGURATION: {
+        "images": {
+            "secure_base_url": "https://image.tmdb.org/t/p",
+            "poster_sizes": ["w92", "original"],
+        }
+    },
+}
+
+
+@pytest.fixture(autouse=True)
+def requests(monkeypatch):
+    requests = []
+
+    def GET(url, **params):
+        requests.append(url)
+        time.sleep(0.01)
+        return RESPONSES[url]
+
+    registry = _registry._Registry(_registry._SOURCES)
+    monkeypatch.setattr(_registry, "_registry", registry)
+    monkeypatch.setattr(_registry, "GET", GET)
+    return requests
+
+
+def test_images_share_the_configuration(requests):
+    images = [
+        Image({"file_path": f"/{i}.jpg"}, type_="poster") for i in range(1000)
+    ]
+    urls = [image.url for image in images]
+    assert urls[1]["w92"] == "https://image.tmdb.org/t/p/w92/1.jpg"
+    assert requests == [URL.IMAGE_CONFIGURATION]
+
+
+def test_image_sizes_are_read_only(requests):
+    image = Image({"file_path": "/1.jpg"}, type_="poster")
+    with pytest.raises(AttributeError):
+        image.sizes.append("w9999")
+    assert list(image.sizes) == ["w92", "original"]
+
+
+def test_objects_share_languages_and_countries(requests):
+    spoken_languages = [{"iso_639_1": "ja"}]
+    movies = [Movie(i, spoken_languages=spoken_languages) for i in range(5)]
+    shows = [
+        Show(i, languages=["en"], origin_country=["JP"]) for i in range(5)
+    ]
+    companies = [Company(i, origin_country="US") for i in range(5)]
+    assert {str(movie.languages[0]) for movie in movies} == {"Japanese"}
+    assert {str(show.languages[0]) for show in shows} == {"English"}
+    assert {str(show.countries[0]) for show in shows} == {"Japan"}
+    assert {company.country.iso_3166_1 for company in companies} == {"US"}
+    assert sorted(requests) == sorted(
+        [URL.LANGUAGES_CONFIGURATION, URL.COUNTRIES_CONFIGURATION]
+    )
+    assert all(movie.n_requests == 0 for movie in movies)
+
+
+def test_genres_are_resolved_from_genre_ids(requests):
+    movies = [Movie(i, genre_ids=[18, 99]) for i in range(10_000)]
+    shows = [Show(i, genre_ids=[16]) for i in range(5)]
+    by_genre = {}
+    for obj in movies + shows:
+        for genre in obj.genres:
+            by_genre.setdefault(genre.name, []).append(obj)
+    assert len(by_genre["Drama"]) == 10_000
+    assert len(by_genre["Animation"]) == 5
+    assert len(by_genre[None]) == 10_000
+    assert sorted(requests) == sorted([URL.MOVIE_GENRES, URL.SHOW_GENRES])
+    comedy = Movie(1, genres=[{"id": 35, "name": "Comedy"}])
+    assert [genre.name for genre in comedy.genres] == ["Comedy"]
+
+
+def test_sync_objects_load_tables_inside_an_event_loop(requests):
+    movie = Movie(1, spoken_languages=[{"iso_639_1": "en"}])
+
+    async def main():
+        return movie.languages
+
+    loop = asyncio.new_event_loop()
+    try:
+        (language,) = loop.run_until_complete(main())
+    finally:
+        loop.close()
+    assert language.english_name == "English"
+    assert requests == [URL.LANGUAGES_CONFIGURATION]
+
+
+def test_concurrent_first_use_loads_once(requests):
+    threads = [threading.Thread(target=_registry.countries) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert requests == [URL.COUNTRIES_CONFIGURATION]
+
+
+def test_tables_expire(requests):
+    isle.configure_reference_data(ttl=0.05)
+    _registry.countries()
+    _registry.countries()
+    time.sleep(0.1)
+    _registry.countries()
+    assert requests == [URL.COUNTRIES_CONFIGURATION] * 2
+
+
+def test_refresh(requests):
+    _registry.languages()
+    _registry.countries()
+    isle.refresh_reference_data("countries")
+    assert requests.count(URL.COUNTRIES_CONFIGURATION) == 2
+    isle.refresh_reference_data()
+    assert requests.count(URL.COUNTRIES_CONFIGURATION) == 3
+    assert requests.count(URL.LANGUAGES_CONFIGURATION) == 2
+    assert URL.IMAGE_CONFIGURATION not in requests
+
+
+def test_refresh_unknown_table():
+    with pytest.raises(ValueError):
+        isle.refresh_reference_data("genres")
@@ -0,0 +1,400 @@
+import http.client
+import threading
+import time
+from urllib.error import HTTPError, URLError
+
+import pytest
+
+from isle import _requests
+from isle._http import ConnectionPool
+from isle._ratelimit import RateLimiter
+from isle._requests import DELETE, GET, GET_pages, POST
+
+
+def paginate(n_pages, per_page=2):
+    def route(request):
+        page = int(request["params"]["page"])
+        results = [(page, i) for i in range(per_page)]
+        return 200, {}, {
+            "page": page,
+            "results": results,
+            "total_pages": n_pages,
+            "total_results": n_pages * per_page,
+        }
+
+    return route
+
+
+@pytest.fixture(autouse=True)
+def pool(monkeypatch):
+    pool = ConnectionPool()
+    monkeypatch.setattr(_requests, "_pool", pool)
+    yield pool
+    pool.clear()
+
+
+@pytest.fixture(autouse=True)
+def limiter(monkeypatch):
+    limiter = RateLimiter(rate=None, retries=3, backoff=0.01)
+    monkeypatch.setattr(_requests, "_limiter", limiter)
+    return limiter
+
+
+def test_get(server):
+    server.routes["/movie/1"] = {"id": 1}
+    assert GET(f"{server.url}/movie/1", api_key="key") == {"id": 1}
+    assert server.requests[0]["params"] == {"api_key": "key"}
+
+
+def test_get_reuses_connection(server):
+    server.routes["/movie/1"] = {"id": 1}
+    for _ in range(5):
+        GET(f"{server.url}/movie/1")
+    assert len(server.requests) == 5
+    assert server.connections == 1
+
+
+def test_post_and_delete_send_json(server):
+    server.routes["/list"] = lambda r: (201, {}, {"body": r["body"]})
+    assert POST(f"{server.url}/list", {"name": "a"}) == {"body": {"name": "a"}}
+    assert DELETE(f"{server.url}/list", {}) == {"body": {}}
+    assert [r["method"] for r in server.requests] == ["POST", "DELETE"]
+    assert server.connections == 1
+
+
+def test_raises_http_error(server):
+    with pytest.raises(HTTPError) as error:
+        GET(f"{server.url}/missing")
+    assert error.value.code == 404
+    server.routes["/movie/1"] = {"id": 1}
+    GET(f"{server.url}/movie/1")
+    assert server.connections == 1
+
+
+def test_raises_url_error_when_unreachable(server):
+    url = server.url
+    server.shutdown()
+    server.server_close()
+    with pytest.raises(URLError):
+        GET(f"{url}/movie/1")
+
+
+def test_idle_timeout(server, pool):
+    server.routes["/movie/1"] = {"id": 1}
+    pool.idle_timeout = 0
+    GET(f"{server.url}/movie/1")
+    GET(f"{server.url}/movie/1")
+    assert server.connections == 2
+
+
+def test_reconnects_when_server_drops_idle_connection(server):
+    server.routes["/movie/1"] = {"id": 1}
+    server.drop_connections = True
+    for _ in range(3):
+        assert GET(f"{server.url}/movie/1") == {"id": 1}
+    assert len(server.requests) == 3
+
+
+def test_requests_on_a_closed_connection_use_a_new_one(server):
+    server.routes["/movie/1"] = {"id": 1}
+    server.routes["/list"] = lambda r: (201, {}, {})
+    server.drop_connections = True
+    GET(f"{server.url}/movie/1")
+    time.sleep(0.1)
+    POST(f"{server.url}/list", {"name": "a"})
+    assert [r["method"] for r in server.requests] == ["GET", "POST"]
+    assert server.connections == 2
+
+
+def test_only_idempotent_requests_are_sent_again(server, pool, monkeypatch):
+    server.routes["/movie/1"] = {"id": 1}
+    server.routes["/list"] = lambda r: (201, {}, {})
+    send = pool._send
+    sent, drops = [], []
+
+    def drop(conn, method, *args):
+        # Fails as if the server closed the kept-alive connection.
+        sent.append(method)
+        if drops:
+            drops.pop()
+            raise http.client.RemoteDisconnected()
+        return send(conn, method, *args)
+
+    monkeypatch.setattr(pool, "_send", drop)
+    GET(f"{server.url}/movie/1")
+    drops.append(True)
+    with pytest.raises(URLError):
+        POST(f"{server.url}/list", {"name": "a"})
+    GET(f"{server.url}/movie/1")
+    drops.append(True)
+    assert GET(f"{server.url}/movie/1") == {"id": 1}
+    assert sent == ["GET", "POST", "GET", "GET", "GET"]
+
+
+def test_requests_go_through_the_proxy(server, monkeypatch):
+    server.routes["/movie/1"] = {"id": 1}
+    proxy = server.url.replace("http://", "http://user:pass@")
+    monkeypatch.setenv("http_proxy", proxy)
+    monkeypatch.delenv("no_proxy", raising=False)
+    assert GET("http://tmdb.invalid/movie/1", api_key="key") == {"id": 1}
+    (request,) = server.requests
+    assert request["params"] == {"api_key": "key"}
+    assert request["headers"]["Host"] == "tmdb.invalid"
+    assert request["headers"]["Proxy-Authorization"] == "Basic dXNlcjpwYXNz"
+
+
+def test_no_proxy_hosts_are_reached_directly(server, monkeypatch):
+    server.routes["/movie/1"] = {"id": 1}
+    monkeypatch.setenv("http_proxy", "http://127.0.0.1:9")
+    monkeypatch.setenv("no_proxy", "127.0.0.1")
+    assert GET(f"{server.url}/movie/1") == {"id": 1}
+
+
+def test_pool_is_thread_safe(server, pool):
+    server.routes["/movie/1"] = lambda r: (200, {}, {"page": r["params"]})
+    pool.maxsize = 2
+    results = {}
+
+    def worker(n):
+        results[n] = [
+            GET(f"{server.url}/movie/1", n=n)["page"]["n"] for _ in range(5)
+        ]
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == {n: [str(n)] * 5 for n in range(8)}
+    assert sum(map(len, pool._idle.values())) <= 2
+
+
+def test_configure_pool(monkeypatch, pool):
+    _requests.configure_pool(maxsize=3, idle_timeout=5, timeout=1)
+    assert (pool.maxsize, pool.idle_timeout, pool.timeout) == (3, 5, 1)
+
+
+def test_get_pages_requests_each_page_once(server):
+    server.routes["/search/movie"] = paginate(3)
+    results = list(GET_pages(f"{server.url}/search/movie", {"query": "q"}))
+    assert results == [[p, i] for p in (1, 2, 3) for i in range(2)]
+    pages = [r["params"]["page"] for r in server.requests]
+    assert pages == ["1", "2", "3"]
+
+
+def test_get_pages_single_page_makes_one_request(server):
+    server.routes["/search/movie"] = paginate(1)
+    assert len(list(GET_pages(f"{server.url}/search/movie", {}))) == 2
+    assert len(server.requests) == 1
+
+
+def test_get_pages_is_lazy(server):
+    server.routes["/search/movie"] = paginate(2)
+    pages = GET_pages(f"{server.url}/search/movie", {})
+    assert server.requests == []
+    next(pages)
+    assert len(server.requests) == 1
+
+
+def test_get_pages_totals_reuse_first_page(server):
+    server.routes["/search/movie"] = paginate(3)
+    pages = GET_pages(f"{server.url}/search/movie", {})
+    assert (pages.total_pages, pages.total_results) == (3, 6)
+    assert len(list(pages)) == 6
+    assert len(server.requests) == 3
+
+
+def test_get_pages_prefetch_keeps_page_order(server):
+    server.routes["/discover/movie"] = paginate(20)
+    pages = GET_pages(f"{server.url}/discover/movie", {}, prefetch=4)
+    results = list(pages)
+    assert results == [[p, i] for p in range(1, 21) for i in range(2)]
+    assert sorted(int(r["params"]["page"]) for r in server.requests) == list(
+        range(1, 21)
+    )
+
+
+def test_get_pages_prefetch_window_is_bounded(server):
+    server.routes["/discover/movie"] = paginate(50)
+    pages = GET_pages(f"{server.url}/discover/movie", {}, prefetch=3)
+    for _ in range(2 * 2):  # consume the first two pages
+        next(pages)
+    time.sleep(0.2)
+    requested = {int(r["params"]["page"]) for r in server.requests}
+    assert max(requested) <= 2 + 3
+    pages.close()
+
+
+def test_get_pages_prefetch_requests_concurrently(server):
+    barrier = threading.Barrier(3, timeout=5)
+    route = paginate(4)
+
+    def slow_route(request):
+        if request["params"]["page"] != "1":
+            barrier.wait()  # fails unless 3 pages are in flight at once
+        return route(request)
+
+    server.routes["/discover/movie"] = slow_route
+    pages = GET_pages(f"{server.url}/discover/movie", {}, prefetch=3)
+    assert len(list(pages)) == 8
+
+
+def run_threads(target, n):
+    results = [None] * n
+
+    def worker(i):
+        try:
+            results[i] = target(i)
+        except Exception as error:  # pylint: disable=W0703
+            results[i] = error
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def slow(response):
+    def route(request):
+        time.sleep(0.2)
+        return 200, {}, response
+
+    return route
+
+
+def test_concurrent_identical_requests_share_one_response(server):
+    server.routes["/movie/1"] = slow({"id": 1})
+    url = f"{server.url}/movie/1"
+    results = run_threads(lambda i: GET(url, a=i % 1, b=2), 8)
+    assert results == [{"id": 1}] * 8
+    assert len({id(result) for result in results}) == 8
+    assert len(server.requests) == 1
+
+
+def test_concurrent_requests_with_different_params_are_sent(server):
+    server.routes["/movie/1"] = slow({"id": 1})
+    run_threads(lambda i: GET(f"{server.url}/movie/1", n=i % 2), 4)
+    assert len(server.requests) == 2
+
+
+def test_concurrent_requests_with_different_api_keys_are_sent(server):
+    def route(request):
+        time.sleep(0.2)
+        if request["params"]["api_key"] != "valid":
+            return 401, {}, {"status_code": 7}
+        return 200, {}, {"id": 1}
+
+    server.routes["/movie/1"] = route
+    keys = ["invalid", "valid"]
+    url = f"{server.url}/movie/1"
+    results = run_threads(lambda i: GET(url, api_key=keys[i % 2]), 4)
+    assert [type(result) for result in results[::2]] == [HTTPError] * 2
+    assert results[1::2] == [{"id": 1}] * 2
+    assert len(server.requests) == 2
+
+
+def test_concurrent_identical_requests_share_errors(server):
+    def route(request):
+        time.sleep(0.2)
+        return 404, {}, {"status_code": 34}
+
+    server.routes["/movie/1"] = route
+    results = run_threads(lambda i: GET(f"{server.url}/movie/1"), 4)
+    assert all(isinstance(result, HTTPError) for result in results)
+    assert len(server.requests) == 1
+
+
+def test_identical_requests_are_sent_again_once_answered(server):
+    server.routes["/movie/1"] = {"id": 1}
+    GET(f"{server.url}/movie/1")
+    GET(f"{server.url}/movie/1")
+    assert len(server.requests) == 2
+    assert _requests._flights == {}
+
+
+def test_rate_limit_queues_requests(server, limiter):
+    server.routes["/movie/1"] = {"id": 1}
+    limiter.rate, limiter.burst, limiter._tokens = 50.0, 5, 5.0
+    start = time.monotonic()
+    for _ in range(15):
+        GET(f"{server.url}/movie/1")
+    assert time.monotonic() - start >= (15 - 5) / 50 * 0.9
+    assert len(server.requests) == 15
+
+
+def test_rate_limit_is_shared_across_threads(server, limiter):
+    server.routes["/movie/1"] = {"id": 1}
+    limiter.rate, limiter.burst, limiter._tokens = 100.0, 1, 1.0
+    threads = [
+        threading.Thread(
+            target=GET, args=(f"{server.url}/movie/1",), kwargs={"n": n}
+        )
+        for n in range(21)
+    ]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.monotonic() - start >= 20 / 100 * 0.9
+
+
+def test_retries_after_too_many_requests(server):
+    responses = iter([429, 429, 200])
+
+    def route(request):
+        status = next(responses)
+        return status, {"Retry-After": "0"}, {"status": status}
+
+    server.routes["/movie/1"] = route
+    assert GET(f"{server.url}/movie/1") == {"status": 200}
+    assert len(server.requests) == 3
+
+
+def test_retry_after_pauses_requests(server):
+    responses = iter([429, 200])
+    server.routes["/movie/1"] = lambda r: (
+        next(responses), {"Retry-After": "1"}, {}
+    )
+    start = time.monotonic()
+    GET(f"{server.url}/movie/1")
+    assert time.monotonic() - start >= 1
+
+
+def test_raises_when_retries_are_exhausted(server):
+    server.routes["/movie/1"] = lambda r: (429, {"Retry-After": "0"}, {})
+    with pytest.raises(HTTPError) as error:
+        GET(f"{server.url}/movie/1")
+    assert error.value.code == 429
+    assert len(server.requests) == 4
+
+
+def test_pages_survive_too_many_requests(server):
+    route = paginate(3)
+    limited = {"2"}
+
+    def flaky_route(request):
+        if request["params"]["page"] in limited:
+            limited.clear()
+            return 429, {}, {}
+        return route(request)
+
+    server.routes["/discover/movie"] = flaky_route
+    assert len(list(GET_pages(f"{server.url}/discover/movie", {}))) == 6
+
+
+def test_retry_delay_grows_exponentially(limiter):
+    limiter.backoff = 1.0
+    delays = [limiter.retry_delay({}, attempt) for attempt in range(4)]
+    for attempt, delay in enumerate(delays):
+        assert 2 ** attempt <= delay <= 2 ** attempt + 1
+
+
+def test_configure_rate_limit(monkeypatch, limiter):
+    _requests.configure_rate_limit(10, 2, retries=1, backoff=0.5)
+    assert (limiter.rate, limiter.burst) == (10, 2)
+    assert (limiter.retries, limiter.backoff) == (1, 0.5)
+    _requests.configure_rate_limit(None)
+    assert limiter.reserve() == 0
@@ -1,4 +1,4 @@
-import inspect
+from collections.abc import Generator
 from itertools import islice
 
 import pytest
@@ -14,27 +14,27 @@ def test_get_latest():
 
 def test_get_popular():
     shows = isle.show.get_popular()
-    assert inspect.isgenerator(shows)
+    assert isinstance(shows, Generator)
     show = next(shows)
     assert isinstance(show, Show)
 
 
 def test_get_top_rated():
     shows = isle.show.get_top_rated()
-    assert inspect.isgenerator(shows)
+    assert isinstance(shows, Generator)
     show = next(shows)
     assert isinstance(show, Show)
 
 
 def test_get_airing_today():
     shows = isle.show.get_airing_today()
-    assert inspect.isgenerator(shows)
+    assert isinstance(shows, Generator)
     show = next(shows)
     assert isinstance(show, Show)
 
 
 def test_get_on_the_air():
     shows = isle.show.get_on_the_air()
-    assert inspect.isgenerator(shows)
+    assert isinstance(shows, Generator)
     show = next(shows)
     assert isinstance(show, Show)
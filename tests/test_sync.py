@@ -0,0 +1,97 @@
+import datetime
+import json
+
+import pytest
+
+import isle
+from isle import _requests, objects
+from isle import _urls as URL
+
+
+DAY = datetime.date(2026, 10, 1)
+
+
+@pytest.fixture
+def feeds(monkeypatch):
+    feeds = {URL.MOVIE_CHANGE_LIST: [], URL.SHOW_CHANGE_LIST: []}
+    requests = []
+
+    def GET_pages(url, params, prefetch=0):
+        requests.append((url, params["start_date"], params["end_date"]))
+        return iter([{"id": i, "adult": False} for i in feeds[url]])
+
+    def GET(url, **params):
+        tmdb_id = int(url.rsplit("/", 1)[-1])
+        if tmdb_id == 404:
+            raise ValueError("not found")
+        return {"id": tmdb_id, "title": "Updated"}
+
+    monkeypatch.setattr(_requests, "GET_pages", GET_pages)
+    monkeypatch.setattr(objects, "GET", GET)
+    feeds["requests"] = requests
+    return feeds
+
+
+def test_changed_objects_are_loaded_again(feeds, tmp_path):
+    feeds[URL.MOVIE_CHANGE_LIST] = [1, 2, 1, 404]
+    sync = isle.Sync(tmp_path / "sync.json", kinds=["movie"])
+    results = list(sync.run(since=DAY, until=DAY + datetime.timedelta(1)))
+    results.sort(key=lambda result: result[0].tmdb_id)
+    assert [obj for obj, _ in results] == [
+        isle.Movie(1),
+        isle.Movie(2),
+        isle.Movie(404),
+    ]
+    assert results[0][0].data["title"] == "Updated"
+    assert results[0][1] is None and type(results[2][1]) is ValueError
+    assert sync.checkpoint == {"movie": DAY + datetime.timedelta(1)}
+
+
+def test_windows_and_checkpoint(feeds, tmp_path):
+    path = tmp_path / "sync.json"
+    path.write_text(json.dumps({"movie": "2026-10-01"}))
+    sync = isle.Sync(path, kinds=["movie", "tv"])
+    until = datetime.date(2026, 10, 20)
+    assert list(sync.run(until=until)) == []
+    assert feeds["requests"] == [
+        (URL.MOVIE_CHANGE_LIST, "2026-10-01", "2026-10-15"),
+        (URL.MOVIE_CHANGE_LIST, "2026-10-15", "2026-10-20"),
+        (URL.SHOW_CHANGE_LIST, "2026-10-19", "2026-10-20"),
+    ]
+    assert sync.checkpoint == {"movie": until, "tv": until}
+
+
+def test_stopping_early_keeps_the_checkpoint(feeds, tmp_path):
+    feeds[URL.MOVIE_CHANGE_LIST] = [1, 2]
+    sync = isle.Sync(tmp_path / "sync.json", kinds=["movie"])
+    run = sync.run(since=DAY, until=DAY)
+    next(run)
+    run.close()
+    assert sync.checkpoint == {}
+
+
+def test_objects_are_loaded_a_few_at_a_time(feeds, tmp_path, monkeypatch):
+    loaded = []
+    monkeypatch.setattr(objects, "GET", lambda url, **p: loaded.append(url))
+    feeds[URL.MOVIE_CHANGE_LIST] = list(range(1000))
+    sync = isle.Sync(tmp_path / "sync.json", kinds=["movie"], workers=2)
+    run = sync.run(since=DAY, until=DAY)
+    next(run)
+    assert len(loaded) <= 8
+    run.close()
+
+
+def test_cached_responses_are_dropped(feeds, tmp_path, monkeypatch):
+    cache = isle.MemoryCache()
+    monkeypatch.setattr(_requests, "_cache", cache)
+    movie_url = URL.MOVIE_DETAILS.format(movie_id=1)
+    cache.set(f"{movie_url}/credits", b"{}", 60)
+    cache.set(URL.MOVIE_DETAILS.format(movie_id=2), b"{}", 60)
+    feeds[URL.MOVIE_CHANGE_LIST] = [1]
+    list(isle.Sync(tmp_path / "sync.json", kinds=["movie"]).run(until=DAY))
+    assert len(cache) == 1
+
+
+def test_unknown_feed(tmp_path):
+    with pytest.raises(ValueError):
+        isle.Sync(tmp_path / "sync.json", kinds=["collection"])